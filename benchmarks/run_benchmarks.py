@@ -0,0 +1,261 @@
+"""
+Headless benchmarks of the pipeline's filesystem-bound helpers, run without Blender:
+
+    python benchmarks/run_benchmarks.py --tasks 4 --assets 50 --versions 10 --frames 100
+    python benchmarks/run_benchmarks.py --json results.json
+    python benchmarks/run_benchmarks.py --compare baseline.json --threshold 1.25
+
+Each benchmark reports its median/min latency and the Python-level filesystem calls it makes per run.
+With --compare, the run fails (exit code 1) when a benchmark's median is slower than the baseline
+by more than the threshold factor.
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import builtins
+import tempfile
+import statistics
+from collections import Counter
+
+_this_dir = os.path.dirname(os.path.abspath(__file__))
+_scripts_dir = os.path.join(os.path.dirname(_this_dir), "scripts")
+for path in (_this_dir, _scripts_dir):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import stub_bpy
+bpy = stub_bpy.install()
+
+import synthetic_project
+import stub_pipeline_server
+import asset_index
+import connection
+import versioning
+import panel_state
+import utils
+
+# Filesystem entry points counted while a benchmark runs (os.path helpers go through these too)
+COUNTED_OS_CALLS = (
+    "stat", "lstat", "listdir", "scandir", "readlink", "mkdir", "makedirs",
+    "rename", "replace", "remove", "unlink", "rmdir", "symlink", "link", "utime",
+)
+
+
+class FsCallCounter:
+    """Counts calls to os filesystem functions and open() while active."""
+
+    def __init__(self):
+        self.counts = Counter()
+        self._originals = {}
+
+    def _wrap(self, name, func):
+        def counted(*args, **kwargs):
+            self.counts[name] += 1
+            return func(*args, **kwargs)
+        return counted
+
+    def __enter__(self):
+        for name in COUNTED_OS_CALLS:
+            func = getattr(os, name)
+            self._originals[("os", name)] = func
+            setattr(os, name, self._wrap(name, func))
+        self._originals[("builtins", "open")] = builtins.open
+        builtins.open = self._wrap("open", builtins.open)
+        return self
+
+    def __exit__(self, *exc):
+        for (module_name, name), func in self._originals.items():
+            setattr(os if module_name == "os" else builtins, name, func)
+        self._originals.clear()
+
+
+def run_benchmark(name, func, repeat, setup=None):
+    timings = []
+    counts = Counter()
+    for _ in range(repeat):
+        if setup:
+            setup()
+        counter = FsCallCounter()
+        with counter:
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+        counts.update(counter.counts)
+    return {
+        "name": name,
+        "runs": repeat,
+        "median_ms": round(statistics.median(timings) * 1000.0, 4),
+        "min_ms": round(min(timings) * 1000.0, 4),
+        "fs_calls": round(sum(counts.values()) / repeat, 1),
+        "fs_calls_by_type": {k: round(v / repeat, 1) for k, v in counts.most_common()},
+    }
+
+
+def build_benchmarks(sandbox_dir, task_paths, assets, scratch_dir):
+    task_path = task_paths[0]
+    os.environ["ST_CWD"] = task_path
+    asset_dirs = [os.path.join(task_path, "versions", synthetic_project.asset_name(i)) for i in range(assets)]
+    published_blends = [os.path.join(task_path, "published", synthetic_project.asset_name(i), "scene.blend") for i in range(assets)]
+    bpy.data.libraries = [stub_bpy.StubLibrary(f"lib_{i}", path) for i, path in enumerate(published_blends)]
+
+    def reset_index():
+        asset_index._indexes.clear()
+        asset_index._items.clear()
+        try:
+            os.remove(asset_index.get_index_path(sandbox_dir))
+        except OSError:
+            pass
+
+    def forget_version_listings():
+        versioning.invalidate()
+
+    def resolve_all():
+        for asset_dir in asset_dirs:
+            utils.resolve_blend_path(asset_dir)
+
+    def render_versions():
+        for render_type in ("exr", "playblast"):
+            utils.get_render_version_and_paths(task_path, "render", render_type, create_dirs=False)
+
+    metadata = {
+        "type": "usd_publish",
+        "application": "blender",
+        "source_scene": os.path.join(task_path, "wip", "blender", "scene_v001.blend"),
+        "date": "2026-01-01 00:00:00",
+        "exported_root_objects": [f"object_{i:04d}" for i in range(200)],
+    }
+    yaml_path = os.path.join(scratch_dir, "metadata.yaml")
+
+    return [
+        ("published_assets_cold", lambda: (utils.refresh_published_assets(), utils.get_published_assets(None, None)), reset_index),
+        ("published_assets_refresh", utils.refresh_published_assets, None),
+        ("published_assets_enum", lambda: utils.get_published_assets(None, None), None),
+        ("resolve_blend_path_cold", resolve_all, forget_version_listings),
+        ("resolve_blend_path_warm", resolve_all, None),
+        ("resolve_blend_paths_batch", lambda: utils.resolve_blend_paths(asset_dirs + asset_dirs), None),
+        ("render_version_paths_cold", render_versions, forget_version_listings),
+        ("render_version_paths_warm", render_versions, None),
+        ("hud_scan_cold", panel_state.refresh, forget_version_listings),
+        ("hud_scan_warm", panel_state.refresh, None),
+        ("write_simple_yaml", lambda: utils.write_simple_yaml(yaml_path, metadata), None),
+    ]
+
+
+def build_connection_benchmarks(scratch_dir):
+    """
+    Command delivery latency, from the server sending a command to it being queued for Blender's
+    main thread, over the socket push channel and the HTTP long-poll fallback.
+    Returns the benchmarks and a cleanup callable.
+    """
+    server = stub_pipeline_server.StubPipelineServer(os.path.join(scratch_dir, "pipeline.sock"), http_port=0).start()
+    connection.SERVER_PORT = server.http_port
+    workers = []
+
+    def start_worker(socket_path):
+        for worker in workers:
+            worker.stop()
+        worker = connection.WebConnectionWorker("bench_task")
+        worker.socket_path = socket_path
+        worker.start()
+        workers.append(worker)
+
+    def deliver():
+        server.push("noop", "bench")
+        connection._command_queue.get(timeout=5.0)
+
+    def use_socket():
+        if not workers or workers[-1].transport != "socket":
+            start_worker(server.socket_path)
+            server.wait_for_sessions(1)
+
+    def use_http():
+        if not workers or workers[-1].socket_path is not None:
+            start_worker(None)
+            while workers[-1].transport != "http":
+                time.sleep(0.01)
+            server.wait_for_sessions(0)
+
+    def cleanup():
+        for worker in workers:
+            worker.stop()
+        server.stop()
+
+    return [
+        ("web_command_socket", deliver, use_socket),
+        ("web_command_http", deliver, use_http),
+    ], cleanup
+
+
+def print_results(results, baseline=None):
+    print(f"{'benchmark':<28} {'median ms':>10} {'min ms':>10} {'fs calls':>9}  {'vs baseline':>11}")
+    for r in results:
+        line = f"{r['name']:<28} {r['median_ms']:>10.3f} {r['min_ms']:>10.3f} {r['fs_calls']:>9.1f}"
+        base = (baseline or {}).get(r["name"])
+        if base and base["median_ms"] > 0:
+            line += f"  {r['median_ms'] / base['median_ms']:>10.2f}x"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Studio Tools filesystem helpers on a synthetic sandbox.")
+    parser.add_argument("--tasks", type=int, default=4)
+    parser.add_argument("--assets", type=int, default=10, help="Published assets per task")
+    parser.add_argument("--versions", type=int, default=5, help="Versions per asset and render")
+    parser.add_argument("--frames", type=int, default=24, help="Frames per render version")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--sandbox", help="Generate into (or reuse) this folder instead of a temporary one")
+    parser.add_argument("--json", help="Write results to this file")
+    parser.add_argument("--compare", help="Baseline results file written by --json")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Allowed median slowdown factor against the baseline")
+    args = parser.parse_args(argv)
+
+    temp_dir = None if args.sandbox else tempfile.mkdtemp(prefix="studiotools_bench_")
+    sandbox_dir = args.sandbox or temp_dir
+    try:
+        if args.sandbox and os.path.isdir(os.path.join(sandbox_dir, "shots")):
+            task_paths = [os.path.join(sandbox_dir, "shots", d) for d in sorted(os.listdir(os.path.join(sandbox_dir, "shots")))]
+        else:
+            started = time.perf_counter()
+            task_paths = synthetic_project.generate(sandbox_dir, args.tasks, args.assets, args.versions, args.frames)
+            print(f"Generated {args.tasks} tasks x {args.assets} assets x {args.versions} versions x {args.frames} frames "
+                  f"in {time.perf_counter() - started:.1f} s: {sandbox_dir}")
+
+        scratch_dir = tempfile.mkdtemp(prefix="studiotools_bench_scratch_")
+        try:
+            results = [run_benchmark(name, func, args.repeat, setup)
+                       for name, func, setup in build_benchmarks(sandbox_dir, task_paths, args.assets, scratch_dir)]
+            connection_benchmarks, cleanup = build_connection_benchmarks(scratch_dir)
+            try:
+                results += [run_benchmark(name, func, args.repeat, setup) for name, func, setup in connection_benchmarks]
+            finally:
+                cleanup()
+        finally:
+            shutil.rmtree(scratch_dir, ignore_errors=True)
+    finally:
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = {r["name"]: r for r in json.load(f)["results"]}
+    print_results(results, baseline)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"scale": vars(args), "results": results}, f, indent=2)
+
+    if baseline:
+        regressions = [r["name"] for r in results
+                       if r["name"] in baseline and r["median_ms"] > baseline[r["name"]]["median_ms"] * args.threshold]
+        if regressions:
+            print(f"Regressions over {args.threshold:.2f}x: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
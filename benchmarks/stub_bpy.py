@@ -0,0 +1,57 @@
+"""
+Minimal stand-in for Blender's bpy module, so the pipeline modules in scripts/ can be imported and
+benchmarked by a plain Python interpreter. Only what the benchmarked code paths touch is provided.
+"""
+import sys
+from types import ModuleType, SimpleNamespace
+
+
+class StubLibrary(dict):
+    """A linked library: ID properties are read with .get() like on a real bpy.types.Library."""
+
+    def __init__(self, name, filepath, direct=True):
+        super().__init__(studiotools_direct=direct)
+        self.name = name
+        self.filepath = filepath
+
+
+def install(render_name="render"):
+    """Installs the stub as the bpy module and returns it. Must run before importing scripts/ modules."""
+    if "bpy" in sys.modules and getattr(sys.modules["bpy"], "IS_STUB", False):
+        return sys.modules["bpy"]
+
+    bpy = ModuleType("bpy")
+    bpy.IS_STUB = True
+
+    bpy.types = ModuleType("bpy.types")
+    for name in ("Operator", "Panel", "Scene", "Object", "Material", "Library"):
+        setattr(bpy.types, name, type(name, (), {}))
+
+    bpy.props = ModuleType("bpy.props")
+    for name in ("StringProperty", "BoolProperty", "IntProperty", "FloatProperty", "EnumProperty"):
+        setattr(bpy.props, name, lambda **kwargs: None)
+
+    bpy.app = SimpleNamespace(
+        version=(4, 2, 0),
+        version_string="4.2.0 (stub)",
+        binary_path=sys.executable,
+        background=True,
+        handlers=SimpleNamespace(load_post=[], save_post=[], depsgraph_update_post=[]),
+        timers=SimpleNamespace(
+            register=lambda *args, **kwargs: None,
+            unregister=lambda *args, **kwargs: None,
+            is_registered=lambda *args, **kwargs: False,
+        ),
+    )
+    bpy.path = SimpleNamespace(abspath=lambda path: path)
+    bpy.utils = SimpleNamespace(user_resource=lambda resource_type, path="": path)
+    bpy.data = SimpleNamespace(filepath="", libraries=[], objects=[], materials=[])
+    bpy.context = SimpleNamespace(
+        scene=SimpleNamespace(studiotools_render_name=render_name, objects=[]),
+        window_manager=None,
+    )
+
+    sys.modules["bpy"] = bpy
+    sys.modules["bpy.types"] = bpy.types
+    sys.modules["bpy.props"] = bpy.props
+    return bpy
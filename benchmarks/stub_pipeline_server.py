@@ -0,0 +1,229 @@
+"""
+Local stand-in for the pipeline server's session channels, for exercising connection.py without the real server:
+
+    python benchmarks/stub_pipeline_server.py --socket "$XDG_RUNTIME_DIR/studiotools_pipeline.sock" --port 8000
+
+Sessions connect over the Unix domain socket (push, newline-delimited JSON) or long-poll
+GET /api/sessions/poll over HTTP, and report command progress back on the socket or with
+POST /api/sessions/progress. Each line typed on stdin is pushed as a command:
+
+    load_usd /path/to/stage.usd [task_path]
+"""
+import os
+import sys
+import json
+import socket
+import argparse
+import threading
+import socketserver
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+POLL_PATH = "/api/sessions/poll"
+PROGRESS_PATH = "/api/sessions/progress"
+MAX_POLL_WAIT = 30.0
+
+
+class _SocketSessionHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        server = self.server.pipeline
+        try:
+            hello = json.loads(self.rfile.readline().decode() or "{}")
+        except ValueError:
+            return
+        session = {"task_path": hello.get("taskPath"), "app_type": hello.get("appType"), "sock": self.request}
+        server._add_session(session)
+        try:
+            # After the hello, sessions only send progress reports; an empty read means they disconnected
+            for line in self.rfile:
+                if line.strip():
+                    server._add_progress(json.loads(line.decode()))
+        except (OSError, ValueError):
+            pass
+        finally:
+            server._remove_session(session)
+
+
+class _PollHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        url = urllib.parse.urlparse(self.path)
+        if url.path != POLL_PATH:
+            self.send_error(404)
+            return
+        query = urllib.parse.parse_qs(url.query)
+        task_path = query.get("taskPath", [None])[0]
+        wait = min(float(query.get("wait", ["0"])[0]), MAX_POLL_WAIT)
+        body = json.dumps({"commands": self.server.pipeline._take_pending(task_path, wait)}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        if urllib.parse.urlparse(self.path).path != PROGRESS_PATH:
+            self.send_error(404)
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            self.server.pipeline._add_progress(json.loads(self.rfile.read(length).decode()))
+        except ValueError:
+            self.send_error(400)
+            return
+        self.send_response(204)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class StubPipelineServer:
+    """
+    Pushes commands to connected socket sessions, or holds them for the next HTTP poll when no
+    session of the target task is connected. task_path=None addresses every session.
+    """
+
+    def __init__(self, socket_path=None, http_port=None, host="localhost"):
+        self.socket_path = socket_path
+        self.http_port = http_port
+        self.host = host
+        self._sessions = []
+        self._pending = []
+        self.progress = []
+        self.on_progress = None
+        self._cond = threading.Condition()
+        self._servers = []
+
+    @property
+    def sessions(self):
+        with self._cond:
+            return [dict(task_path=s["task_path"], app_type=s["app_type"]) for s in self._sessions]
+
+    def start(self):
+        if self.socket_path:
+            # Sessions only trust a socket in a folder owned by their user
+            os.makedirs(os.path.dirname(os.path.abspath(self.socket_path)), mode=0o700, exist_ok=True)
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+            self._servers.append(_UnixServer(self.socket_path, _SocketSessionHandler))
+        if self.http_port is not None:
+            http_server = ThreadingHTTPServer((self.host, self.http_port), _PollHandler)
+            http_server.daemon_threads = True
+            self.http_port = http_server.server_address[1]
+            self._servers.append(http_server)
+        for server in self._servers:
+            server.pipeline = self
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        for server in self._servers:
+            server.shutdown()
+            server.server_close()
+        self._servers = []
+        with self._cond:
+            for session in self._sessions:
+                try:
+                    session["sock"].shutdown(socket.SHUT_RDWR)
+                    session["sock"].close()
+                except OSError:
+                    pass
+            self._sessions = []
+            self._cond.notify_all()
+        if self.socket_path and os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+    def wait_for_sessions(self, count=1, timeout=5.0):
+        """Waits until exactly `count` socket sessions are connected. Returns False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: len(self._sessions) == count, timeout)
+
+    def push(self, command, argument=None, task_path=None):
+        """Sends a command to the matching sessions. Returns how many socket sessions received it."""
+        cmd = {"command": command, "argument": argument}
+        line = (json.dumps(cmd) + "\n").encode()
+        delivered = 0
+        with self._cond:
+            for session in list(self._sessions):
+                if task_path is not None and session["task_path"] != task_path:
+                    continue
+                try:
+                    session["sock"].sendall(line)
+                    delivered += 1
+                except OSError:
+                    self._sessions.remove(session)
+            if not delivered:
+                self._pending.append((task_path, cmd))
+                self._cond.notify_all()
+        return delivered
+
+    def _add_session(self, session):
+        with self._cond:
+            self._sessions.append(session)
+            self._cond.notify_all()
+
+    def _add_progress(self, event):
+        with self._cond:
+            self.progress.append(event)
+            self._cond.notify_all()
+        if self.on_progress:
+            self.on_progress(event)
+
+    def wait_for_progress(self, count, timeout=5.0):
+        """Waits until `count` progress events have been received. Returns False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: len(self.progress) >= count, timeout)
+
+    def _remove_session(self, session):
+        with self._cond:
+            if session in self._sessions:
+                self._sessions.remove(session)
+
+    def _take_pending(self, task_path, wait):
+        def matching():
+            return [entry for entry in self._pending if entry[0] is None or entry[0] == task_path]
+
+        with self._cond:
+            self._cond.wait_for(lambda: matching() or not self._servers, wait)
+            taken = matching()
+            self._pending = [entry for entry in self._pending if entry not in taken]
+            return [cmd for _, cmd in taken]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stand-in pipeline server pushing commands to Studio Tools sessions.")
+    parser.add_argument("--socket", help="Unix domain socket to listen on")
+    parser.add_argument("--port", type=int, help="HTTP port serving long-polls")
+    args = parser.parse_args(argv)
+    if not args.socket and args.port is None:
+        parser.error("Give --socket, --port or both")
+
+    server = StubPipelineServer(args.socket, args.port)
+    server.on_progress = lambda e: print(f"{e.get('taskPath')}: {e.get('command')} {e.get('argument')} "
+                                         f"{e.get('status')} ({e.get('completed')}/{e.get('total')})")
+    server.start()
+    print(f"Listening on {args.socket or '-'} / port {server.http_port if args.port is not None else '-'}. "
+          "Type '<command> <argument> [task_path]' to push.")
+    try:
+        for line in sys.stdin:
+            parts = line.split()
+            if not parts:
+                continue
+            delivered = server.push(parts[0], parts[1] if len(parts) > 1 else None, parts[2] if len(parts) > 2 else None)
+            print(f"Pushed to {delivered} socket sessions" if delivered else "Queued for the next poll")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+Generates synthetic sandboxes shaped like real Studio Tools projects:
+
+    <sandbox>/shots/task_000/
+        versions/asset_000/v001/{stage.usd, scene.blend, metadata.yaml}
+        versions/render/v001/render_v001_0001.exr ...
+        versions/render_playblast/v001/render_playblast_v001_0001.jpg ...
+        published/asset_000 -> ../versions/asset_000/v00N
+        wip/blender/scene_v001.blend ...
+"""
+import os
+import time
+
+# Generated folders are back-dated so mtime-keyed caches treat them as settled, as on a real project
+SETTLED_AGE_SECONDS = 3600
+
+
+def _touch(path, content=b""):
+    with open(path, "wb") as f:
+        f.write(content)
+
+
+def _write_version(version_dir, asset_name, version):
+    os.makedirs(version_dir, exist_ok=True)
+    _touch(os.path.join(version_dir, "stage.usd"), b"#usda 1.0\n")
+    _touch(os.path.join(version_dir, "scene.blend"), b"BLENDER-v402")
+    metadata = (
+        'type: "usd_publish"\n'
+        'application: "blender"\n'
+        f'source_file: "scene_v{version:03d}.blend"\n'
+        'exported_root_objects:\n'
+        f'  - "{asset_name}"\n'
+    )
+    _touch(os.path.join(version_dir, "metadata.yaml"), metadata.encode("utf-8"))
+
+
+def _write_render(versions_dir, folder_name, file_prefix, ext, versions, frames):
+    for version in range(1, versions + 1):
+        version_dir = os.path.join(versions_dir, folder_name, f"v{version:03d}")
+        os.makedirs(version_dir, exist_ok=True)
+        for frame in range(1, frames + 1):
+            _touch(os.path.join(version_dir, f"{file_prefix}_v{version:03d}_{frame:04d}.{ext}"))
+
+
+def task_path(sandbox_dir, task):
+    return os.path.join(sandbox_dir, "shots", f"task_{task:03d}")
+
+
+def asset_name(asset):
+    return f"asset_{asset:03d}"
+
+
+def generate(sandbox_dir, tasks=4, assets=10, versions=5, frames=24, render_name="render"):
+    """Creates the sandbox tree and returns the task paths."""
+    task_paths = []
+    for task in range(tasks):
+        path = task_path(sandbox_dir, task)
+        versions_dir = os.path.join(path, "versions")
+        published_dir = os.path.join(path, "published")
+        wip_dir = os.path.join(path, "wip", "blender")
+        os.makedirs(published_dir, exist_ok=True)
+        os.makedirs(wip_dir, exist_ok=True)
+
+        for asset in range(assets):
+            name = asset_name(asset)
+            for version in range(1, versions + 1):
+                _write_version(os.path.join(versions_dir, name, f"v{version:03d}"), name, version)
+            os.symlink(os.path.join("..", "versions", name, f"v{versions:03d}"), os.path.join(published_dir, name))
+
+        _write_render(versions_dir, render_name, render_name, "exr", versions, frames)
+        _write_render(versions_dir, f"{render_name}_playblast", f"{render_name}_playblast", "jpg", versions, frames)
+        for version in range(1, versions + 1):
+            _touch(os.path.join(wip_dir, f"scene_v{version:03d}.blend"))
+        task_paths.append(path)
+
+    settled = time.time() - SETTLED_AGE_SECONDS
+    for root, dirs, files in os.walk(sandbox_dir):
+        os.utime(root, (settled, settled))
+    return task_paths
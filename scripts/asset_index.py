@@ -0,0 +1,258 @@
+import os
+import json
+import time
+import threading
+
+import versioning
+
+# The index lives inside the sandbox so every session working on the project shares it.
+INDEX_DIR_NAME = ".studiotools"
+INDEX_FILE_NAME = "published_index.json"
+INDEX_FORMAT = 1
+USD_EXTENSIONS = (".usd", ".usda", ".usdc")
+# Recorded instead of the mtime of a directory listed within versioning.MTIME_SETTLE_SECONDS of its
+# last change, so the next refresh lists it again
+UNSETTLED_MTIME = -1
+
+# In-memory copies of the index, keyed by sandbox directory
+_indexes = {}
+# Enum items handed to Blender, keyed by sandbox directory. Blender requires a Python
+# reference to be kept on strings returned by EnumProperty item callbacks.
+_items = {}
+# Bumped every time an index is swapped in, so background results computed from an older index are dropped
+_generations = {}
+# Background refreshes: running threads and finished results waiting to be swapped in on the main thread
+_threads = {}
+_results = {}
+_results_lock = threading.Lock()
+# Sandboxes asked to refresh while a scan of theirs was running; rescanned once it is collected
+_pending = set()
+
+
+def get_index_path(sandbox_dir):
+    return os.path.join(sandbox_dir, INDEX_DIR_NAME, INDEX_FILE_NAME)
+
+
+def _empty_index():
+    return {"format": INDEX_FORMAT, "dirs": {}, "assets": {}}
+
+
+def _load_index(sandbox_dir):
+    """Reads the on-disk index, returning None if it is missing or unreadable."""
+    try:
+        with open(get_index_path(sandbox_dir), "r", encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("format") != INDEX_FORMAT:
+            return None
+        return index
+    except (OSError, ValueError):
+        return None
+
+
+def _save_index(sandbox_dir, index):
+    """Writes the index atomically so concurrent readers never see a partial file."""
+    index_path = get_index_path(sandbox_dir)
+    try:
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        tmp_path = f"{index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, separators=(",", ":"))
+        os.replace(tmp_path, index_path)
+    except OSError as e:
+        print(f"[Studio Tools] Warning: Failed to write published asset index: {e}")
+
+
+def _scan_dir(sandbox_dir, rel_dir, index):
+    """
+    Lists a single directory, recording its mtime (once settled) and any published USD files it holds.
+    Returns the relative paths of the real (non-symlinked) subdirectories found.
+    """
+    full_dir = os.path.join(sandbox_dir, rel_dir) if rel_dir else sandbox_dir
+    subdirs = []
+    try:
+        dir_mtime = os.stat(full_dir).st_mtime_ns
+        is_published = os.path.basename(full_dir) == "published"
+        with os.scandir(full_dir) as it:
+            for entry in it:
+                # Matches os.walk: symlinked folders count as folders but are not descended into
+                if entry.is_dir():
+                    if not entry.is_symlink() and entry.name != INDEX_DIR_NAME:
+                        subdirs.append(os.path.join(rel_dir, entry.name) if rel_dir else entry.name)
+                elif is_published and entry.name.lower().endswith(USD_EXTENSIONS):
+                    try:
+                        file_mtime = entry.stat().st_mtime
+                    except OSError:
+                        file_mtime = 0
+                    rel_file = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+                    index["assets"][rel_file] = file_mtime
+    except OSError:
+        return None
+    # A change landing in the same mtime tick as this listing would leave the mtime as recorded
+    settled = time.time() - dir_mtime / 1e9 > versioning.MTIME_SETTLE_SECONDS
+    index["dirs"][rel_dir] = dir_mtime if settled else UNSETTLED_MTIME
+    return subdirs
+
+
+def _scan_tree(sandbox_dir, rel_dir, index):
+    """Recursively scans a directory and everything below it."""
+    stack = [rel_dir]
+    while stack:
+        subdirs = _scan_dir(sandbox_dir, stack.pop(), index)
+        if subdirs:
+            stack.extend(subdirs)
+
+
+def _forget_dir(index, rel_dir, recursive):
+    """Drops a directory's assets (and optionally its subdirectories) from the index."""
+    prefix = rel_dir + os.sep if rel_dir else ""
+    for rel_file in [p for p in index["assets"] if os.path.dirname(p) == rel_dir or (recursive and p.startswith(prefix))]:
+        del index["assets"][rel_file]
+    if recursive:
+        for d in [d for d in index["dirs"] if d == rel_dir or d.startswith(prefix)]:
+            del index["dirs"][d]
+
+
+def _update_index(sandbox_dir, index):
+    """
+    Brings the index up to date by re-listing only directories whose mtime changed.
+    Returns True if anything in the index changed.
+    """
+    changed = False
+    for rel_dir in sorted(index["dirs"]):
+        if rel_dir not in index["dirs"]:
+            continue  # Already dropped along with a removed parent
+        full_dir = os.path.join(sandbox_dir, rel_dir) if rel_dir else sandbox_dir
+        try:
+            mtime = os.stat(full_dir).st_mtime_ns
+        except OSError:
+            _forget_dir(index, rel_dir, recursive=True)
+            changed = True
+            continue
+        if mtime == index["dirs"][rel_dir]:
+            continue
+
+        # Directory contents changed: re-list it and walk any folders that are new to us
+        changed = True
+        _forget_dir(index, rel_dir, recursive=False)
+        for subdir in _scan_dir(sandbox_dir, rel_dir, index) or []:
+            if subdir not in index["dirs"]:
+                _scan_tree(sandbox_dir, subdir, index)
+    return changed
+
+
+def _build_items(sandbox_dir, index):
+    items = []
+    for rel_path, mtime in index["assets"].items():
+        full_path = os.path.abspath(os.path.join(sandbox_dir, rel_path))
+        items.append((full_path, rel_path, f"Version: {os.path.basename(rel_path)}"))
+    # Sort assets by relative path for consistent logical view
+    items.sort(key=lambda x: x[1])
+    return items
+
+
+def _copy_index(index):
+    return {"format": index["format"], "dirs": dict(index["dirs"]), "assets": dict(index["assets"])}
+
+
+def _compute_refresh(sandbox_dir, base_index):
+    """
+    Brings a copy of base_index up to date with the disk (a full scan when there is none) and saves it.
+    Returns (index, items), items being None when nothing changed. Touches no shared state.
+    """
+    index = _copy_index(base_index) if base_index is not None else _load_index(sandbox_dir)
+    if index is None:
+        index = _empty_index()
+        _scan_tree(sandbox_dir, "", index)
+        changed = True
+    else:
+        changed = _update_index(sandbox_dir, index)
+    if changed:
+        _save_index(sandbox_dir, index)
+    return index, (_build_items(sandbox_dir, index) if changed else None)
+
+
+def _apply_refresh(sandbox_dir, index, items):
+    if items is not None or sandbox_dir not in _items:
+        _items[sandbox_dir] = items if items is not None else _build_items(sandbox_dir, index)
+    _indexes[sandbox_dir] = index
+    _generations[sandbox_dir] = _generations.get(sandbox_dir, 0) + 1
+    return _items[sandbox_dir]
+
+
+def refresh(sandbox_dir):
+    """
+    Incrementally refreshes the published asset index of a sandbox and its in-memory copy.
+    Performs a full scan only when no index exists yet.
+    """
+    if not os.path.isdir(sandbox_dir):
+        return []
+    return _apply_refresh(sandbox_dir, *_compute_refresh(sandbox_dir, _indexes.get(sandbox_dir)))
+
+
+def refresh_in_background(sandbox_dir):
+    """
+    Starts an incremental refresh of a sandbox's index on a worker thread; its result is swapped in by
+    collect_background_refresh(). Returns False if a refresh of that sandbox is already running; it
+    may have listed its folders before the change being refreshed for, so another one follows it.
+    """
+    thread = _threads.get(sandbox_dir)
+    if thread is not None and thread.is_alive():
+        _pending.add(sandbox_dir)
+        return False
+    _pending.discard(sandbox_dir)
+    base_index = _indexes.get(sandbox_dir)
+    generation = _generations.get(sandbox_dir, 0)
+
+    def work():
+        try:
+            if not os.path.isdir(sandbox_dir):
+                return
+            result = _compute_refresh(sandbox_dir, base_index)
+        except Exception as e:
+            print(f"[Studio Tools] Warning: Failed to refresh published asset index: {e}")
+            return
+        with _results_lock:
+            _results[sandbox_dir] = (generation, result)
+
+    thread = threading.Thread(target=work, name="StudioToolsAssetIndex", daemon=True)
+    _threads[sandbox_dir] = thread
+    thread.start()
+    return True
+
+
+def background_refresh_running():
+    return any(thread.is_alive() for thread in _threads.values())
+
+
+def collect_background_refresh():
+    """
+    Swaps finished background refreshes into the in-memory index. Must run on the main thread.
+    Results computed from an index that was replaced meanwhile are dropped. Returns how many were collected.
+    """
+    with _results_lock:
+        results = list(_results.items())
+        _results.clear()
+    for sandbox_dir, (generation, (index, items)) in results:
+        if generation == _generations.get(sandbox_dir, 0):
+            _apply_refresh(sandbox_dir, index, items)
+    for sandbox_dir in list(_pending):
+        refresh_in_background(sandbox_dir)
+    return len(results)
+
+
+def get_items(sandbox_dir):
+    """
+    Returns the enum items of published assets from the in-memory index.
+    Falls back to the on-disk index (or a first full scan) only on first use.
+    """
+    items = _items.get(sandbox_dir)
+    if items is not None:
+        return items
+    index = _load_index(sandbox_dir)
+    if index is None:
+        return refresh(sandbox_dir)
+    return _apply_refresh(sandbox_dir, index, _build_items(sandbox_dir, index))
+
+
+def get_sandbox_dir(task_path):
+    return os.path.dirname(os.path.dirname(task_path))
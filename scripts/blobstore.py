@@ -0,0 +1,112 @@
+import os
+import sys
+import errno
+import hashlib
+
+# Blobs live next to the published asset index: <sandbox>/.studiotools/blobs/ab/abcdef...
+BLOBS_DIR_NAME = os.path.join(".studiotools", "blobs")
+HASH_CHUNK_SIZE = 1024 * 1024
+# Files of a publish that are stored content-addressed (metadata.yaml carries a date, so it never dedupes)
+PUBLISH_FILES = ("stage.usd", "scene.blend", "thumbnail.png")
+# Link errors meaning the filesystem cannot hardlink here (other device, or links not permitted)
+_NO_HARDLINK_ERRNOS = (errno.EXDEV, errno.EPERM)
+
+# ioctl request number of FICLONE on Linux (copy-on-write clone of a whole file)
+_FICLONE = 0x40049409
+
+
+def get_blobs_dir(sandbox_dir):
+    return os.path.join(sandbox_dir, BLOBS_DIR_NAME)
+
+
+def hash_file(path):
+    """Streams a file through SHA-256 without loading it into memory."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _reflink(src, dst):
+    """Creates dst as a copy-on-write clone of src where the filesystem supports it (Linux only)."""
+    if not sys.platform.startswith("linux"):
+        raise OSError("Reflinks are not supported on this platform")
+    import fcntl
+    # Exclusive create: an existing dst (e.g. a blob shared by earlier versions) must never be truncated
+    with open(src, "rb") as fsrc, open(dst, "xb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError:
+            fdst.close()
+            os.remove(dst)
+            raise
+
+
+def _share(src, dst):
+    """
+    Makes dst share src's content: a hardlink, else a reflink where hardlinks are unsupported.
+    Raises FileExistsError if dst exists, OSError if neither works.
+    """
+    try:
+        os.link(src, dst)
+    except OSError as e:
+        if e.errno not in _NO_HARDLINK_ERRNOS:
+            raise
+        _reflink(src, dst)
+
+
+def freeze(path):
+    # Shared content must never be modified in place, or every version using it would change
+    if os.name == "posix":
+        os.chmod(path, 0o444)
+
+
+def ingest(path, sandbox_dir):
+    """
+    Moves a file's content into the sandbox blob store, leaving a hardlink (or reflink) at its path.
+    If an identical blob already exists, the file is replaced by a link to it and its own copy freed.
+    Returns (digest, bytes_saved).
+    """
+    digest = hash_file(path)
+    blob_dir = os.path.join(get_blobs_dir(sandbox_dir), digest[:2])
+    blob_path = os.path.join(blob_dir, digest)
+    os.makedirs(blob_dir, exist_ok=True)
+
+    if not os.path.exists(blob_path):
+        try:
+            _share(path, blob_path)
+            freeze(blob_path)
+            return digest, 0
+        except FileExistsError:
+            pass  # Another publisher stored the same content meanwhile; link to theirs below
+
+    size = os.path.getsize(path)
+    if os.path.samefile(path, blob_path):
+        return digest, 0
+    tmp_path = f"{path}.{os.getpid()}.blobtmp"
+    _share(blob_path, tmp_path)
+    os.replace(tmp_path, path)
+    return digest, size
+
+
+def ingest_version(version_dir, sandbox_dir, names=PUBLISH_FILES):
+    """
+    Stores the files of a published version content-addressed. Files the filesystem cannot link are
+    left untouched. Returns {name: digest} and prints the space saved by deduplication.
+    """
+    digests = {}
+    saved = 0
+    for name in names:
+        path = os.path.join(version_dir, name)
+        if not os.path.isfile(path) or os.path.islink(path):
+            continue
+        try:
+            digests[name], bytes_saved = ingest(path, sandbox_dir)
+            saved += bytes_saved
+        except OSError as e:
+            print(f"[Studio Tools] Warning: Could not deduplicate {path}: {e}")
+    if saved:
+        print(f"[Studio Tools] Deduplicated {saved / (1024 * 1024):.1f} MB against earlier publishes")
+    return digests
+
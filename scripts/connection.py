@@ -1,4 +1,13 @@
 import os
+import json
+import queue
+import collections
+import socket
+import tempfile
+import threading
+import time
+import http.client
+import urllib.parse
 
 try:
     import bpy
@@ -6,28 +15,359 @@ try:
 except ImportError:
     IN_BLENDER = False
 
-def poll_web_connection():
+SERVER_HOST = "localhost"
+SERVER_PORT = 8000
+POLL_PATH = "/api/sessions/poll"
+PROGRESS_PATH = "/api/sessions/progress"
+# Local push channel: the server writes newline-delimited JSON commands to every connected session
+# The socket lives in the user's private runtime directory (or a per-user temp folder) and must be owned by
+# the user, so other local users cannot push commands into the session
+SOCKET_ENV_VAR = "ST_PIPELINE_SOCKET"
+SOCKET_NAME = "studiotools_pipeline.sock"
+# How often a blocked socket read wakes up to check for shutdown
+SOCKET_READ_TIMEOUT = 1.0
+# Minimum delay between two polls when the server answers immediately (no long-poll support)
+POLL_INTERVAL = 0.5
+# How long we ask the server to hold a poll open when it has nothing to send
+LONG_POLL_WAIT = 20.0
+# Back-off while the server is unreachable
+RETRY_INTERVAL = 2.0
+# How often the main-thread timer drains the command queue
+DRAIN_INTERVAL = 0.1
+# Main-thread time a timer tick may spend running commands before handing control back to the UI
+COMMAND_TICK_BUDGET = 0.05
+# Delay before the next tick while commands are still pending, so the UI gets to handle events in between
+BUSY_TICK_INTERVAL = 0.01
+
+# Commands parsed by the worker thread, consumed on Blender's main thread
+_command_queue = queue.Queue()
+_worker = None
+
+
+def get_socket_path():
+    """Path of the pipeline server's Unix domain socket, or None where Unix sockets are unsupported."""
+    if not hasattr(socket, "AF_UNIX") or not hasattr(os, "getuid"):
+        return None
+    if os.environ.get(SOCKET_ENV_VAR):
+        return os.environ[SOCKET_ENV_VAR]
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return os.path.join(os.environ["XDG_RUNTIME_DIR"], SOCKET_NAME)
+    return os.path.join(tempfile.gettempdir(), f"studiotools-{os.getuid()}", SOCKET_NAME)
+
+
+def is_trusted_socket(path):
+    """Whether the socket at path, and the folder holding it, belong to the current user."""
+    try:
+        uid = os.getuid()
+        return os.stat(path).st_uid == uid and os.stat(os.path.dirname(path) or ".").st_uid in (uid, 0)
+    except OSError:
+        return False
+
+
+class WebConnectionWorker(threading.Thread):
+    """
+    Background thread receiving commands from the pipeline server. Commands are pushed over the
+    server's Unix domain socket when it is listening; otherwise the thread long-polls over a
+    keep-alive HTTP connection, and switches back to the socket as soon as it appears.
+    """
+
+    def __init__(self, task_path):
+        super().__init__(name="StudioToolsWebConnection", daemon=True)
+        self.task_path = task_path
+        self.socket_path = get_socket_path()
+        self.transport = None
+        self._stop_event = threading.Event()
+        self._conn = None
+        self._sock = None
+        self._send_lock = threading.Lock()
+        self._outbox = queue.Queue()
+        self._warned_untrusted = False
+
+    def report(self, event):
+        """Queues a progress event for the sender thread. Never blocks the caller (Blender's main thread)."""
+        self._outbox.put(dict(event, type="progress", appType="blender", taskPath=self.task_path))
+
+    def _send_progress(self):
+        """Sender thread: delivers queued progress events over the socket when connected, else by HTTP POST."""
+        while not self._stop_event.is_set():
+            try:
+                message = self._outbox.get(timeout=SOCKET_READ_TIMEOUT)
+            except queue.Empty:
+                continue
+            if not self._send_on_socket(message):
+                self._post_progress(message)
+
+    def _send_on_socket(self, message):
+        with self._send_lock:
+            sock = self._sock
+            if sock is None:
+                return False
+            try:
+                sock.sendall((json.dumps(message) + "\n").encode())
+                return True
+            except OSError:
+                # Part of the line may have gone out and would corrupt the stream: drop the connection
+                # (the listener sees it closed and reconnects) and deliver this event over HTTP instead
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+                return False
+
+    def _post_progress(self, message):
+        try:
+            conn = http.client.HTTPConnection(SERVER_HOST, SERVER_PORT, timeout=5.0)
+            try:
+                conn.request("POST", PROGRESS_PATH, body=json.dumps(message), headers={"Content-Type": "application/json"})
+                conn.getresponse().read()
+            finally:
+                conn.close()
+        except Exception:
+            # Progress is informational; the server may be offline
+            pass
+
+    def stop(self):
+        self._stop_event.set()
+        self._close()
+        self._close_socket()
+
+    def _close(self):
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
+    def _close_socket(self):
+        with self._send_lock:
+            if self._sock is not None:
+                try:
+                    self._sock.close()
+                except Exception:
+                    pass
+                self._sock = None
+
+    def _connect_socket(self):
+        """Connects to the server's socket and introduces this session. Returns False if nobody is listening."""
+        if not self.socket_path or not os.path.exists(self.socket_path):
+            return False
+        if not is_trusted_socket(self.socket_path):
+            if not self._warned_untrusted:
+                print(f"[Studio Tools] Web Connection: Ignoring socket not owned by this user: {self.socket_path}")
+                self._warned_untrusted = True
+            return False
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.socket_path)
+            hello = {"type": "hello", "appType": "blender", "taskPath": self.task_path, "pid": os.getpid()}
+            sock.sendall((json.dumps(hello) + "\n").encode())
+            sock.settimeout(SOCKET_READ_TIMEOUT)
+        except OSError:
+            sock.close()
+            return False
+        self._sock = sock
+        return True
+
+    def _listen_socket(self):
+        """Queues commands pushed by the server until the socket closes or the worker stops."""
+        buffer = b""
+        while not self._stop_event.is_set():
+            try:
+                chunk = self._sock.recv(65536)
+            except socket.timeout:
+                continue
+            if not chunk:
+                raise ConnectionError("Pipeline server closed the socket")
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                if not line.strip():
+                    continue
+                message = json.loads(line.decode())
+                # One push may carry a single command or a batch, like a poll response
+                for cmd in message.get("commands", [message]):
+                    _command_queue.put(cmd)
+
+    def _poll(self):
+        """Issues one (long-)poll request on the persistent connection and returns the parsed commands."""
+        if self._conn is None:
+            self._conn = http.client.HTTPConnection(SERVER_HOST, SERVER_PORT, timeout=LONG_POLL_WAIT + 5.0)
+        query = urllib.parse.urlencode({
+            "appType": "blender",
+            "taskPath": self.task_path,
+            "wait": int(LONG_POLL_WAIT),
+        })
+        self._conn.request("GET", f"{POLL_PATH}?{query}", headers={"Connection": "keep-alive"})
+        response = self._conn.getresponse()
+        body = response.read()
+        if response.status != 200:
+            raise http.client.HTTPException(f"Unexpected status {response.status}")
+        if response.will_close:
+            self._close()
+        return json.loads(body.decode()).get("commands", [])
+
+    def run(self):
+        threading.Thread(target=self._send_progress, name="StudioToolsProgressSender", daemon=True).start()
+        while not self._stop_event.is_set():
+            if self._connect_socket():
+                self.transport = "socket"
+                self._close()
+                try:
+                    self._listen_socket()
+                except Exception:
+                    # The server went away; fall back to polling until its socket is back
+                    pass
+                self._close_socket()
+                self._stop_event.wait(POLL_INTERVAL)
+                continue
+
+            self.transport = "http"
+            started = time.monotonic()
+            try:
+                commands = self._poll()
+                for cmd in commands:
+                    _command_queue.put(cmd)
+            except Exception:
+                # Safe silence to avoid console spam if server is offline
+                self._close()
+                self._stop_event.wait(RETRY_INTERVAL)
+                continue
+            # Servers without long-poll support answer straight away with nothing; keep to the regular cadence
+            elapsed = time.monotonic() - started
+            if not commands and elapsed < POLL_INTERVAL:
+                self._stop_event.wait(POLL_INTERVAL - elapsed)
+
+
+def start_web_connection():
+    """Starts the background worker for the current task. Returns False if no task context is set."""
+    global _worker
     task_path = os.environ.get("ST_CWD")
     if not task_path:
+        return False
+    if _worker is not None and _worker.is_alive():
+        return True
+    _worker = WebConnectionWorker(task_path)
+    _worker.start()
+    return True
+
+
+def stop_web_connection():
+    global _worker
+    if _worker is not None:
+        _worker.stop()
+        _worker = None
+
+
+def execute_command(cmd):
+    if cmd.get("command") == "load_usd":
+        filepath = cmd.get("argument")
+        if filepath and os.path.exists(filepath):
+            bpy.ops.wm.usd_import(filepath=filepath)
+            print(f"[Studio Tools] Web Connection: Loaded published USD asset: {filepath}")
+
+
+def command_key(cmd):
+    """Identity of a command for deduplication: identical imports of the same file share a key."""
+    argument = cmd.get("argument")
+    if cmd.get("command") == "load_usd" and isinstance(argument, str):
+        argument = os.path.normcase(os.path.abspath(argument))
+    return cmd.get("command"), json.dumps(argument, sort_keys=True)
+
+
+class CommandExecutor:
+    """
+    Runs received commands on the main thread a few at a time. Each tick runs pending commands until
+    COMMAND_TICK_BUDGET is spent (always at least one), so a burst of imports is spread over several
+    ticks instead of freezing the UI. Identical commands still pending are dropped, and each command's
+    outcome is reported to the server along with how much of the current burst is left.
+    """
+
+    def __init__(self, execute=execute_command, report=None, budget=COMMAND_TICK_BUDGET):
+        self.execute = execute
+        self.report = report
+        self.budget = budget
+        self._pending = collections.deque()
+        self._pending_keys = set()
+        self._burst_total = 0
+        self._burst_done = 0
+
+    @property
+    def pending_count(self):
+        return len(self._pending)
+
+    def submit(self, cmd):
+        """Queues a command. Returns False if an identical command is already pending."""
+        key = command_key(cmd)
+        if key in self._pending_keys:
+            self._report(cmd, "duplicate")
+            return False
+        if not self._pending:
+            self._burst_total = 0
+            self._burst_done = 0
+        self._pending.append((key, cmd))
+        self._pending_keys.add(key)
+        self._burst_total += 1
+        return True
+
+    def run_tick(self):
+        """Runs pending commands within the time budget. Returns how many ran."""
+        started = time.perf_counter()
+        ran = 0
+        while self._pending and (ran == 0 or time.perf_counter() - started < self.budget):
+            key, cmd = self._pending.popleft()
+            self._pending_keys.discard(key)
+            ran += 1
+            self._burst_done += 1
+            try:
+                self.execute(cmd)
+            except Exception as e:
+                print(f"[Studio Tools] Web Connection: Failed to run command {cmd.get('command')}: {e}")
+                self._report(cmd, "failed", str(e))
+                continue
+            self._report(cmd, "done")
+        return ran
+
+    def _report(self, cmd, status, error=None):
+        if self.report is None:
+            return
+        event = {
+            "command": cmd.get("command"),
+            "argument": cmd.get("argument"),
+            "status": status,
+            "completed": self._burst_done,
+            "total": self._burst_total,
+            "remaining": len(self._pending),
+        }
+        if error:
+            event["error"] = error
+        try:
+            self.report(event)
+        except Exception:
+            pass
+
+
+def _report_progress(event):
+    if _worker is not None:
+        _worker.report(event)
+
+
+_executor = CommandExecutor(report=_report_progress)
+
+
+def poll_web_connection():
+    """
+    Timer callback: queues commands received by the worker thread and runs them within the tick's
+    time budget. Never touches the network.
+    """
+    if _worker is None and not start_web_connection():
         return 1.0  # Try again in 1s
-        
-    try:
-        import urllib.request
-        import urllib.parse
-        import json
-        
-        url = f"http://localhost:8000/api/sessions/poll?appType=blender&taskPath={urllib.parse.quote(task_path)}"
-        req = urllib.request.Request(url)
-        with urllib.request.urlopen(req, timeout=0.2) as response:
-            res = json.loads(response.read().decode())
-            commands = res.get("commands", [])
-            for cmd in commands:
-                if cmd.get("command") == "load_usd":
-                    filepath = cmd.get("argument")
-                    if os.path.exists(filepath):
-                        bpy.ops.wm.usd_import(filepath=filepath)
-                        print(f"[Studio Tools] Web Connection: Loaded published USD asset: {filepath}")
-    except Exception:
-        pass  # Safe silence to avoid console spam if server is offline
-        
-    return 0.5  # Poll every 500ms
+
+    while True:
+        try:
+            _executor.submit(_command_queue.get_nowait())
+        except queue.Empty:
+            break
+    _executor.run_tick()
+
+    return BUSY_TICK_INTERVAL if _executor.pending_count else DRAIN_INTERVAL
@@ -0,0 +1,313 @@
+import os
+import json
+import hashlib
+from array import array
+
+try:
+    import bpy
+    IN_BLENDER = True
+except ImportError:
+    IN_BLENDER = False
+
+# RNA property types whose values are hashed when fingerprinting settings (modifiers, lights, nodes...)
+_SIMPLE_PROPERTY_TYPES = {'BOOLEAN', 'INT', 'FLOAT', 'STRING', 'ENUM'}
+# Bumped whenever what is hashed changes, so fingerprints of older publishes never match by accident
+FINGERPRINT_VERSION = 2
+# Generic attribute data types: (foreach_get attribute, components, array typecode)
+_ATTRIBUTE_LAYOUTS = {
+    'FLOAT': ("value", 1, "f"),
+    'INT': ("value", 1, "i"),
+    'INT8': ("value", 1, "i"),
+    'BOOLEAN': ("value", 1, "i"),
+    'FLOAT2': ("vector", 2, "f"),
+    'INT32_2D': ("value", 2, "i"),
+    'FLOAT_VECTOR': ("vector", 3, "f"),
+    'FLOAT_COLOR': ("color", 4, "f"),
+    'BYTE_COLOR': ("color", 4, "f"),
+    'QUATERNION': ("value", 4, "f"),
+    'FLOAT4X4': ("value", 16, "f"),
+}
+
+
+def _update_str(h, value):
+    h.update(str(value).encode("utf-8"))
+    h.update(b"\0")
+
+
+def _hash_settings(h, struct, seen=None):
+    """
+    Hashes the editable simple RNA properties of a struct (modifier, camera, light, node...), the
+    names of the data-blocks it points to (node groups and images are hashed by content) and its
+    custom properties, such as geometry nodes modifier inputs.
+    """
+    seen = set() if seen is None else seen
+    for prop in struct.bl_rna.properties:
+        if prop.is_readonly or prop.identifier == "rna_type":
+            continue
+        if prop.type == 'POINTER':
+            try:
+                value = getattr(struct, prop.identifier)
+            except AttributeError:
+                continue
+            if isinstance(value, bpy.types.ID):
+                _update_str(h, f"{prop.identifier}->{value.name_full}")
+                _hash_id_content(h, value, seen)
+            continue
+        if prop.type not in _SIMPLE_PROPERTY_TYPES:
+            continue
+        try:
+            value = getattr(struct, prop.identifier)
+        except AttributeError:
+            continue
+        if getattr(prop, "is_array", False):
+            value = tuple(value)
+        _update_str(h, f"{prop.identifier}={value!r}")
+    _hash_id_properties(h, struct)
+
+
+def _id_property_value(value):
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if hasattr(value, "to_list"):
+        return value.to_list()
+    if isinstance(value, bpy.types.ID):
+        return value.name_full
+    return value
+
+
+def _hash_id_properties(h, struct):
+    """Hashes custom (ID) properties, e.g. user attributes or geometry nodes modifier inputs."""
+    keys = getattr(struct, "keys", None)
+    if keys is None:
+        return
+    try:
+        names = sorted(keys())
+    except TypeError:
+        return
+    for name in names:
+        _update_str(h, f"[{name}]={json.dumps(_id_property_value(struct[name]), sort_keys=True, default=str)}")
+
+
+def _hash_id_content(h, id_block, seen):
+    """Hashes the content of data-blocks referenced from settings, once per fingerprint."""
+    key = (type(id_block).__name__, id_block.name_full)
+    if key in seen:
+        return
+    if isinstance(id_block, bpy.types.NodeTree):
+        seen.add(key)
+        _hash_node_tree(h, id_block, seen)
+    elif isinstance(id_block, bpy.types.Image):
+        seen.add(key)
+        _hash_image(h, id_block)
+
+
+def _hash_collection_attr(h, collection, attr, components, typecode="f"):
+    """Hashes a per-element attribute of a bpy collection in one foreach_get call."""
+    count = len(collection) * components
+    _update_str(h, f"{attr}:{count}")
+    if not count:
+        return
+    values = array(typecode, [0]) * count
+    collection.foreach_get(attr, values)
+    h.update(values.tobytes())
+
+
+def _hash_attributes(h, data):
+    """Hashes the generic attributes of a mesh, curves or point cloud (colors, UVs, positions, user data...)."""
+    for attribute in sorted(data.attributes, key=lambda a: a.name):
+        # Internal attributes ('.edge_verts', '.select_vert'...) are topology or UI state
+        if attribute.name.startswith("."):
+            continue
+        _update_str(h, f"{attribute.name}:{attribute.domain}:{attribute.data_type}")
+        layout = _ATTRIBUTE_LAYOUTS.get(attribute.data_type)
+        if layout is not None:
+            _hash_collection_attr(h, attribute.data, *layout)
+
+
+def _hash_image(h, image):
+    _update_str(h, f"{image.name_full}:{image.source}:{image.filepath}")
+    _hash_settings(h, image)
+    if image.packed_file is not None:
+        h.update(image.packed_file.data)
+    elif image.is_dirty or image.source == 'GENERATED':
+        # Painted or generated in this session: only the pixels tell what will be exported
+        pixels = array("f", [0.0]) * len(image.pixels)
+        image.pixels.foreach_get(pixels)
+        h.update(pixels.tobytes())
+    else:
+        try:
+            st = os.stat(bpy.path.abspath(image.filepath, library=image.library))
+            _update_str(h, f"{st.st_size}:{st.st_mtime_ns}")
+        except OSError:
+            _update_str(h, "missing")
+
+
+def _hash_node_tree(h, tree, seen):
+    """Hashes a node tree: node settings, socket values and links, recursing into node groups and images."""
+    _update_str(h, f"{tree.name_full}:{tree.bl_idname}")
+    for node in tree.nodes:
+        _update_str(h, f"{node.name}:{node.bl_idname}")
+        _hash_settings(h, node, seen)
+        for socket in node.inputs:
+            value = getattr(socket, "default_value", None)
+            if isinstance(value, bpy.types.ID):
+                _hash_id_content(h, value, seen)
+                value = value.name_full
+            elif value is not None and not isinstance(value, (str, int, float, bool)):
+                try:
+                    value = tuple(value)
+                except TypeError:
+                    value = None
+            _update_str(h, f"{socket.identifier}={value!r}")
+    for link in tree.links:
+        _update_str(h, f"{link.from_node.name}.{link.from_socket.identifier}>{link.to_node.name}.{link.to_socket.identifier}")
+
+
+def _hash_mesh(h, mesh):
+    _hash_collection_attr(h, mesh.vertices, "co", 3)
+    _hash_collection_attr(h, mesh.loops, "vertex_index", 1, "i")
+    _hash_collection_attr(h, mesh.polygons, "loop_total", 1, "i")
+    _hash_collection_attr(h, mesh.polygons, "material_index", 1, "i")
+    _hash_collection_attr(h, mesh.polygons, "use_smooth", 1, "i")
+    for uv_layer in mesh.uv_layers:
+        _update_str(h, uv_layer.name)
+        _hash_collection_attr(h, uv_layer.data, "uv", 2)
+    _hash_attributes(h, mesh)
+    if mesh.has_custom_normals:
+        # Blender 4.1+ exposes the evaluated corner normals directly; older versions store them on loops
+        if hasattr(mesh, "corner_normals"):
+            _hash_collection_attr(h, mesh.corner_normals, "vector", 3)
+        else:
+            mesh.calc_normals_split()
+            _hash_collection_attr(h, mesh.loops, "normal", 3)
+    if mesh.shape_keys:
+        for key_block in mesh.shape_keys.key_blocks:
+            _update_str(h, f"{key_block.name}:{key_block.value}")
+            _hash_collection_attr(h, key_block.data, "co", 3)
+
+
+def _hash_curve(h, curve):
+    """Legacy curve objects: spline settings and control points."""
+    for spline in curve.splines:
+        _hash_settings(h, spline)
+        _hash_collection_attr(h, spline.points, "co", 4)
+        _hash_collection_attr(h, spline.points, "radius", 1)
+        _hash_collection_attr(h, spline.bezier_points, "co", 3)
+        _hash_collection_attr(h, spline.bezier_points, "handle_left", 3)
+        _hash_collection_attr(h, spline.bezier_points, "handle_right", 3)
+        _hash_collection_attr(h, spline.bezier_points, "radius", 1)
+
+
+def _hash_armature(h, obj):
+    armature = obj.data
+    _update_str(h, tuple(bone.parent.name if bone.parent else "" for bone in armature.bones))
+    _update_str(h, tuple(bone.name for bone in armature.bones))
+    _hash_collection_attr(h, armature.bones, "head_local", 3)
+    _hash_collection_attr(h, armature.bones, "tail_local", 3)
+    _hash_collection_attr(h, armature.bones, "matrix_local", 16)
+    if obj.pose is None:
+        return
+    pose_bones = obj.pose.bones
+    _hash_collection_attr(h, pose_bones, "location", 3)
+    _hash_collection_attr(h, pose_bones, "rotation_quaternion", 4)
+    _hash_collection_attr(h, pose_bones, "rotation_euler", 3)
+    _hash_collection_attr(h, pose_bones, "scale", 3)
+    for pose_bone in pose_bones:
+        _hash_id_properties(h, pose_bone)
+        for constraint in pose_bone.constraints:
+            _update_str(h, f"{pose_bone.name}:{constraint.name}:{constraint.type}")
+            _hash_settings(h, constraint)
+
+
+def _hash_animation(h, id_block):
+    anim = getattr(id_block, "animation_data", None)
+    if anim is None or anim.action is None:
+        return
+    _update_str(h, anim.action.name_full)
+    for fcurve in anim.action.fcurves:
+        _update_str(h, f"{fcurve.data_path}[{fcurve.array_index}]")
+        _hash_collection_attr(h, fcurve.keyframe_points, "co", 2)
+
+
+def _hash_material(h, mat, seen=None):
+    seen = set() if seen is None else seen
+    _update_str(h, mat.name_full)
+    _hash_settings(h, mat, seen)
+    if mat.node_tree is not None:
+        _hash_node_tree(h, mat.node_tree, seen)
+
+
+def object_fingerprint(obj, h=None, seen=None):
+    """Hashes everything about an object that ends up in a USD export. Returns the hash object."""
+    h = h or hashlib.sha256()
+    seen = set() if seen is None else seen
+    _update_str(h, f"v{FINGERPRINT_VERSION}:{obj.name_full}:{obj.type}:{obj.parent.name_full if obj.parent else ''}:{obj.parent_bone}")
+    _update_str(h, f"{obj.hide_render}:{obj.hide_viewport}")
+    _update_str(h, tuple(v for row in obj.matrix_world for v in row))
+    _hash_id_properties(h, obj)
+    for mod in obj.modifiers:
+        _update_str(h, f"{mod.name}:{mod.type}")
+        _hash_settings(h, mod, seen)
+    for constraint in obj.constraints:
+        _update_str(h, f"{constraint.name}:{constraint.type}")
+        _hash_settings(h, constraint, seen)
+    for slot in obj.material_slots:
+        _update_str(h, slot.material.name_full if slot.material else "")
+    _hash_animation(h, obj)
+
+    data = obj.data
+    if data is not None:
+        _update_str(h, f"{data.name_full}:{data.library.filepath if data.library else ''}")
+        _hash_settings(h, data, seen)
+        if obj.type == 'MESH':
+            _hash_mesh(h, data)
+        elif obj.type == 'ARMATURE':
+            _hash_armature(h, obj)
+        elif obj.type in {'CURVE', 'SURFACE'}:
+            _hash_curve(h, data)
+        elif hasattr(data, "attributes"):
+            # Hair curves and point clouds keep all their data (positions, radii...) in attributes
+            if obj.type == 'CURVES':
+                _hash_collection_attr(h, data.curves, "first_point_index", 1, "i")
+            _hash_attributes(h, data)
+        _hash_animation(h, data)
+    return h
+
+
+def _hash_export_settings(h, scene, export_settings):
+    _update_str(h, json.dumps(export_settings, sort_keys=True, default=str))
+    if export_settings.get("export_animation"):
+        _update_str(h, f"{scene.frame_start}:{scene.frame_end}:{scene.frame_step}:{scene.render.fps}")
+
+
+def _hash_objects(h, objects):
+    materials = set()
+    seen = set()
+    for obj in objects:
+        object_fingerprint(obj, h, seen)
+        materials.update(slot.material for slot in obj.material_slots if slot.material)
+    for mat in sorted(materials, key=lambda m: m.name_full):
+        _hash_material(h, mat, seen)
+
+
+def scene_fingerprint(scene, export_settings):
+    """
+    Cheap content fingerprint of everything a USD publish of the scene would export: object
+    transforms, geometry and attributes (hashed through foreach_get buffers), armatures and poses,
+    modifiers and node groups, materials and images, custom properties, animation and the export
+    settings themselves.
+    """
+    h = hashlib.sha256()
+    _hash_export_settings(h, scene, export_settings)
+    _hash_objects(h, sorted(scene.objects, key=lambda o: o.name_full))
+    if scene.world is not None:
+        _update_str(h, scene.world.name_full)
+    return h.hexdigest()
+
+
+def hierarchy_fingerprint(scene, root, export_settings):
+    """Fingerprint of a root object and its children, as exported into the root's own USD layer."""
+    h = hashlib.sha256()
+    _hash_export_settings(h, scene, export_settings)
+    _hash_objects(h, [root] + sorted(root.children_recursive, key=lambda o: o.name_full))
+    return h.hexdigest()
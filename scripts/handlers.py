@@ -1,10 +1,54 @@
+import time
+
 try:
     import bpy
     IN_BLENDER = True
 except ImportError:
     IN_BLENDER = False
 
-from utils import update_default_asset_name, update_default_render_name
+import asset_index
+import panel_state
+from utils import update_default_asset_name, update_default_render_name, refresh_published_assets
+
+# Cached Principled BSDF lookups per material: key -> (node tree pointer, node count, node name)
+_principled_cache = {}
+
+# Time spent in sync_materials_viewport_color
+material_sync_stats = {
+    "calls": 0,
+    "materials": 0,
+    "total_ms": 0.0,
+    "last_ms": 0.0,
+    "max_ms": 0.0,
+}
+
+def _record_sync_time(seconds, synced):
+    ms = seconds * 1000.0
+    material_sync_stats["calls"] += 1
+    material_sync_stats["materials"] += synced
+    material_sync_stats["total_ms"] += ms
+    material_sync_stats["last_ms"] = ms
+    material_sync_stats["max_ms"] = max(material_sync_stats["max_ms"], ms)
+
+def get_material_sync_summary():
+    """Returns a one-line summary of the material sync handler cost."""
+    calls = material_sync_stats["calls"]
+    if not calls:
+        return "Material Sync: idle"
+    avg = material_sync_stats["total_ms"] / calls
+    return f"Material Sync: {material_sync_stats['last_ms']:.2f} ms last, {avg:.2f} ms avg, {material_sync_stats['max_ms']:.2f} ms max"
+
+# Seconds between background refreshes of the published asset index
+PUBLISHED_INDEX_REFRESH_INTERVAL = 30.0
+# How often the timer checks whether a background refresh finished
+PUBLISHED_INDEX_COLLECT_INTERVAL = 0.5
+# When the timer starts its next periodic refresh (time.monotonic())
+_next_index_refresh = [0.0]
+
+def start_published_index_refresh():
+    """Starts a background refresh of the published asset index and postpones the next periodic one."""
+    _next_index_refresh[0] = time.monotonic() + PUBLISHED_INDEX_REFRESH_INTERVAL
+    return refresh_published_assets(background=True)
 
 if IN_BLENDER:
     @bpy.app.handlers.persistent
@@ -12,36 +56,101 @@ if IN_BLENDER:
         update_default_asset_name()
         update_default_render_name()
 
+    @bpy.app.handlers.persistent
+    def refresh_published_index_handler(dummy1=None, dummy2=None):
+        # Opening a file with no index on disk walks the whole published tree: keep it off the main thread
+        start_published_index_refresh()
+
+    @bpy.app.handlers.persistent
+    def refresh_panel_state_handler(dummy1=None, dummy2=None):
+        panel_state.request_refresh()
+
+    def refresh_published_index_timer():
+        """
+        Keeps the published asset index current with publishes made by other sessions. The directory
+        scan runs on a worker thread; this timer only starts it and swaps its result in, including the
+        results of refreshes started elsewhere (file load, publishes).
+        """
+        asset_index.collect_background_refresh()
+        if time.monotonic() >= _next_index_refresh[0] and not asset_index.background_refresh_running():
+            start_published_index_refresh()
+        return PUBLISHED_INDEX_COLLECT_INTERVAL
+
+    def _find_principled(mat):
+        """Returns the material's Principled BSDF node, using the cached mapping when still valid."""
+        nodes = mat.node_tree.nodes
+        key = mat.session_uid if hasattr(mat, "session_uid") else mat.name_full
+        cached = _principled_cache.get(key)
+        if cached is not None:
+            node_tree_ptr, node_count, node_name = cached
+            # The mapping is stale once the node tree is swapped or nodes are added/removed
+            if node_tree_ptr == mat.node_tree.as_pointer() and node_count == len(nodes):
+                node = nodes.get(node_name)
+                if node is not None and node.type == 'BSDF_PRINCIPLED':
+                    return node
+
+        # Misses are not cached: swapping a node for a Principled BSDF keeps the node count the same,
+        # and telling that apart would take the same walk over the nodes as this lookup
+        for node in nodes:
+            if node.type == 'BSDF_PRINCIPLED':
+                _principled_cache[key] = (mat.node_tree.as_pointer(), len(nodes), node.name)
+                return node
+        _principled_cache.pop(key, None)
+        return None
+
+    def _invalidate_node_tree(node_tree_ptr):
+        for key in [k for k, v in _principled_cache.items() if v[0] == node_tree_ptr]:
+            del _principled_cache[key]
+
+    def _sync_material(mat):
+        if not mat.use_nodes or not mat.node_tree:
+            return
+        principled = _find_principled(mat)
+        if principled:
+            base_color_input = principled.inputs.get('Base Color') or (principled.inputs[0] if principled.inputs else None)
+            if base_color_input and not base_color_input.is_linked:
+                val = base_color_input.default_value
+                diff = sum(abs(a - b) for a, b in zip(mat.diffuse_color, val))
+                if diff > 1e-4:
+                    mat.diffuse_color = val
+
     @bpy.app.handlers.persistent
     def sync_materials_viewport_color(scene, depsgraph):
         """
         Callback that runs on every scene depsgraph update.
-        Synchronizes Principled BSDF base color with the material's Viewport Display color.
+        Synchronizes Principled BSDF base color with the material's Viewport Display color,
+        only for the materials reported as updated by the depsgraph.
         """
+        started = time.perf_counter()
+        synced = 0
         try:
-            for mat in bpy.data.materials:
-                if not mat.use_nodes or not mat.node_tree:
-                    continue
-                
-                # Find Principled BSDF node
-                principled = None
-                for node in mat.node_tree.nodes:
-                    if node.type == 'BSDF_PRINCIPLED':
-                        principled = node
-                        break
-                        
-                if principled:
-                    base_color_input = principled.inputs.get('Base Color') or (principled.inputs[0] if principled.inputs else None)
-                    if base_color_input and not base_color_input.is_linked:
-                        val = base_color_input.default_value
-                        diff = sum(abs(a - b) for a, b in zip(mat.diffuse_color, val))
-                        if diff > 1e-4:
-                            mat.diffuse_color = val
+            if depsgraph.id_type_updated('MATERIAL') or depsgraph.id_type_updated('NODETREE'):
+                for update in depsgraph.updates:
+                    updated_id = update.id.original
+                    if isinstance(updated_id, bpy.types.Material):
+                        _sync_material(updated_id)
+                        synced += 1
+                    elif isinstance(updated_id, bpy.types.NodeTree):
+                        _invalidate_node_tree(updated_id.as_pointer())
         except Exception:
             pass
+        _record_sync_time(time.perf_counter() - started, synced)
+
+    @bpy.app.handlers.persistent
+    def clear_material_cache_handler(dummy1=None, dummy2=None):
+        """Drops cached node mappings, which are meaningless once a different file is loaded."""
+        _principled_cache.clear()
 else:
     # Fallbacks for non-Blender environment compilation
     def update_default_asset_name_handler(dummy1=None, dummy2=None):
         pass
+    def refresh_published_index_handler(dummy1=None, dummy2=None):
+        pass
+    def refresh_panel_state_handler(dummy1=None, dummy2=None):
+        pass
+    def refresh_published_index_timer():
+        return None
     def sync_materials_viewport_color(scene, depsgraph):
         pass
+    def clear_material_cache_handler(dummy1=None, dummy2=None):
+        pass
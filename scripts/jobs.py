@@ -0,0 +1,218 @@
+import os
+import json
+import subprocess
+import itertools
+
+import panel_state
+
+try:
+    import bpy
+    IN_BLENDER = True
+except ImportError:
+    IN_BLENDER = False
+
+# How often running jobs are polled from Blender's main thread
+POLL_INTERVAL = 0.5
+# Finished jobs kept around for display in the pipeline panel
+MAX_FINISHED_JOBS = 10
+
+QUEUED = "QUEUED"
+RUNNING = "RUNNING"
+DONE = "DONE"
+FAILED = "FAILED"
+
+_ids = itertools.count(1)
+_jobs = []
+_pool_sizes = {}
+
+
+class Job:
+    """
+    A command line run as a child process, with optional progress reporting through a status file.
+    on_start and on_exit are called around every attempt (retries included), on_finish once at the end.
+    """
+
+    def __init__(self, label, argv, log_path, pool="default", status_path=None, retries=0, on_finish=None, env=None, on_start=None, on_exit=None):
+        self.id = next(_ids)
+        self.label = label
+        self.argv = argv
+        self.log_path = log_path
+        self.pool = pool
+        self.status_path = status_path
+        self.retries = retries
+        self.on_finish = on_finish
+        self.on_start = on_start
+        self.on_exit = on_exit
+        self.env = env
+        self.state = QUEUED
+        self.progress = 0.0
+        self.message = "Queued"
+        self.attempts = 0
+        self.returncode = None
+        self._process = None
+        self._log_file = None
+
+    @property
+    def active(self):
+        return self.state in (QUEUED, RUNNING)
+
+    @property
+    def pid(self):
+        return self._process.pid if self._process is not None else None
+
+    def _start(self):
+        self.attempts += 1
+        os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+        # Each attempt appends to the same log so earlier failures stay inspectable
+        self._log_file = open(self.log_path, "a", encoding="utf-8")
+        self._log_file.write(f"===== Attempt {self.attempts}: {subprocess.list2cmdline(self.argv)}\n")
+        self._log_file.flush()
+        try:
+            self._process = subprocess.Popen(
+                self.argv,
+                stdout=self._log_file,
+                stderr=subprocess.STDOUT,
+                stdin=subprocess.DEVNULL,
+                env=self.env,
+            )
+        except OSError:
+            self._log_file.close()
+            self._log_file = None
+            raise
+        self.state = RUNNING
+        self.message = "Starting"
+        _notify(self, self.on_start)
+
+    def _read_status(self):
+        if not self.status_path:
+            return
+        try:
+            with open(self.status_path, "r", encoding="utf-8") as f:
+                status = json.load(f)
+            self.progress = float(status.get("progress", self.progress))
+            self.message = status.get("message", self.message)
+        except (OSError, ValueError):
+            pass
+
+    def _poll(self):
+        """Updates the job from its process. Returns True once the job reached a final state."""
+        self._read_status()
+        returncode = self._process.poll()
+        if returncode is None:
+            return False
+
+        self._log_file.close()
+        self._log_file = None
+        self._process = None
+        self.returncode = returncode
+        _notify(self, self.on_exit)
+        if returncode == 0:
+            self.state = DONE
+            self.progress = 1.0
+            self.message = "Finished"
+            return True
+        if self.attempts <= self.retries:
+            self.state = QUEUED
+            self.message = f"Retrying (exit code {returncode})"
+            return False
+        self.state = FAILED
+        self.message = f"Failed (exit code {returncode}), see {os.path.basename(self.log_path)}"
+        return True
+
+    def cancel(self):
+        if self._process is not None:
+            self._process.kill()
+            self.returncode = self._process.wait()
+            self._log_file.close()
+            self._process = None
+            self._log_file = None
+            _notify(self, self.on_exit)
+        self.state = FAILED
+        self.message = "Cancelled"
+
+
+def set_pool_size(pool, size):
+    """Sets how many jobs of a pool may run concurrently."""
+    _pool_sizes[pool] = max(1, int(size))
+
+
+def get_jobs():
+    return list(_jobs)
+
+
+def blender_command(blend_path, script_path=None, script_args=(), extra_args=(), factory_startup=True):
+    """
+    Builds a command line for a headless instance of the current Blender.
+    extra_args are passed after the .blend file (e.g. render frame ranges), script_args to the script.
+    factory_startup skips user preferences for faster, reproducible workers; renders and exports must keep
+    them (Cycles compute device, enabled add-ons, script auto-execution for drivers).
+    """
+    argv = [bpy.app.binary_path, "-b"]
+    if factory_startup:
+        argv.append("--factory-startup")
+    if blend_path:
+        argv.append(blend_path)
+    if script_path:
+        argv.extend(["--python-exit-code", "1", "--python", script_path])
+    argv.extend(extra_args)
+    if script_path:
+        argv.append("--")
+        argv.extend(script_args)
+    return argv
+
+
+def write_status(status_path, progress, message):
+    """Called from worker processes to publish their progress to the session."""
+    tmp_path = f"{status_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"progress": progress, "message": message}, f)
+    os.replace(tmp_path, status_path)
+    print(f"[Studio Tools] {int(progress * 100):3d}% {message}", flush=True)
+
+
+def submit(job):
+    _jobs.append(job)
+    if IN_BLENDER and not bpy.app.timers.is_registered(poll_jobs_timer):
+        bpy.app.timers.register(poll_jobs_timer, first_interval=0.0, persistent=True)
+    return job
+
+
+def _notify(job, callback):
+    if callback is None:
+        return
+    try:
+        callback(job)
+    except Exception as e:
+        print(f"[Studio Tools] Warning: Callback of job '{job.label}' failed: {e}")
+
+
+def _finish(job):
+    _notify(job, job.on_finish)
+
+
+def poll_jobs_timer():
+    """Starts queued jobs within their pool limits and collects finished ones."""
+    for job in [j for j in _jobs if j.state == RUNNING]:
+        if job._poll():
+            _finish(job)
+
+    for job in [j for j in _jobs if j.state == QUEUED]:
+        running = sum(1 for j in _jobs if j.state == RUNNING and j.pool == job.pool)
+        if running >= _pool_sizes.get(job.pool, 1):
+            continue
+        try:
+            job._start()
+        except OSError as e:
+            job.state = FAILED
+            job.message = f"Failed to start: {e}"
+            _finish(job)
+
+    # Keep only the most recent finished jobs for display
+    finished = [j for j in _jobs if not j.active]
+    for job in finished[:-MAX_FINISHED_JOBS]:
+        _jobs.remove(job)
+
+    panel_state.tag_redraw()
+    if any(j.active for j in _jobs):
+        return POLL_INTERVAL
+    return None
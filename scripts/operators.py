@@ -1,12 +1,13 @@
 import os
 import re
-import shutil
+import json
+import time
 from datetime import datetime
 
 try:
     import bpy
     from bpy.types import Operator
-    from bpy.props import StringProperty
+    from bpy.props import StringProperty, EnumProperty
     IN_BLENDER = True
 except ImportError:
     IN_BLENDER = False
@@ -14,6 +15,8 @@ except ImportError:
         pass
     class StringProperty:
         def __init__(self, **kwargs): pass
+    class EnumProperty:
+        def __init__(self, **kwargs): pass
     # Setup dummy bpy module for non-Blender python environments (like syntax checking)
     import sys
     from types import ModuleType
@@ -25,7 +28,57 @@ except ImportError:
     sys.modules["bpy"] = dummy_bpy
     bpy = dummy_bpy
 
-from utils import resolve_blend_path, get_published_assets, update_default_asset_name, update_default_render_name, write_simple_yaml, get_render_version_and_paths, setup_render_settings
+import versioning
+import panel_state
+import jobs
+import render_queue
+import render_manifest
+import profiling
+import blobstore
+import asset_index
+import usd_clips
+import publish_profiles
+from utils import resolve_blend_path, resolve_blend_paths, get_published_assets, refresh_published_assets, update_default_asset_name, update_default_render_name, write_simple_yaml, get_render_version_and_paths, setup_render_settings, export_publish_usd, get_publish_metadata, mark_version_published, write_published_blend, get_publish_fingerprint, find_unchanged_publish, export_publish_usd_incremental, get_previous_version_dir, LAYERS_DIR_NAME, read_link_catalog, read_version_manifest, resolve_linked_asset_target, read_link_manifest
+
+def link_blend_library(context, blend_path):
+    """
+    Links a published scene.blend into the active scene in a single library read and marks the library
+    as directly linked by StudioTools. The top-level collections and objects listed in the version's
+    link catalog are linked; without a catalog, the file's collections (or its objects if it has none).
+    Returns (kind, count) describing what was linked.
+    """
+    catalog = read_link_catalog(blend_path)
+    with bpy.data.libraries.load(blend_path, link=True) as (data_from, data_to):
+        if catalog is not None:
+            data_to.collections, data_to.objects = catalog
+        elif data_from.collections:
+            # Link all collections found in the file
+            data_to.collections = data_from.collections
+        else:
+            # Fallback: link objects instead of collections
+            data_to.objects = data_from.objects
+    
+    # Data blocks of a library that is already linked come back as the existing IDs; only add new ones
+    scene_collections = set(context.scene.collection.children.values())
+    linked_collections = [col for col in data_to.collections if col]
+    for col in linked_collections:
+        if col not in scene_collections:
+            context.scene.collection.children.link(col)
+    scene_objects = set(context.scene.collection.objects.values())
+    linked_objects = [obj for obj in data_to.objects if obj]
+    # Link objects into active scene collection
+    for obj in linked_objects:
+        if obj not in scene_objects:
+            context.scene.collection.objects.link(obj)
+        
+    # Find the library we just linked and mark it as direct
+    for lib in bpy.data.libraries:
+        lib_path = os.path.abspath(bpy.path.abspath(lib.filepath))
+        if lib_path == os.path.abspath(blend_path):
+            lib["studiotools_direct"] = True
+    
+    kinds = [k for k, items in (("collections", linked_collections), ("objects", linked_objects)) if items]
+    return " and ".join(kinds) or "collections", len(linked_collections) + len(linked_objects)
 
 class WM_OT_studiotools_link_asset(Operator):
     """Link an asset from a copied deliverable path."""
@@ -39,7 +92,9 @@ class WM_OT_studiotools_link_asset(Operator):
             self.report({'WARNING'}, "Please paste a path first.")
             return {'CANCELLED'}
             
-        blend_path, ver_dir = resolve_blend_path(path_to_import)
+        prof = profiling.Profiler("link_asset")
+        with prof.stage("resolve"):
+            blend_path, ver_dir = resolve_blend_path(path_to_import)
         if not blend_path:
             self.report({'ERROR'}, f"Could not find scene.blend in the provided path: {path_to_import}")
             return {'CANCELLED'}
@@ -47,49 +102,103 @@ class WM_OT_studiotools_link_asset(Operator):
         print(f"[Studio Tools] Resolved link target to: {blend_path}")
         
         try:
-            # Load collections list without linking them yet
-            with bpy.data.libraries.load(blend_path, link=True) as (data_from, data_to):
-                collections = data_from.collections
-                
-            if not collections:
-                # Fallback: link objects instead of collections
-                with bpy.data.libraries.load(blend_path, link=True) as (data_from, data_to):
-                    data_to.objects = data_from.objects
-                
-                linked_objects = [obj for obj in data_to.objects if obj]
-                if not linked_objects:
-                    self.report({'ERROR'}, "No collections or objects found to link in scene.blend.")
-                    return {'CANCELLED'}
-                    
-                # Link objects into active scene collection
-                for obj in linked_objects:
-                    context.scene.collection.objects.link(obj)
-                
-                self.report({'INFO'}, f"Linked {len(linked_objects)} objects from asset.")
-            else:
-                # Link all collections found in the file
-                with bpy.data.libraries.load(blend_path, link=True) as (data_from, data_to):
-                    data_to.collections = collections
-                    
-                linked_collections = [col for col in data_to.collections if col]
-                for col in linked_collections:
-                    context.scene.collection.children.link(col)
-                    
-                self.report({'INFO'}, f"Linked {len(linked_collections)} collections from asset.")
-                
-            # Find the library we just linked and mark it as direct
-            for lib in bpy.data.libraries:
-                lib_path = os.path.abspath(bpy.path.abspath(lib.filepath))
-                if lib_path == os.path.abspath(blend_path):
-                    lib["studiotools_direct"] = True
+            with prof.stage("link"):
+                linked_kind, linked_count = link_blend_library(context, blend_path)
+            if not linked_count:
+                self.report({'ERROR'}, "No collections or objects found to link in scene.blend.")
+                return {'CANCELLED'}
+            self.report({'INFO'}, f"Linked {linked_count} {linked_kind} from asset.")
 
             # Clear input field after success
             context.scene.studiotools_import_path = ""
+            panel_state.request_refresh()
             
         except Exception as e:
             self.report({'ERROR'}, f"Failed to link library: {str(e)}")
             return {'CANCELLED'}
             
+        prof.write(blend_path=blend_path)
+        if context.scene.studiotools_show_timings:
+            prof.print_summary()
+        return {'FINISHED'}
+
+class WM_OT_studiotools_batch_link(Operator):
+    """Link many assets from a manifest file or a list of paths in one pass."""
+    bl_idname = "wm.studiotools_batch_link"
+    bl_label = "Batch Link Assets"
+    bl_description = "Resolve and link every asset listed in a manifest (or a ';' separated list of paths)"
+    
+    filepath: StringProperty(name="Link Manifest", subtype='FILE_PATH')
+    paths: StringProperty(name="Paths", description="Asset/version folder paths separated by ';'")
+    
+    def invoke(self, context, event):
+        if not self.paths and not self.filepath:
+            context.window_manager.fileselect_add(self)
+            return {'RUNNING_MODAL'}
+        return self.execute(context)
+    
+    def execute(self, context):
+        try:
+            if self.paths:
+                input_paths = [p.strip() for p in self.paths.split(";") if p.strip()]
+            else:
+                input_paths = read_link_manifest(bpy.path.abspath(self.filepath))
+        except Exception as e:
+            self.report({'ERROR'}, f"Failed to read link manifest: {str(e)}")
+            return {'CANCELLED'}
+        if not input_paths:
+            self.report({'WARNING'}, "No asset paths to link.")
+            return {'CANCELLED'}
+        
+        prof = profiling.Profiler("batch_link")
+        # Resolve everything up front and link each library once, however many entries point at it
+        # Files are compared by real path: published/<asset>/scene.blend and the version it points to are
+        # the same library. The first spelling wins, and libraries already in the file keep theirs.
+        blend_paths = []
+        unresolved = []
+        with prof.stage("resolve"):
+            spellings = {}
+            for lib in bpy.data.libraries:
+                lib_path = os.path.abspath(bpy.path.abspath(lib.filepath))
+                spellings.setdefault(os.path.realpath(lib_path), lib_path)
+            seen = set()
+            resolved = resolve_blend_paths(input_paths)
+            for input_path in input_paths:
+                blend_path, _ = resolved[input_path]
+                if not blend_path:
+                    unresolved.append(input_path)
+                    continue
+                real_path = os.path.realpath(blend_path)
+                if real_path not in seen:
+                    seen.add(real_path)
+                    blend_paths.append(spellings.get(real_path, os.path.abspath(blend_path)))
+        
+        linked = 0
+        failed = []
+        for blend_path in blend_paths:
+            asset_label = os.path.basename(os.path.dirname(os.path.dirname(blend_path))) + "/" + os.path.basename(os.path.dirname(blend_path))
+            try:
+                with prof.stage(f"link {asset_label}"):
+                    linked_kind, linked_count = link_blend_library(context, blend_path)
+                linked += linked_count
+                print(f"[Studio Tools] Linked {linked_count} {linked_kind} from {asset_label} ({prof.stages[-1]['wall_s'] * 1000.0:.0f} ms)")
+            except Exception as e:
+                print(f"[Studio Tools] Warning: Failed to link {blend_path}: {e}")
+                failed.append(blend_path)
+        
+        panel_state.request_refresh()
+        for input_path in unresolved:
+            print(f"[Studio Tools] Warning: Could not find scene.blend in: {input_path}")
+        prof.write(libraries=blend_paths, unresolved=unresolved, failed=failed)
+        if context.scene.studiotools_show_timings:
+            prof.print_summary()
+        
+        message = (f"Linked {len(blend_paths) - len(failed)} libraries ({linked} data blocks) from "
+                   f"{len(input_paths)} entries in {prof.total_s:.2f} s")
+        if unresolved or failed:
+            self.report({'WARNING'}, f"{message}; {len(unresolved)} unresolved, {len(failed)} failed (see console)")
+        else:
+            self.report({'INFO'}, message)
         return {'FINISHED'}
 
 class WM_OT_studiotools_swap_version(Operator):
@@ -124,12 +233,18 @@ class WM_OT_studiotools_swap_version(Operator):
         else:
             lib.filepath = new_filepath
             
+        prof = profiling.Profiler("swap_version")
         try:
-            lib.reload()
+            with prof.stage("reload"):
+                lib.reload()
+            prof.write(library=self.library_name, target_version=self.target_version)
+            if context.scene.studiotools_show_timings:
+                prof.print_summary()
             # Force redraw of 3D viewports to update visuals instantly
             for area in context.screen.areas:
                 if area.type == 'VIEW_3D':
                     area.tag_redraw()
+            panel_state.request_refresh()
             self.report({'INFO'}, f"Successfully swapped version to {self.target_version}")
         except Exception as e:
             self.report({'ERROR'}, f"Failed to reload library version: {str(e)}")
@@ -137,6 +252,102 @@ class WM_OT_studiotools_swap_version(Operator):
             
         return {'FINISHED'}
 
+class WM_OT_studiotools_update_all_linked(Operator):
+    """Point every linked asset library at its latest, published or manifest version and reload them in one batch."""
+    bl_idname = "wm.studiotools_update_all_linked"
+    bl_label = "Update All Linked Assets"
+    bl_description = "Switch all linked asset libraries to the chosen versions and reload them together"
+    
+    mode: EnumProperty(
+        name="Target",
+        items=[
+            ('LATEST', "Latest", "Latest version of each asset"),
+            ('PUBLISHED', "Published", "Published version of each asset"),
+            ('MANIFEST', "Manifest", "Versions listed in a version manifest file"),
+        ],
+        default='LATEST',
+    )
+    filepath: StringProperty(name="Version Manifest", subtype='FILE_PATH')
+    
+    def invoke(self, context, event):
+        if self.mode == 'MANIFEST' and not self.filepath:
+            context.window_manager.fileselect_add(self)
+            return {'RUNNING_MODAL'}
+        return self.execute(context)
+    
+    def execute(self, context):
+        manifest = None
+        if self.mode == 'MANIFEST':
+            try:
+                manifest = read_version_manifest(bpy.path.abspath(self.filepath))
+            except Exception as e:
+                self.report({'ERROR'}, f"Failed to read version manifest: {str(e)}")
+                return {'CANCELLED'}
+        
+        prof = profiling.Profiler("update_all_linked")
+        changes = []
+        unresolved = []
+        with prof.stage("resolve"):
+            for lib in bpy.data.libraries:
+                if not lib.get("studiotools_direct", False):
+                    continue
+                current_path = os.path.abspath(bpy.path.abspath(lib.filepath))
+                target_path = resolve_linked_asset_target(current_path, self.mode, manifest)
+                if target_path is None:
+                    unresolved.append(lib.name)
+                elif os.path.abspath(target_path) != current_path:
+                    changes.append((lib, current_path, os.path.abspath(target_path)))
+        # Original path strings (with their // relative form), restored on libraries that fail to reload
+        original_paths = {lib.name: lib.filepath for lib, current_path, target_path in changes}
+        
+        if not changes:
+            self.report({'INFO'}, f"All linked assets are up to date ({len(unresolved)} without a target).")
+            return {'FINISHED'}
+        
+        # Re-point every library first, then reload them back to back with a single redraw at the end
+        with prof.stage("relocate"):
+            for lib, current_path, target_path in changes:
+                # Keep paths relative if the original was relative (starts with //)
+                lib.filepath = bpy.path.relpath(target_path) if lib.filepath.startswith("//") else target_path
+        failed = []
+        with prof.stage("reload"):
+            for lib, current_path, target_path in changes:
+                try:
+                    lib.reload()
+                except Exception as e:
+                    print(f"[Studio Tools] Warning: Failed to reload {lib.name}: {e}")
+                    failed.append(lib.name)
+            # A failed reload keeps the old data: point the library back at the file that data came from
+            for lib, current_path, target_path in changes:
+                if lib.name in failed:
+                    lib.filepath = original_paths[lib.name]
+        
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+        panel_state.request_refresh()
+        
+        summary = [f"{lib.name}: {describe_linked_version(current)} -> {describe_linked_version(target)}"
+                   for lib, current, target in changes if lib.name not in failed]
+        for line in summary:
+            print(f"[Studio Tools] Updated {line}")
+        prof.write(mode=self.mode, changed=summary, failed=failed, unresolved=unresolved)
+        if context.scene.studiotools_show_timings:
+            prof.print_summary()
+        
+        message = f"Updated {len(changes) - len(failed)} linked assets in {prof.total_s:.2f} s"
+        if failed:
+            self.report({'WARNING'}, f"{message}; failed to reload: {', '.join(failed)}")
+        else:
+            self.report({'INFO'}, message)
+        return {'FINISHED'}
+
+def describe_linked_version(blend_path):
+    """Short label of a linked scene.blend: 'published' or its version folder name."""
+    if os.path.basename(os.path.dirname(os.path.dirname(blend_path))) == "published":
+        return "published"
+    return os.path.basename(os.path.dirname(blend_path))
+
 class WM_OT_studiotools_unlink_asset(Operator):
     """Unlink and remove this asset library from the scene."""
     bl_idname = "wm.studiotools_unlink_asset"
@@ -154,6 +365,7 @@ class WM_OT_studiotools_unlink_asset(Operator):
         try:
             name = lib.name
             bpy.data.libraries.remove(lib)
+            panel_state.request_refresh()
             self.report({'INFO'}, f"Unlinked and removed asset library '{name}'.")
         except Exception as e:
             self.report({'ERROR'}, f"Failed to unlink library: {str(e)}")
@@ -178,39 +390,32 @@ class WM_OT_studiotools_new_file(Operator):
         os.makedirs(app_dir, exist_ok=True)
         
         # Determine next version
-        version = 1
-        if os.path.exists(app_dir):
-            for f in os.listdir(app_dir):
-                match = re.search(r"scene_v(\d+)\.blend", f, re.IGNORECASE)
-                if match:
-                    version = max(version, int(match.group(1)) + 1)
-                    
+        version = versioning.next_version(app_dir, versioning.WIP_SCENE_PATTERN, dirs_only=False)
+
         file_name = f"scene_v{version:03d}.blend"
         save_path = os.path.abspath(os.path.join(app_dir, file_name))
         
+        prof = profiling.Profiler("new_file", task_path)
         try:
-            # Wiping the scene collection and data blocks (safest, keeps settings and handlers)
-            for col in list(context.scene.collection.children):
-                context.scene.collection.children.unlink(col)
-                
-            for obj in list(bpy.data.objects):
-                bpy.data.objects.remove(obj, do_unlink=True)
-                
-            for col in list(bpy.data.collections):
-                if col != context.scene.collection:
-                    bpy.data.collections.remove(col)
-                    
-            for block in [bpy.data.materials, bpy.data.textures, bpy.data.actions, bpy.data.node_groups, bpy.data.libraries]:
-                for item in list(block):
-                    block.remove(item)
+            # Wiping the scene's data blocks (safest, keeps settings and handlers)
+            with prof.stage("wipe"):
+                removed = wipe_blend_data()
+            with prof.stage("orphan_purge"):
+                purged = purge_orphans()
                     
             # Save new file
-            bpy.ops.wm.save_as_mainfile(filepath=save_path)
-            self.report({'INFO'}, f"Created new empty workfile version: {file_name}")
+            with prof.stage("save", outputs=[save_path]):
+                bpy.ops.wm.save_as_mainfile(filepath=save_path)
             
             # Reset default asset name
             if hasattr(bpy.types.Scene, "studiotools_asset_name"):
                 context.scene.studiotools_asset_name = "scene"
+            
+            prof.write(removed=removed, purged=purged)
+            if context.scene.studiotools_show_timings:
+                prof.print_summary()
+            wipe_ms = sum(r["wall_s"] for r in prof.stages if r["stage"] != "save") * 1000.0
+            self.report({'INFO'}, f"Created new empty workfile version: {file_name} (removed {removed + purged} data-blocks in {wipe_ms:.0f} ms)")
                 
         except Exception as e:
             self.report({'ERROR'}, f"Failed to create new empty workfile: {str(e)}")
@@ -218,6 +423,40 @@ class WM_OT_studiotools_new_file(Operator):
             
         return {'FINISHED'}
 
+# Data collections emptied by New Empty Scene. Scenes, worlds and UI data blocks are kept; whatever
+# the removed data blocks were using (meshes, images...) is freed by the orphan purge afterwards.
+WIPE_DATA_COLLECTIONS = ("objects", "collections", "materials", "textures", "actions", "node_groups", "libraries")
+
+def wipe_blend_data():
+    """Removes all objects, collections, materials, textures, actions, node groups and libraries in one batch."""
+    ids = set()
+    for name in WIPE_DATA_COLLECTIONS:
+        ids.update(getattr(bpy.data, name))
+    if not ids:
+        return 0
+    try:
+        # A single removal pass: relations are rebuilt once instead of after every data block
+        bpy.data.batch_remove(ids)
+    except (AttributeError, RuntimeError):
+        for name in WIPE_DATA_COLLECTIONS:
+            collection = getattr(bpy.data, name)
+            for item in list(collection):
+                collection.remove(item)
+    return len(ids)
+
+def purge_orphans():
+    """Frees every data block left without users (meshes, images, ...) across all ID types. Returns the count."""
+    try:
+        return bpy.data.orphans_purge(do_local_ids=True, do_linked_ids=True, do_recursive=True)
+    except TypeError:
+        # Blender before 3.0 purges one level of orphans per call
+        purged = 0
+        while True:
+            count = bpy.data.orphans_purge()
+            if not count:
+                return purged
+            purged += count
+
 class WM_OT_studiotools_increment_save(Operator):
     """Save the current workfile as the next version."""
     bl_idname = "wm.studiotools_increment_save"
@@ -308,17 +547,18 @@ class WM_OT_studiotools_publish_usd(Operator):
             self.report({'ERROR'}, "ST_CWD environment variable not set.")
             return {'CANCELLED'}
             
+        prof = profiling.Profiler("publish_usd", task_path)
+        version_dir = staging_dir = None
         try:
-            # 1. Save active Blend file
-            bpy.ops.wm.save_mainfile()
+            # 1. The workfile is only written once per publish: by the WIP save-up (or, for a
+            # background publish, the save the worker reads from)
             current_blend = bpy.data.filepath
             
             # 2. Determine versions directory packaged in a folder
             versions_dir = os.path.join(task_path, "versions")
             os.makedirs(versions_dir, exist_ok=True)
             
-            # 3. Determine next version by scanning versions directory folders
-            version = 1
+            # 3. Determine next version from the asset's version folders
             asset_prefix = context.scene.studiotools_asset_name.strip()
             if not asset_prefix:
                 asset_prefix = "scene"
@@ -327,220 +567,98 @@ class WM_OT_studiotools_publish_usd(Operator):
             asset_prefix = re.sub(r"[^a-zA-Z0-9_]", "_", asset_prefix)
             
             asset_versions_dir = os.path.join(versions_dir, asset_prefix)
-            if os.path.exists(asset_versions_dir):
-                for f in os.listdir(asset_versions_dir):
-                    if os.path.isdir(os.path.join(asset_versions_dir, f)):
-                        match = re.search(r"^v(\d+)", f, re.IGNORECASE)
-                        if match:
-                            version = max(version, int(match.group(1)) + 1)
-                        
-            version_folder = os.path.join(asset_prefix, f"v{version:03d}")
-            version_dir = os.path.join(versions_dir, version_folder)
-            os.makedirs(version_dir, exist_ok=True)
-            
-            export_as_usdc = context.scene.studiotools_export_usdc
-            # Blender uses file extension to determine format (ascii .usda vs binary .usdc/.usd).
-            # To ensure the file is always named stage.usd on disk, we export with Blender's preferred
-            # extension first, then rename it to stage.usd if it was exported as .usda.
-            temp_ext = ".usd" if export_as_usdc else ".usda"
-            pub_filepath = os.path.join(version_dir, f"stage{temp_ext}")
-
-            
-            # 4. Export scene as USD (USDA ascii layout for human readable composition verification)
-            export_props = bpy.ops.wm.usd_export.get_rna_type().properties
-            kwargs = {}
-            export_animation = context.scene.studiotools_export_animation
-            if "export_animation" in export_props:
-                kwargs["export_animation"] = export_animation
-            if "export_hair" in export_props:
-                kwargs["export_hair"] = True
-            if "export_uvmaps" in export_props:
-                kwargs["export_uvmaps"] = True
-            if "rename_uvmaps" in export_props:
-                kwargs["rename_uvmaps"] = True
-            if "export_mesh_colors" in export_props:
-                kwargs["export_mesh_colors"] = True
-            if "export_normals" in export_props:
-                kwargs["export_normals"] = True
-            if "export_materials" in export_props:
-                kwargs["export_materials"] = True
-            if "export_subdivision" in export_props:
-                kwargs["export_subdivision"] = "BEST_MATCH"
-            if "export_armatures" in export_props:
-                kwargs["export_armatures"] = True
-            if "only_deform_bones" in export_props:
-                kwargs["only_deform_bones"] = False
-            if "export_shapekeys" in export_props:
-                kwargs["export_shapekeys"] = True
-            if "use_instancing" in export_props:
-                kwargs["use_instancing"] = True
-            if "evaluation_mode" in export_props:
-                kwargs["evaluation_mode"] = "RENDER"
-            if "generate_preview_surface" in export_props:
-                kwargs["generate_preview_surface"] = True
-            if "generate_materialx_network" in export_props:
-                kwargs["generate_materialx_network"] = False
-            if "convert_orientation" in export_props:
-                kwargs["convert_orientation"] = True
-            if "export_custom_properties" in export_props:
-                kwargs["export_custom_properties"] = True
-            if "custom_properties_namespace" in export_props:
-                kwargs["custom_properties_namespace"] = ""
-            if "author_blender_name" in export_props:
-                kwargs["author_blender_name"] = False
-            if "convert_world_material" in export_props:
-                kwargs["convert_world_material"] = False
-            if "export_meshes" in export_props:
-                kwargs["export_meshes"] = True
-            if "export_lights" in export_props:
-                kwargs["export_lights"] = True
-            if "export_cameras" in export_props:
-                kwargs["export_cameras"] = True
-            if "export_curves" in export_props:
-                kwargs["export_curves"] = True
-            if "export_points" in export_props:
-                kwargs["export_points"] = True
-            if "export_volumes" in export_props:
-                kwargs["export_volumes"] = True
-            if "merge_parent_xform" in export_props:
-                kwargs["merge_parent_xform"] = True
-            if "convert_scene_unit" in export_props:
-                kwargs["convert_scene_unit"] = "METERS"
-            if "meters_per_unit" in export_props:
-                kwargs["meters_per_unit"] = 1.0
-                
-            bpy.ops.wm.usd_export(filepath=pub_filepath, **kwargs)
-
-            # If exported as stage.usda, rename it to stage.usd so it is always stage.usd on disk
-            final_pub_filepath = os.path.join(version_dir, "stage.usd")
-            if not export_as_usdc:
-                if os.path.exists(pub_filepath):
-                    if os.path.exists(final_pub_filepath):
-                        os.remove(final_pub_filepath)
-                    os.rename(pub_filepath, final_pub_filepath)
             
-            pub_filepath = final_pub_filepath
-            pub_filename = "stage.usd"
+            # The publish profile picks the exporter settings; it may force binary USDC
+            profile_name = context.scene.studiotools_publish_profile
+            profile = publish_profiles.get_profile(profile_name)
+            export_as_usdc = profile.get("export_as_usdc", context.scene.studiotools_export_usdc)
+            # Decimation modifies the meshes it exports, so it only ever happens in a headless worker's copy
+            decimated = 0.0 < (profile.get("decimate_ratio") or 1.0) < 1.0
+            if decimated and not current_blend:
+                self.report({'ERROR'}, f"Save the file first: the '{profile_name}' profile decimates meshes and is published in the background.")
+                return {'CANCELLED'}
+            # Chunked animation exports wait on their worker processes, so they are published in the background too
+            chunked = use_animation_clips(context.scene.studiotools_export_animation, context.scene.studiotools_chunked_animation)
+            if chunked and not current_blend:
+                self.report({'ERROR'}, "Save the file first: chunked animation exports are published in the background.")
+                return {'CANCELLED'}
+            
+            # Fingerprint the exportable scene: re-publishing identical content does not create a new version
+            scene_fingerprint = None
+            with prof.stage("fingerprint"):
+                try:
+                    scene_fingerprint = get_publish_fingerprint(context.scene, export_as_usdc, context.scene.studiotools_export_animation, profile_name)
+                except Exception as fe:
+                    print(f"[Studio Tools] Warning: Failed to fingerprint scene: {fe}")
+            if context.scene.studiotools_skip_unchanged:
+                unchanged = find_unchanged_publish(asset_versions_dir, scene_fingerprint)
+                if unchanged:
+                    return self.skip_unchanged(context, prof, task_path, asset_prefix, *unchanged)
+            
+            # Claim the version folder atomically so concurrent publishes never share a version, and write
+            # into a private staging folder that replaces the claim once the publish is complete
+            version, version_dir = versioning.claim_next_version(asset_versions_dir)
+            version_folder = os.path.join(asset_prefix, os.path.basename(version_dir))
+            staging_dir = versioning.create_staging_dir(version_dir)
+            
+            if (context.scene.studiotools_async_publish or decimated or chunked) and current_blend:
+                with prof.stage("save_workfile"):
+                    bpy.ops.wm.save_mainfile()
+                return self.publish_async(context, prof, task_path, current_blend, asset_prefix, version, version_folder, version_dir, staging_dir, scene_fingerprint)
+            
+            # 4. Export scene as USD (one layer per root object in incremental mode)
+            with prof.stage("usd_export", outputs=[os.path.join(staging_dir, "stage.usd"), os.path.join(staging_dir, LAYERS_DIR_NAME)]):
+                if context.scene.studiotools_incremental_publish:
+                    pub_filepath = export_publish_usd_incremental(staging_dir, get_previous_version_dir(asset_versions_dir, version), export_as_usdc, context.scene.studiotools_export_animation, profile_name)
+                else:
+                    pub_filepath = export_publish_usd(staging_dir, export_as_usdc, context.scene.studiotools_export_animation, profile_name)
+            pub_filename = os.path.basename(pub_filepath)
 
             # 4b. Capture the current 3D viewport as thumbnail.png
-            thumb_path = os.path.join(version_dir, "thumbnail.png")
+            with prof.stage("thumbnail", outputs=[os.path.join(staging_dir, "thumbnail.png")]):
+                capture_thumbnail(bpy.context.scene, staging_dir)
+
+            # 4c. Write the published scene.blend straight into the version directory
+            blend_copy_path = os.path.join(staging_dir, "scene.blend")
             try:
-                scene = bpy.context.scene
-                # Stash original render output settings
-                orig_filepath       = scene.render.filepath
-                orig_format         = scene.render.image_settings.file_format
-                orig_res_x          = scene.render.resolution_x
-                orig_res_y          = scene.render.resolution_y
-                orig_res_pct        = scene.render.resolution_percentage
-                orig_use_overwrite  = scene.render.use_overwrite
-
-                # Configure for a compact 960×540 PNG thumbnail
-                scene.render.filepath                    = thumb_path
-                scene.render.image_settings.file_format = "PNG"
-                scene.render.resolution_x               = 960
-                scene.render.resolution_y               = 540
-                scene.render.resolution_percentage      = 100
-                scene.render.use_overwrite               = True
-
-                # Render the OpenGL viewport (uses current shading / camera / view)
-                bpy.ops.render.opengl(write_still=True)
-
-                # Restore all original settings
-                scene.render.filepath                    = orig_filepath
-                scene.render.image_settings.file_format = orig_format
-                scene.render.resolution_x               = orig_res_x
-                scene.render.resolution_y               = orig_res_y
-                scene.render.resolution_percentage      = orig_res_pct
-                scene.render.use_overwrite               = orig_use_overwrite
-
-                print(f"[Studio Tools] Saved viewport thumbnail: {thumb_path}")
-            except Exception as thumb_err:
-                print(f"[Studio Tools] Warning: Could not capture viewport thumbnail: {thumb_err}")
-
-            # Save a copy of the active .blend file inside the version directory
-            if current_blend and os.path.exists(current_blend):
-                blend_copy_name = "scene.blend"
-                blend_copy_path = os.path.join(version_dir, blend_copy_name)
-                try:
-                    # Temporarily convert relative paths to absolute so the copied file's links don't break
-                    bpy.ops.file.make_paths_absolute()
-                    bpy.ops.wm.save_mainfile()
-                    
-                    # Copy the file with absolute paths
-                    shutil.copy2(current_blend, blend_copy_path)
-                    print(f"[Studio Tools] Exported .blend copy with absolute library paths to: {blend_copy_path}")
-                    
-                    # Revert active file back to relative paths for portability
-                    bpy.ops.file.make_paths_relative()
-                    bpy.ops.wm.save_mainfile()
-                except Exception as bce:
-                    print(f"[Studio Tools] Warning: Failed to export .blend copy: {bce}")
-                    # Attempt cleanup of paths if something failed
-                    try:
-                        bpy.ops.file.make_paths_relative()
-                        bpy.ops.wm.save_mainfile()
-                    except Exception:
-                        pass
-            
-            # 5. Write metadata
-            meta_path = os.path.join(version_dir, "metadata.yaml")
-            exported_objs = [obj.name for obj in bpy.context.scene.objects if not obj.parent]
-            
-            meta_data = {
-                "type": "usd_publish",
-                "application": "blender",
-                "application_version": os.environ.get("ST_APP_VERSION") or bpy.app.version_string,
-                "source_scene": current_blend if current_blend else "",
-                "source_file": os.path.basename(current_blend) if current_blend else "unsaved.blend",
-                "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "user": os.environ.get("USER", "artist"),
-                "exported_root_objects": exported_objs
-            }
-            write_simple_yaml(meta_path, meta_data)
+                with prof.stage("blend_write", outputs=[blend_copy_path]):
+                    write_published_blend(blend_copy_path)
+                print(f"[Studio Tools] Exported .blend with absolute library paths to: {blend_copy_path}")
+            except Exception as bce:
+                print(f"[Studio Tools] Warning: Failed to export .blend copy: {bce}")
+            
+            # 5. Version up the WIP scene file (Save-up on publish). This is the publish's only save of the
+            # workfile, so the new WIP version holds exactly the published state.
+            with prof.stage("wip_save_up"):
+                wip_version_msg = self.version_up_wip(task_path)
+            if wip_version_msg:
+                current_blend = bpy.data.filepath
+            
+            # 6. Write metadata
+            meta_path = os.path.join(staging_dir, "metadata.yaml")
+            with prof.stage("metadata", outputs=[meta_path]):
+                exported_objs = [obj.name for obj in bpy.context.scene.objects if not obj.parent]
+                write_simple_yaml(meta_path, get_publish_metadata(current_blend, exported_objs, scene_fingerprint, profile_name))
+            
+            # Share identical payloads with earlier publishes through the sandbox blob store
+            with prof.stage("dedupe"):
+                blobstore.ingest_version(staging_dir, asset_index.get_sandbox_dir(task_path))
+            
+            # The complete version replaces its claim in one rename
+            versioning.promote_staging_dir(staging_dir, version_dir)
+            version_dir = staging_dir = None
             
             # Create symlink if "Mark as Published" is checked
-            mark_as_published = context.scene.studiotools_mark_as_published
-            if mark_as_published:
-                published_dir = os.path.join(task_path, "published")
-                os.makedirs(published_dir, exist_ok=True)
-                symlink_path = os.path.join(published_dir, asset_prefix)
-                
-                if os.path.islink(symlink_path) or os.path.exists(symlink_path):
-                    if os.path.isdir(symlink_path) and not os.path.islink(symlink_path):
-                        shutil.rmtree(symlink_path)
-                    else:
-                        os.remove(symlink_path)
-                        
-                src = os.path.join("..", "versions", version_folder)
-                try:
-                    os.symlink(src, symlink_path)
-                    print(f"[Studio Tools] Created published symlink: {symlink_path} -> {src}")
-                except Exception as se:
-                    print(f"[Studio Tools] Warning: Failed to create symlink: {se}")
+            if context.scene.studiotools_mark_as_published:
+                with prof.stage("symlink"):
+                    mark_version_published(task_path, asset_prefix, version_folder)
             
-            # 6. Version up the WIP scene file (Save-up on publish)
-            wip_version_msg = ""
-            try:
-                current_blend = bpy.data.filepath
-                wip_dir = os.path.dirname(current_blend) if current_blend else os.path.join(task_path, "wip", "blender")
-                
-                # Determine next wip version
-                wip_version = 1
-                if os.path.exists(wip_dir):
-                    for f in os.listdir(wip_dir):
-                        match = re.search(r"scene_v(\d+)\.blend", f, re.IGNORECASE)
-                        if match:
-                            wip_version = max(wip_version, int(match.group(1)) + 1)
-                
-                new_wip_filename = f"scene_v{wip_version:03d}.blend"
-                new_wip_path = os.path.abspath(os.path.join(wip_dir, new_wip_filename))
-                
-                bpy.ops.wm.save_as_mainfile(filepath=new_wip_path)
-                wip_version_msg = f"WIP Versioned Up: {new_wip_filename}"
-                print(f"[Studio Tools] Versioned up WIP scene file to: {new_wip_path}")
-            except Exception as ve:
-                print(f"[Studio Tools] Warning: Failed to version up WIP scene file: {ve}")
+            prof.write(asset=asset_prefix, version=version)
+            show_timings = context.scene.studiotools_show_timings
+            if show_timings:
+                prof.print_summary()
                 
+            panel_state.request_refresh()
             self.report({'INFO'}, f"Successfully published USD asset: {pub_filename}")
             
             # Show success dialog popup inside Blender
@@ -550,13 +668,149 @@ class WM_OT_studiotools_publish_usd(Operator):
                 if wip_version_msg:
                     self.layout.label(text=wip_version_msg, icon='FILE_BLEND')
                 self.layout.label(text=f"Metadata saved to: {os.path.basename(meta_path)}")
+                if show_timings:
+                    for line in prof.summary_lines():
+                        self.layout.label(text=line, icon='TIME')
             
             context.window_manager.popup_menu(draw_popup, title="Publish Successful", icon='INFO')
             return {'FINISHED'}
         except Exception as e:
+            # Release the claim even if its staging folder was never created, or its version number is lost
+            if version_dir:
+                versioning.abandon_claim(version_dir, staging_dir)
             self.report({'ERROR'}, f"Failed to publish USD: {str(e)}")
             return {'CANCELLED'}
 
+    def skip_unchanged(self, context, prof, task_path, asset_prefix, version, version_name):
+        """Finishes a publish whose content matches the latest version, only repointing published/ if needed."""
+        version_folder = os.path.join(asset_prefix, version_name)
+        repointed = False
+        if context.scene.studiotools_mark_as_published:
+            symlink_path = os.path.join(task_path, "published", asset_prefix)
+            version_dir = os.path.join(task_path, "versions", version_folder)
+            if os.path.realpath(symlink_path) != os.path.realpath(version_dir):
+                with prof.stage("symlink"):
+                    mark_version_published(task_path, asset_prefix, version_folder)
+                repointed = True
+        
+        prof.write(asset=asset_prefix, version=version, skipped=True)
+        if context.scene.studiotools_show_timings:
+            prof.print_summary()
+        panel_state.request_refresh()
+        message = f"Scene unchanged since {asset_prefix} {version_name}, skipped publish"
+        if repointed:
+            message += f" (published/{asset_prefix} now points to {version_name})"
+        self.report({'INFO'}, message)
+        return {'FINISHED'}
+
+    def publish_async(self, context, prof, task_path, current_blend, asset_prefix, version, version_folder, version_dir, staging_dir, scene_fingerprint=None):
+        """Hands the export, metadata and symlink to a headless Blender worker and returns control to the artist."""
+        scene = context.scene
+        
+        # The thumbnail needs the artist's viewport, so it is the only render done in-session
+        with prof.stage("thumbnail", outputs=[os.path.join(staging_dir, "thumbnail.png")]):
+            capture_thumbnail(scene, staging_dir)
+        
+        jobs_dir = os.path.join(task_path, ".studiotools", "jobs")
+        os.makedirs(jobs_dir, exist_ok=True)
+        job_name = f"publish_{asset_prefix}_v{version:03d}"
+        job_path = os.path.join(jobs_dir, f"{job_name}.json")
+        job_data = {
+            "task_path": task_path,
+            "source_blend": current_blend,
+            "asset_prefix": asset_prefix,
+            "version_folder": version_folder,
+            "version_dir": version_dir,
+            "staging_dir": staging_dir,
+            "export_as_usdc": publish_profiles.get_profile(scene.studiotools_publish_profile).get("export_as_usdc", scene.studiotools_export_usdc),
+            "publish_profile": scene.studiotools_publish_profile,
+            "export_animation": scene.studiotools_export_animation,
+            "mark_as_published": scene.studiotools_mark_as_published,
+            "status_path": os.path.join(jobs_dir, f"{job_name}.status.json"),
+            "show_timings": scene.studiotools_show_timings,
+            "fingerprint": scene_fingerprint,
+            "incremental_publish": scene.studiotools_incremental_publish,
+            "chunked_animation": scene.studiotools_chunked_animation,
+            "clip_chunk_size": scene.studiotools_clip_chunk_size,
+            "clip_processes": scene.studiotools_clip_processes,
+            "previous_version_dir": get_previous_version_dir(os.path.dirname(version_dir), version),
+        }
+        with open(job_path, "w", encoding="utf-8") as f:
+            json.dump(job_data, f, indent=2)
+        
+        def on_finish(job):
+            if job.state == jobs.DONE:
+                print(f"[Studio Tools] Background publish finished: {version_dir}")
+            else:
+                print(f"[Studio Tools] Warning: Background publish failed, see log: {job.log_path}")
+                # Release the claimed version in case the worker died before cleaning up
+                versioning.abandon_claim(version_dir, staging_dir)
+            refresh_published_assets(background=True)
+            panel_state.request_refresh()
+        
+        # The worker reads the file saved above. The WIP save-up below moves this session on to the
+        # next workfile, so the worker's source stays untouched while the artist keeps working.
+        # It keeps user preferences so drivers and add-ons export as they would in a foreground publish.
+        jobs.set_pool_size("publish", scene.studiotools_publish_workers)
+        worker_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "publish_worker.py")
+        jobs.submit(jobs.Job(
+            label=f"Publish {asset_prefix} v{version:03d}",
+            argv=jobs.blender_command(current_blend, worker_script, [job_path], factory_startup=False),
+            log_path=os.path.join(jobs_dir, f"{job_name}.log"),
+            pool="publish",
+            status_path=job_data["status_path"],
+            on_finish=on_finish,
+        ))
+        
+        with prof.stage("wip_save_up"):
+            wip_version_msg = self.version_up_wip(task_path)
+        
+        prof.write(asset=asset_prefix, version=version, mode="async")
+        show_timings = scene.studiotools_show_timings
+        if show_timings:
+            prof.print_summary()
+        panel_state.request_refresh()
+        self.report({'INFO'}, f"Queued background publish of {asset_prefix} v{version:03d}")
+        
+        def draw_popup(self, context):
+            self.layout.label(text=f"Queued Publish: {asset_prefix} v{version:03d}", icon='TIME')
+            self.layout.label(text="Progress is shown in the Studio Tools panel.")
+            if wip_version_msg:
+                self.layout.label(text=wip_version_msg, icon='FILE_BLEND')
+            if show_timings:
+                for line in prof.summary_lines():
+                    self.layout.label(text=line, icon='TIME')
+        
+        context.window_manager.popup_menu(draw_popup, title="Publish Queued", icon='INFO')
+        return {'FINISHED'}
+
+    def version_up_wip(self, task_path):
+        """Saves the session as the next WIP workfile version. Returns a message for the publish popup."""
+        try:
+            current_blend = bpy.data.filepath
+            wip_dir = os.path.dirname(current_blend) if current_blend else os.path.join(task_path, "wip", "blender")
+            
+            # Determine next wip version
+            wip_version = versioning.next_version(wip_dir, versioning.WIP_SCENE_PATTERN, dirs_only=False)
+            new_wip_filename = f"scene_v{wip_version:03d}.blend"
+            new_wip_path = os.path.abspath(os.path.join(wip_dir, new_wip_filename))
+            
+            bpy.ops.wm.save_as_mainfile(filepath=new_wip_path)
+            print(f"[Studio Tools] Versioned up WIP scene file to: {new_wip_path}")
+            return f"WIP Versioned Up: {new_wip_filename}"
+        except Exception as ve:
+            print(f"[Studio Tools] Warning: Failed to version up WIP scene file: {ve}")
+            return ""
+
+def use_animation_clips(export_animation, chunked_animation):
+    """Whether an animated publish is exported in parallel chunks assembled with USD value clips."""
+    if not (export_animation and chunked_animation):
+        return False
+    if not usd_clips.can_stitch():
+        print("[Studio Tools] Warning: USD Python API not available, exporting animation in a single pass.")
+        return False
+    return True
+
 def capture_thumbnail(scene, version_dir):
     """Captures a viewport thumbnail using OpenGL render and saves it as thumbnail.png."""
     thumb_path = os.path.join(version_dir, "thumbnail.png")
@@ -591,43 +845,44 @@ def capture_thumbnail(scene, version_dir):
     except Exception as thumb_err:
         print(f"[Studio Tools] Warning: Failed to capture render thumbnail: {thumb_err}")
 
+def get_render_metadata(scene, version_int, start_frame, end_frame, render_type):
+    """Builds a pipeline-compliant metadata.yaml dictionary describing a render."""
+    current_blend = bpy.data.filepath
+    render_name = scene.studiotools_render_name.strip()
+    render_name = re.sub(r"[^a-zA-Z0-9_]", "_", render_name)
+    
+    if render_type == 'playblast':
+        file_format = "jpg"
+        codec = "quality_90"
+        color_depth = "8"
+        type_val = "blender_playblast"
+    else:
+        file_format = "exr"
+        codec = "DWAA"
+        color_depth = "16"
+        type_val = "blender_render"
+        
+    return {
+        "type": type_val,
+        "application": "blender",
+        "application_version": os.environ.get("ST_APP_VERSION") or bpy.app.version_string,
+        "source_scene": current_blend if current_blend else "",
+        "source_file": os.path.basename(current_blend) if current_blend else "unsaved.blend",
+        "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "user": os.environ.get("USER", "artist"),
+        "render_name": render_name,
+        "version": version_int,
+        "frame_range": f"{start_frame}-{end_frame}",
+        "file_format": file_format,
+        "codec": codec,
+        "color_depth": color_depth
+    }
+
 def write_metadata(context, version_dir, render_path, version_int, start_frame, end_frame, render_type):
     """Writes a pipeline-compliant metadata.yaml describing the render."""
     try:
-        scene = context.scene
-        current_blend = bpy.data.filepath
-        render_name = scene.studiotools_render_name.strip()
-        render_name = re.sub(r"[^a-zA-Z0-9_]", "_", render_name)
-        
         meta_path = os.path.join(version_dir, "metadata.yaml")
-        
-        if render_type == 'playblast':
-            file_format = "jpg"
-            codec = "quality_90"
-            color_depth = "8"
-            type_val = "blender_playblast"
-        else:
-            file_format = "exr"
-            codec = "DWAA"
-            color_depth = "16"
-            type_val = "blender_render"
-            
-        meta_data = {
-            "type": type_val,
-            "application": "blender",
-            "application_version": os.environ.get("ST_APP_VERSION") or bpy.app.version_string,
-            "source_scene": current_blend if current_blend else "",
-            "source_file": os.path.basename(current_blend) if current_blend else "unsaved.blend",
-            "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "user": os.environ.get("USER", "artist"),
-            "render_name": render_name,
-            "version": version_int,
-            "frame_range": f"{start_frame}-{end_frame}",
-            "file_format": file_format,
-            "codec": codec,
-            "color_depth": color_depth
-        }
-        write_simple_yaml(meta_path, meta_data)
+        write_simple_yaml(meta_path, get_render_metadata(context.scene, version_int, start_frame, end_frame, render_type))
         print(f"[Studio Tools] Wrote render metadata to {meta_path}")
     except Exception as meta_err:
         print(f"[Studio Tools] Warning: Failed to write metadata.yaml for render: {meta_err}")
@@ -657,9 +912,11 @@ class WM_OT_studiotools_render_still(Operator):
 
         # Configure render settings
         setup_render_settings(scene, 'exr', filepath)
+        prof = profiling.Profiler("render_still", task_path)
 
         # Capture viewport thumbnail first
-        capture_thumbnail(scene, version_dir)
+        with prof.stage("thumbnail", outputs=[os.path.join(version_dir, "thumbnail.png")]):
+            capture_thumbnail(scene, version_dir)
 
         # Render the current frame using animation=True so frame padding is preserved
         current_frame = scene.frame_current
@@ -671,7 +928,8 @@ class WM_OT_studiotools_render_still(Operator):
 
         print(f"[Studio Tools] Initiating render still frame {current_frame}: {filepath}")
         try:
-            bpy.ops.render.render(animation=True)
+            with prof.stage("render", outputs=[version_dir]):
+                bpy.ops.render.render(animation=True)
         except Exception as render_err:
             self.report({'ERROR'}, f"Render failed: {str(render_err)}")
             # Restore original frames
@@ -684,8 +942,13 @@ class WM_OT_studiotools_render_still(Operator):
         scene.frame_end = orig_end
 
         # Write metadata
-        write_metadata(context, version_dir, filepath, version, current_frame, current_frame, 'exr')
+        with prof.stage("metadata"):
+            write_metadata(context, version_dir, filepath, version, current_frame, current_frame, 'exr')
+        prof.write(render=os.path.basename(os.path.dirname(version_dir)), version=version)
+        if scene.studiotools_show_timings:
+            prof.print_summary()
 
+        panel_state.request_refresh()
         self.report({'INFO'}, f"Render still frame completed successfully!")
 
         # Show success dialog
@@ -723,21 +986,39 @@ class WM_OT_studiotools_render_sequence(Operator):
 
         # Configure render settings
         setup_render_settings(scene, 'exr', filepath)
+        prof = profiling.Profiler("render_sequence", task_path)
         
         # Capture viewport thumbnail first
-        capture_thumbnail(scene, version_dir)
+        with prof.stage("thumbnail", outputs=[os.path.join(version_dir, "thumbnail.png")]):
+            capture_thumbnail(scene, version_dir)
+        
+        if scene.studiotools_render_queue:
+            return submit_render_queue(self, context, task_path, version, version_dir, filepath, claimed=True, prof=prof)
             
+        # Record the frame range up front, so a resume after a crash renders the same frames
+        render_manifest.record_range(version_dir, scene.frame_start, scene.frame_end, scene.frame_step)
+        
         # Trigger Blender render animation (blocks until finished)
         print(f"[Studio Tools] Initiating render sequence: {filepath}")
         try:
-            bpy.ops.render.render(animation=True)
+            with prof.stage("render", outputs=[version_dir]):
+                bpy.ops.render.render(animation=True)
         except Exception as render_err:
             self.report({'ERROR'}, f"Render failed: {str(render_err)}")
             return {'CANCELLED'}
             
+        # Record the rendered frames so a later resume only has to check what changed
+        with prof.stage("frame_manifest"):
+            render_manifest.scan_frames(filepath, range(scene.frame_start, scene.frame_end + 1, scene.frame_step), version_dir)
+        
         # Write pipeline metadata
-        write_metadata(context, version_dir, filepath, version, scene.frame_start, scene.frame_end, 'exr')
+        with prof.stage("metadata"):
+            write_metadata(context, version_dir, filepath, version, scene.frame_start, scene.frame_end, 'exr')
+        prof.write(render=os.path.basename(os.path.dirname(version_dir)), version=version)
+        if scene.studiotools_show_timings:
+            prof.print_summary()
             
+        panel_state.request_refresh()
         self.report({'INFO'}, f"Render sequence completed successfully!")
         
         # Show success dialog
@@ -750,6 +1031,173 @@ class WM_OT_studiotools_render_sequence(Operator):
         context.window_manager.popup_menu(draw_popup, title="Render Success", icon='INFO')
         return {'FINISHED'}
 
+def submit_render_queue(operator, context, task_path, version, version_dir, filepath, claimed=False, frame_range=None, prof=None):
+    """
+    Splits the frame range into chunks rendered by a pool of headless Blender processes.
+    claimed: version_dir was newly claimed for this render and is released if the queue cannot start.
+    frame_range: (frame_start, frame_end, frame_step) to render instead of the scene's range.
+    prof: the operation's Profiler; its record is written once the queue finishes.
+    """
+    scene = context.scene
+    prof = prof or profiling.Profiler("render_sequence", task_path)
+    frame_start, frame_end, frame_step = frame_range or (scene.frame_start, scene.frame_end, scene.frame_step)
+    jobs_dir = os.path.join(task_path, ".studiotools", "jobs")
+    os.makedirs(jobs_dir, exist_ok=True)
+    render_folder = os.path.basename(os.path.dirname(version_dir))
+    
+    # Render from a snapshot of the scene (with the output settings above) so the artist can keep working.
+    # Placeholders without overwrite let retried or resumed chunks skip frames that already exist.
+    source_blend = os.path.join(jobs_dir, f"render_{render_folder}_v{version:03d}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.blend")
+    orig_use_placeholder = scene.render.use_placeholder
+    orig_use_overwrite = scene.render.use_overwrite
+    try:
+        scene.render.use_placeholder = True
+        scene.render.use_overwrite = False
+        with prof.stage("snapshot", outputs=[source_blend]):
+            bpy.ops.wm.save_as_mainfile(filepath=source_blend, copy=True, relative_remap=True)
+    except Exception as save_err:
+        if claimed:
+            # Only the thumbnail was written into the new version: release it so its number is not lost
+            try:
+                os.remove(os.path.join(version_dir, "thumbnail.png"))
+            except OSError:
+                pass
+            versioning.abandon_claim(version_dir)
+        operator.report({'ERROR'}, f"Failed to save render snapshot: {str(save_err)}")
+        return {'CANCELLED'}
+    finally:
+        scene.render.use_placeholder = orig_use_placeholder
+        scene.render.use_overwrite = orig_use_overwrite
+    
+    show_timings = scene.studiotools_show_timings
+    
+    def on_finish(queue, failed, missing):
+        # The chunks ran in other processes: the render stage is the queue's wall time
+        prof.record("render", time.perf_counter() - queue.submitted_at)
+        prof.write(render=render_folder, version=version, mode="queue", chunks=len(queue.chunk_jobs),
+                   failed_chunks=len(failed), missing_frames=len(missing))
+        if show_timings:
+            prof.print_summary()
+    
+    queue = render_queue.RenderQueue(
+        label=f"Render {render_folder} v{version:03d}",
+        source_blend=source_blend,
+        filepath=filepath,
+        version_dir=version_dir,
+        frame_start=frame_start,
+        frame_end=frame_end,
+        frame_step=frame_step,
+        metadata=get_render_metadata(scene, version, frame_start, frame_end, 'exr'),
+        logs_dir=jobs_dir,
+        on_finish=on_finish,
+    )
+    jobs.set_pool_size(render_queue.POOL, scene.studiotools_render_processes)
+    queue.submit(scene.studiotools_render_chunk_size, scene.studiotools_render_threads)
+    panel_state.request_refresh()
+    
+    chunk_count = len(queue.chunk_jobs)
+    operator.report({'INFO'}, f"Queued {chunk_count} render chunks for v{version:03d}")
+    
+    def draw_popup(self, context):
+        self.layout.label(text="Render Queued!", icon='TIME')
+        self.layout.label(text=f"Folder: v{version:03d}")
+        self.layout.label(text=f"Frames: {frame_start} - {frame_end} in {chunk_count} chunks")
+        self.layout.label(text=f"Processes: {scene.studiotools_render_processes}")
+        
+    context.window_manager.popup_menu(draw_popup, title="Render Queue", icon='INFO')
+    return {'FINISHED'}
+
+class WM_OT_studiotools_resume_render(Operator):
+    """Resume the latest sequence render version, rendering only missing or corrupt frames."""
+    bl_idname = "wm.studiotools_resume_render"
+    bl_label = "Resume Render"
+    bl_description = "Re-use the latest render version folder and render only its missing or corrupt frames"
+
+    def execute(self, context):
+        task_path = os.environ.get("ST_CWD")
+        if not task_path:
+            self.report({'ERROR'}, "ST_CWD environment variable not set.")
+            return {'CANCELLED'}
+
+        scene = context.scene
+        render_name = scene.studiotools_render_name.strip()
+        if not render_name:
+            self.report({'ERROR'}, "Please specify a Render Name.")
+            return {'CANCELLED'}
+
+        version, version_dir, filename, filepath = get_render_version_and_paths(
+            task_path, render_name, 'exr', resume=True
+        )
+        if not os.path.isdir(version_dir):
+            self.report({'ERROR'}, f"No render version of '{render_name}' to resume.")
+            return {'CANCELLED'}
+
+        # Resume the range the interrupted render was started with, whatever the scene's range is now
+        frame_range = render_manifest.get_range(version_dir)
+        if frame_range is None:
+            self.report({'ERROR'}, f"Render v{version:03d} has no recorded frame range to resume.")
+            return {'CANCELLED'}
+        frame_start, frame_end, frame_step = frame_range
+        frames = range(frame_start, frame_end + 1, frame_step)
+        complete, missing, corrupt, in_progress = render_manifest.scan_frames(filepath, frames, version_dir)
+        # Corrupt frames and stale placeholders must go, otherwise no-overwrite rendering would skip them
+        render_manifest.remove_frames(filepath, corrupt)
+        print(f"[Studio Tools] Resuming v{version:03d}: {len(complete)} complete, {len(missing)} missing, "
+              f"{len(corrupt)} corrupt, {len(in_progress)} rendering elsewhere")
+
+        if not missing and not corrupt:
+            if not in_progress:
+                write_metadata(context, version_dir, filepath, version, frame_start, frame_end, 'exr')
+                self.report({'INFO'}, f"Render v{version:03d} is already complete.")
+            else:
+                self.report({'INFO'}, f"Remaining {len(in_progress)} frames of v{version:03d} are rendering in other sessions.")
+            return {'FINISHED'}
+
+        setup_render_settings(scene, 'exr', filepath)
+
+        if scene.studiotools_render_queue:
+            return submit_render_queue(self, context, task_path, version, version_dir, filepath, frame_range=frame_range,
+                                       prof=profiling.Profiler("resume_render", task_path))
+
+        # Placeholders without overwrite skip finished frames and let several sessions fill the gaps concurrently.
+        # Our placeholders are recorded as owned by this session, with a per-frame heartbeat for other hosts.
+        owner_path = render_manifest.claim_frames(version_dir, missing + corrupt)
+
+        def heartbeat(scene, *args):
+            render_manifest.touch_owner(owner_path)
+
+        orig_use_placeholder = scene.render.use_placeholder
+        orig_use_overwrite = scene.render.use_overwrite
+        orig_range = (scene.frame_start, scene.frame_end, scene.frame_step)
+        scene.render.use_placeholder = True
+        scene.render.use_overwrite = False
+        scene.frame_start, scene.frame_end, scene.frame_step = frame_range
+        bpy.app.handlers.render_write.append(heartbeat)
+        print(f"[Studio Tools] Resuming render sequence: {filepath}")
+        try:
+            bpy.ops.render.render(animation=True)
+        except Exception as render_err:
+            render_manifest.remove_placeholders(filepath, missing + corrupt, version_dir)
+            self.report({'ERROR'}, f"Render failed: {str(render_err)}")
+            return {'CANCELLED'}
+        finally:
+            bpy.app.handlers.render_write.remove(heartbeat)
+            render_manifest.release_frames(owner_path)
+            scene.render.use_placeholder = orig_use_placeholder
+            scene.render.use_overwrite = orig_use_overwrite
+            scene.frame_start, scene.frame_end, scene.frame_step = orig_range
+
+        complete, missing, corrupt, in_progress = render_manifest.scan_frames(filepath, frames, version_dir)
+        if missing or corrupt or in_progress:
+            panel_state.request_refresh()
+            self.report({'WARNING'}, f"Render v{version:03d} still has {len(missing) + len(corrupt) + len(in_progress)} unfinished frames.")
+            return {'FINISHED'}
+
+        write_metadata(context, version_dir, filepath, version, frame_start, frame_end, 'exr')
+        panel_state.request_refresh()
+        self.report({'INFO'}, f"Render v{version:03d} resumed and completed.")
+        return {'FINISHED'}
+
 class WM_OT_studiotools_render_playblast(Operator):
     """Execute viewport animation capture as a JPEG sequence."""
     bl_idname = "wm.studiotools_render_playblast"
@@ -775,21 +1223,29 @@ class WM_OT_studiotools_render_playblast(Operator):
 
         # Configure render settings
         setup_render_settings(scene, 'playblast', filepath)
+        prof = profiling.Profiler("render_playblast", task_path)
 
         # Capture viewport thumbnail first
-        capture_thumbnail(scene, version_dir)
+        with prof.stage("thumbnail", outputs=[os.path.join(version_dir, "thumbnail.png")]):
+            capture_thumbnail(scene, version_dir)
 
         # Trigger Blender OpenGL animation capture (blocks until finished)
         print(f"[Studio Tools] Initiating playblast animation capture: {filepath}")
         try:
-            bpy.ops.render.opengl(animation=True)
+            with prof.stage("playblast", outputs=[version_dir]):
+                bpy.ops.render.opengl(animation=True)
         except Exception as render_err:
             self.report({'ERROR'}, f"Playblast failed: {str(render_err)}")
             return {'CANCELLED'}
 
         # Write pipeline metadata
-        write_metadata(context, version_dir, filepath, version, scene.frame_start, scene.frame_end, 'playblast')
+        with prof.stage("metadata"):
+            write_metadata(context, version_dir, filepath, version, scene.frame_start, scene.frame_end, 'playblast')
+        prof.write(render=os.path.basename(os.path.dirname(version_dir)), version=version)
+        if scene.studiotools_show_timings:
+            prof.print_summary()
 
+        panel_state.request_refresh()
         self.report({'INFO'}, f"Playblast sequence completed successfully!")
 
         # Show success dialog
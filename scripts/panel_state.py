@@ -0,0 +1,120 @@
+import os
+
+import utils
+
+try:
+    import bpy
+    IN_BLENDER = True
+except ImportError:
+    IN_BLENDER = False
+
+# Delay before a requested refresh runs, so bursts of invalidations collapse into one scan
+REFRESH_DEBOUNCE = 0.3
+# Background refresh cadence, to pick up versions written by other sessions
+PERIODIC_REFRESH_INTERVAL = 10.0
+
+# Filesystem-derived state drawn by VIEW3D_PT_studiotools_pipeline. Only ever replaced as a whole.
+_snapshot = {
+    "libraries": {},
+    "render": None,
+}
+
+
+def get_snapshot():
+    return _snapshot
+
+
+def _scan_library(lib):
+    """Resolves a directly linked library to its asset folder and available versions on disk."""
+    norm_path = os.path.abspath(bpy.path.abspath(lib.filepath))
+    # Resolve symlink path to find real asset/version folder on disk for HUD version logic
+    real_path = os.path.realpath(norm_path)
+    if "versions" not in real_path or not real_path.endswith("scene.blend"):
+        return None
+
+    lib_dir = os.path.dirname(real_path)
+    asset_dir = os.path.dirname(lib_dir)
+    return {
+        "filepath": lib.filepath,
+        "asset_name": os.path.basename(asset_dir),
+        "current_ver": os.path.basename(lib_dir),
+        # Check if the active linked path is the published symlink path
+        "is_published": "published" in norm_path,
+        # Only versions that can be swapped to: claimed or staging publishes have no scene.blend yet
+        "versions": utils.list_blend_versions(asset_dir),
+    }
+
+
+def _scan_render(render_name):
+    task_path = os.environ.get("ST_CWD")
+    if not task_path:
+        return None
+    previews = {"render_name": render_name}
+    for render_type in ('exr', 'playblast'):
+        version, version_dir, filename, _ = utils.get_render_version_and_paths(task_path, render_name, render_type, create_dirs=False)
+        previews[render_type] = (version, version_dir, filename)
+    return previews
+
+
+def refresh():
+    """Rebuilds the panel snapshot from disk and redraws the sidebar. Never called from draw()."""
+    global _snapshot
+    if not IN_BLENDER:
+        return
+    libraries = {}
+    for lib in bpy.data.libraries:
+        # We ONLY track libraries that were directly linked by StudioTools
+        if not lib.get("studiotools_direct", False):
+            continue
+        try:
+            libraries[lib.name] = _scan_library(lib)
+        except OSError as e:
+            print(f"[Studio Tools] Warning: Failed to scan linked library {lib.name}: {e}")
+
+    render = None
+    scene = bpy.context.scene
+    if scene is not None and hasattr(scene, "studiotools_render_name"):
+        render = _scan_render(scene.studiotools_render_name.strip() or "render")
+
+    _snapshot = {"libraries": libraries, "render": render}
+    tag_redraw()
+
+
+def tag_redraw():
+    wm = bpy.context.window_manager
+    if wm is None:
+        return
+    for window in wm.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                for region in area.regions:
+                    if region.type == 'UI':
+                        region.tag_redraw()
+
+
+def _refresh_timer():
+    try:
+        refresh()
+    except Exception as e:
+        print(f"[Studio Tools] Warning: Failed to refresh pipeline panel state: {e}")
+    return None
+
+
+def request_refresh(debounce=True):
+    """
+    Schedules a snapshot refresh off the draw path.
+    With debounce, a pending refresh is pushed back so repeated invalidations run a single scan;
+    without it (as used from draw), an already pending refresh is left alone.
+    """
+    if not IN_BLENDER:
+        return
+    if bpy.app.timers.is_registered(_refresh_timer):
+        if not debounce:
+            return
+        bpy.app.timers.unregister(_refresh_timer)
+    bpy.app.timers.register(_refresh_timer, first_interval=REFRESH_DEBOUNCE)
+
+
+def periodic_refresh_timer():
+    _refresh_timer()
+    return PERIODIC_REFRESH_INTERVAL
@@ -0,0 +1,140 @@
+import os
+import sys
+import json
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:
+    resource = None  # Not available on Windows
+
+PROFILE_LOG_NAME = "profile.jsonl"
+
+
+def _io_write_bytes():
+    """Bytes written by this process so far (Linux only), or None."""
+    try:
+        with open("/proc/self/io", "r") as f:
+            for line in f:
+                if line.startswith("wchar:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _peak_rss_mb():
+    """Peak resident set size of this process in MB, or None where unsupported."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    if sys.platform == "darwin":
+        return round(peak / (1024 * 1024), 1)
+    return round(peak / 1024, 1)
+
+
+def process_age_s():
+    """Seconds since this process was started (Linux only), or None."""
+    try:
+        with open("/proc/self/stat", "r") as f:
+            # Fields after the parenthesised command name; starttime is field 22 of the full line
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime", "r") as f:
+            uptime = float(f.read().split()[0])
+        return uptime - int(fields[19]) / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def _path_size(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    total = 0
+    for root, dirs, files in os.walk(path):
+        for f in files:
+            try:
+                total += os.path.getsize(os.path.join(root, f))
+            except OSError:
+                pass
+    return total
+
+
+class Profiler:
+    """Records wall time, bytes written and peak RSS for the stages of one operation."""
+
+    def __init__(self, operation, task_path=None):
+        self.operation = operation
+        self.task_path = task_path if task_path is not None else os.environ.get("ST_CWD")
+        self.stages = []
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name, outputs=()):
+        """
+        Times a stage. outputs are files or folders produced by the stage; their size is recorded
+        as output_bytes since process write counters are not available on every platform.
+        """
+        io_before = _io_write_bytes()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            record = {
+                "stage": name,
+                "wall_s": round(time.perf_counter() - started, 4),
+            }
+            io_after = _io_write_bytes()
+            if io_before is not None and io_after is not None:
+                record["io_write_bytes"] = io_after - io_before
+            if outputs:
+                record["output_bytes"] = sum(_path_size(p) for p in outputs if os.path.exists(p))
+            record["peak_rss_mb"] = _peak_rss_mb()
+            self.stages.append(record)
+
+    def record(self, name, wall_s):
+        """Adds a stage that was timed before the profiler existed (e.g. module imports)."""
+        self.stages.append({"stage": name, "wall_s": round(wall_s, 4), "peak_rss_mb": _peak_rss_mb()})
+
+    @property
+    def total_s(self):
+        return time.perf_counter() - self._started
+
+    def summary_lines(self):
+        lines = [f"{self.operation}: {self.total_s:.2f} s total"]
+        for record in self.stages:
+            line = f"  {record['stage']}: {record['wall_s']:.2f} s"
+            written = record.get("output_bytes") or record.get("io_write_bytes")
+            if written:
+                line += f", {written / (1024 * 1024):.1f} MB written"
+            lines.append(line)
+        return lines
+
+    def print_summary(self):
+        for line in self.summary_lines():
+            print(f"[Studio Tools] {line}")
+
+    def write(self, **extra):
+        """Appends this operation's record to the task's JSONL profile log."""
+        if not self.task_path:
+            return
+        record = {
+            "operation": self.operation,
+            "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "user": os.environ.get("USER", "artist"),
+            "pid": os.getpid(),
+            "total_s": round(self.total_s, 4),
+            "peak_rss_mb": _peak_rss_mb(),
+            "stages": self.stages,
+        }
+        record.update(extra)
+        log_path = os.path.join(self.task_path, ".studiotools", PROFILE_LOG_NAME)
+        try:
+            os.makedirs(os.path.dirname(log_path), exist_ok=True)
+            # A single short append per record keeps concurrent writers from interleaving lines
+            with open(log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+        except OSError as e:
+            print(f"[Studio Tools] Warning: Failed to write profile log: {e}")
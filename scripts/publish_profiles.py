@@ -0,0 +1,176 @@
+import os
+import json
+
+import asset_index
+
+try:
+    import bpy
+    IN_BLENDER = True
+except ImportError:
+    IN_BLENDER = False
+
+# Project profiles live next to the published asset index: <sandbox>/.studiotools/publish_profiles.json
+#   {"profiles": {"layout": {"base": "proxy", "description": "...", "decimate_ratio": 0.1}}}
+PROFILES_FILE_NAME = "publish_profiles.json"
+CAPABILITIES_FILE_NAME = "usd_export_capabilities.json"
+DEFAULT_PROFILE = "final"
+
+# Profile keys that are not USD exporter arguments
+PROFILE_KEYS = ("base", "description", "export_as_usdc", "decimate_ratio")
+
+# Full quality publish: everything the exporter can write
+FINAL_PROFILE = {
+    "description": "Full quality publish with materials, hair, volumes and custom properties",
+    "export_hair": True,
+    "export_uvmaps": True,
+    "rename_uvmaps": True,
+    "export_mesh_colors": True,
+    "export_normals": True,
+    "export_materials": True,
+    "export_subdivision": "BEST_MATCH",
+    "export_armatures": True,
+    "only_deform_bones": False,
+    "export_shapekeys": True,
+    "use_instancing": True,
+    "evaluation_mode": "RENDER",
+    "generate_preview_surface": True,
+    "generate_materialx_network": False,
+    "convert_orientation": True,
+    "export_custom_properties": True,
+    "custom_properties_namespace": "",
+    "author_blender_name": False,
+    "convert_world_material": False,
+    "export_meshes": True,
+    "export_lights": True,
+    "export_cameras": True,
+    "export_curves": True,
+    "export_points": True,
+    "export_volumes": True,
+    "merge_parent_xform": True,
+    "convert_scene_unit": "METERS",
+    "meters_per_unit": 1.0,
+}
+
+BUILTIN_PROFILES = {
+    "final": FINAL_PROFILE,
+    "proxy": {
+        "base": "final",
+        "description": "Lightweight binary cache for layout and animation: decimated, no materials or hair",
+        "export_as_usdc": True,
+        "decimate_ratio": 0.25,
+        "export_materials": False,
+        "generate_preview_surface": False,
+        "export_hair": False,
+        "export_volumes": False,
+        "export_mesh_colors": False,
+        "export_custom_properties": False,
+        "export_subdivision": "IGNORE",
+        "evaluation_mode": "VIEWPORT",
+    },
+}
+
+# Exporter property names, probed once per Blender version
+_exporter_properties = None
+# (mtime_ns, profiles) of the project profile file, keyed by sandbox directory
+_project_profiles = {}
+# Enum items handed to Blender, which requires a Python reference to be kept on them
+_items = []
+
+
+def _capabilities_path():
+    return os.path.join(bpy.utils.user_resource('CONFIG', path="studiotools"), CAPABILITIES_FILE_NAME)
+
+
+def get_exporter_properties():
+    """
+    Names of the properties the USD exporter of this Blender supports. Probed through RNA once per
+    Blender version and cached in memory and in the user config directory.
+    """
+    global _exporter_properties
+    if _exporter_properties is not None:
+        return _exporter_properties
+
+    version_key = bpy.app.version_string
+    cache_path = _capabilities_path()
+    cached = {}
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        pass
+    if version_key in cached:
+        _exporter_properties = frozenset(cached[version_key])
+        return _exporter_properties
+
+    _exporter_properties = frozenset(p.identifier for p in bpy.ops.wm.usd_export.get_rna_type().properties)
+    cached[version_key] = sorted(_exporter_properties)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cached, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"[Studio Tools] Warning: Failed to cache USD exporter capabilities: {e}")
+    return _exporter_properties
+
+
+def _load_project_profiles(sandbox_dir):
+    path = os.path.join(sandbox_dir, asset_index.INDEX_DIR_NAME, PROFILES_FILE_NAME)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return {}
+    cached = _project_profiles.get(sandbox_dir)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            profiles = json.load(f).get("profiles", {})
+    except (OSError, ValueError, AttributeError) as e:
+        print(f"[Studio Tools] Warning: Failed to read publish profiles {path}: {e}")
+        profiles = {}
+    _project_profiles[sandbox_dir] = (mtime_ns, profiles)
+    return profiles
+
+
+def get_profiles():
+    """Built-in profiles merged with the active project's profiles (which may override them)."""
+    profiles = dict(BUILTIN_PROFILES)
+    task_path = os.environ.get("ST_CWD")
+    if task_path:
+        for name, profile in _load_project_profiles(asset_index.get_sandbox_dir(task_path)).items():
+            # Overriding a built-in profile only replaces the settings it lists
+            profiles[name] = dict(BUILTIN_PROFILES.get(name, {}), **profile)
+    return profiles
+
+
+def get_profile(name):
+    """Resolves a profile and the profiles it is based on into one settings dict."""
+    profiles = get_profiles()
+    if name not in profiles:
+        print(f"[Studio Tools] Warning: Unknown publish profile '{name}', using '{DEFAULT_PROFILE}'.")
+        name = DEFAULT_PROFILE
+    chain = []
+    while name and name in profiles and name not in chain:
+        chain.append(name)
+        name = profiles[name].get("base", DEFAULT_PROFILE if name != DEFAULT_PROFILE else None)
+    settings = {}
+    for profile_name in reversed(chain):
+        settings.update(profiles[profile_name])
+    settings.pop("base", None)
+    return settings
+
+
+def get_exporter_settings(name):
+    """The USD exporter arguments of a profile, without the profile-only keys."""
+    return {k: v for k, v in get_profile(name).items() if k not in PROFILE_KEYS}
+
+
+def get_profile_items(self, context):
+    """EnumProperty callback listing the publish profiles of the active project."""
+    global _items
+    profiles = get_profiles()
+    names = [DEFAULT_PROFILE] + sorted(n for n in profiles if n != DEFAULT_PROFILE)
+    _items = [(n, n.replace("_", " ").title(), profiles[n].get("description", "")) for n in names]
+    return _items
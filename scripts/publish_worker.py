@@ -0,0 +1,93 @@
+"""
+Headless publish worker, run by WM_OT_studiotools_publish_usd in async mode:
+
+    blender -b <source.blend> --python publish_worker.py -- <job.json>
+
+Writes scene.blend, stage.usd and metadata.yaml into the job's staging folder, promotes it to the
+claimed version folder and optionally marks it as published. Progress is reported through the
+job's status file.
+"""
+import os
+import sys
+import json
+
+# Add scripts directory to sys.path so we can import our modules
+_this_dir = os.path.dirname(os.path.abspath(__file__))
+if _this_dir not in sys.path:
+    sys.path.append(_this_dir)
+
+import bpy
+
+import jobs
+import blobstore
+import asset_index
+import profiling
+import versioning
+import usd_clips
+from utils import export_publish_usd, export_publish_usd_incremental, LAYERS_DIR_NAME, get_publish_metadata, mark_version_published, write_published_blend, write_simple_yaml
+
+
+def run(job):
+    status_path = job["status_path"]
+    # Everything is written into the staging folder, which replaces the claimed version folder at the end
+    staging_dir = job["staging_dir"]
+    prof = profiling.Profiler("publish_usd_worker", job["task_path"])
+
+    jobs.write_status(status_path, 0.1, "Writing scene.blend")
+    blend_copy_path = os.path.join(staging_dir, "scene.blend")
+    with prof.stage("blend_copy", outputs=[blend_copy_path]):
+        write_published_blend(blend_copy_path)
+
+    jobs.write_status(status_path, 0.3, "Exporting USD")
+    with prof.stage("usd_export", outputs=[os.path.join(staging_dir, "stage.usd"), os.path.join(staging_dir, LAYERS_DIR_NAME), os.path.join(staging_dir, usd_clips.CLIPS_DIR_NAME)]):
+        if job["export_animation"] and job.get("chunked_animation") and usd_clips.can_stitch():
+            scene = bpy.context.scene
+            usd_clips.export_chunked(
+                job["source_blend"], staging_dir, scene.frame_start, scene.frame_end, scene.frame_step,
+                job["clip_chunk_size"], job["clip_processes"], job["export_as_usdc"], os.path.dirname(status_path), job["publish_profile"],
+            )
+        elif job.get("incremental_publish"):
+            export_publish_usd_incremental(staging_dir, job.get("previous_version_dir"), job["export_as_usdc"], job["export_animation"], job["publish_profile"])
+        else:
+            export_publish_usd(staging_dir, job["export_as_usdc"], job["export_animation"], job["publish_profile"])
+
+    jobs.write_status(status_path, 0.9, "Writing metadata")
+    meta_path = os.path.join(staging_dir, "metadata.yaml")
+    with prof.stage("metadata", outputs=[meta_path]):
+        exported_objs = [obj.name for obj in bpy.context.scene.objects if not obj.parent]
+        write_simple_yaml(meta_path, get_publish_metadata(job["source_blend"], exported_objs, job.get("fingerprint"), job["publish_profile"]))
+
+    jobs.write_status(status_path, 0.95, "Deduplicating")
+    with prof.stage("dedupe"):
+        blobstore.ingest_version(staging_dir, asset_index.get_sandbox_dir(job["task_path"]))
+
+    versioning.promote_staging_dir(staging_dir, job["version_dir"])
+    
+    if job["mark_as_published"]:
+        with prof.stage("symlink"):
+            mark_version_published(job["task_path"], job["asset_prefix"], job["version_folder"])
+
+    prof.write(asset=job["asset_prefix"], version_dir=job["version_dir"])
+    if job.get("show_timings"):
+        prof.print_summary()
+    jobs.write_status(status_path, 1.0, "Finished")
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    if not argv:
+        print("[Studio Tools] Publish worker: no job file given.")
+        sys.exit(1)
+    with open(argv[0], "r", encoding="utf-8") as f:
+        job = json.load(f)
+    try:
+        run(job)
+    except Exception as e:
+        print(f"[Studio Tools] Publish worker failed: {e}")
+        versioning.abandon_claim(job["version_dir"], job["staging_dir"])
+        jobs.write_status(job["status_path"], 1.0, f"Failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+import os
+import json
+import time
+import socket
+
+from utils import get_frame_path
+
+MANIFEST_NAME = "frames.json"
+# Leading bytes of a valid frame, by file extension
+FRAME_MAGIC = {
+    ".exr": b"\x76\x2f\x31\x01",
+    ".jpg": b"\xff\xd8\xff",
+    ".jpeg": b"\xff\xd8\xff",
+    ".png": b"\x89PNG",
+}
+# Renders record which frames they own in <version>/.owners/<host>_<pid>.json while they run, so
+# empty placeholder frames of a crashed session can be told apart from frames rendering elsewhere
+OWNERS_DIR_NAME = ".owners"
+# Owners on other hosts count as alive while they refresh their record; on this host the process is checked
+OWNER_HEARTBEAT_TIMEOUT = 30 * 60
+OWNER_HEARTBEAT_INTERVAL = 60.0
+
+
+def _load_manifest(version_dir):
+    try:
+        with open(os.path.join(version_dir, MANIFEST_NAME), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _load(version_dir):
+    return _load_manifest(version_dir).get("frames", {})
+
+
+def _write_manifest(version_dir, manifest):
+    manifest_path = os.path.join(version_dir, MANIFEST_NAME)
+    tmp_path = f"{manifest_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+
+def _save(version_dir, frames):
+    """Merges our results into the on-disk manifest, as other sessions may be filling the same version."""
+    manifest = _load_manifest(version_dir)
+    manifest.setdefault("frames", {}).update(frames)
+    _write_manifest(version_dir, manifest)
+
+
+def record_range(version_dir, frame_start, frame_end, frame_step):
+    """Records the frame range a render of version_dir was started with, so a resume renders the same frames."""
+    manifest = _load_manifest(version_dir)
+    manifest["range"] = [frame_start, frame_end, max(1, frame_step)]
+    _write_manifest(version_dir, manifest)
+
+
+def get_range(version_dir):
+    """Returns the (frame_start, frame_end, frame_step) recorded for a render version, or None."""
+    frame_range = _load_manifest(version_dir).get("range")
+    if not isinstance(frame_range, list) or len(frame_range) != 3:
+        return None
+    return tuple(int(v) for v in frame_range)
+
+
+def _has_valid_header(path):
+    magic = FRAME_MAGIC.get(os.path.splitext(path)[1].lower())
+    if magic is None:
+        return True
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(magic)) == magic
+    except OSError:
+        return False
+
+
+def claim_frames(version_dir, frames, pid=None):
+    """Records that the process pid (default: this one) renders frames into version_dir. Returns the owner record path."""
+    pid = pid or os.getpid()
+    owners_dir = os.path.join(version_dir, OWNERS_DIR_NAME)
+    os.makedirs(owners_dir, exist_ok=True)
+    host = socket.gethostname()
+    owner_path = os.path.join(owners_dir, f"{host}_{pid}.json")
+    tmp_path = f"{owner_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"host": host, "pid": pid, "frames": list(frames)}, f)
+    os.replace(tmp_path, owner_path)
+    return owner_path
+
+
+def touch_owner(owner_path):
+    """Heartbeat of a long render, for sessions on other hosts checking whether the owner is alive."""
+    try:
+        os.utime(owner_path, None)
+    except OSError:
+        pass
+
+
+def release_frames(owner_path):
+    try:
+        os.remove(owner_path)
+    except OSError:
+        pass
+
+
+def _pid_alive(pid):
+    """Whether a local process exists, or None where that cannot be checked safely (Windows)."""
+    if os.name == "nt":
+        return None
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # Exists, but belongs to another user
+        return True
+    return True
+
+
+def live_owned_frames(version_dir):
+    """Frames owned by renders that are still running. Records of dead owners are removed."""
+    owners_dir = os.path.join(version_dir, OWNERS_DIR_NAME)
+    try:
+        entries = list(os.scandir(owners_dir))
+    except OSError:
+        return set()
+
+    host = socket.gethostname()
+    now = time.time()
+    owned = set()
+    for entry in entries:
+        if not entry.name.endswith(".json"):
+            continue
+        try:
+            with open(entry.path, "r", encoding="utf-8") as f:
+                owner = json.load(f)
+            age = now - entry.stat().st_mtime
+        except (OSError, ValueError):
+            continue
+        alive = _pid_alive(owner.get("pid", 0)) if owner.get("host") == host else None
+        if alive is None:
+            alive = age < OWNER_HEARTBEAT_TIMEOUT
+        if alive:
+            owned.update(owner.get("frames", []))
+        else:
+            release_frames(entry.path)
+    return owned
+
+
+def scan_frames(filepath, frames, version_dir):
+    """
+    Checks the rendered frames of a version against its manifest.
+    Frames whose size and mtime match the manifest are trusted; others get a header check.
+    Empty placeholders are in progress while a live render owns them, and corrupt (stale) otherwise.
+    Returns (complete, missing, corrupt, in_progress) lists of frame numbers.
+    """
+    manifest = _load(version_dir)
+    verified = {}
+    complete, missing, corrupt, in_progress = [], [], [], []
+    owned = None
+
+    for frame in frames:
+        path = get_frame_path(filepath, frame)
+        try:
+            st = os.stat(path)
+        except OSError:
+            missing.append(frame)
+            continue
+
+        if st.st_size == 0:
+            # Placeholder written by Blender when it starts a frame (use_placeholder)
+            if owned is None:
+                owned = live_owned_frames(version_dir)
+            if frame in owned:
+                in_progress.append(frame)
+            else:
+                corrupt.append(frame)
+            continue
+
+        entry = manifest.get(str(frame))
+        if entry and entry.get("size") == st.st_size and entry.get("mtime") == st.st_mtime:
+            complete.append(frame)
+        elif _has_valid_header(path):
+            complete.append(frame)
+            verified[str(frame)] = {"size": st.st_size, "mtime": st.st_mtime}
+        else:
+            corrupt.append(frame)
+
+    if verified:
+        try:
+            _save(version_dir, verified)
+        except OSError as e:
+            print(f"[Studio Tools] Warning: Failed to update frame manifest in {version_dir}: {e}")
+    return complete, missing, corrupt, in_progress
+
+
+def remove_frames(filepath, frames):
+    """Deletes frame files (e.g. corrupt or stale placeholders) so they are rendered again."""
+    for frame in frames:
+        try:
+            os.remove(get_frame_path(filepath, frame))
+        except OSError:
+            pass
+
+
+def remove_placeholders(filepath, frames, version_dir):
+    """
+    Deletes the empty placeholders among frames, e.g. those left by a chunk that failed, so a retry
+    renders them. Placeholders of frames a live render owns are left alone.
+    """
+    owned = live_owned_frames(version_dir)
+    for frame in frames:
+        if frame in owned:
+            continue
+        path = get_frame_path(filepath, frame)
+        try:
+            if os.path.getsize(path) == 0:
+                os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,132 @@
+import os
+import time
+
+import jobs
+import panel_state
+import render_manifest
+from utils import write_simple_yaml
+
+try:
+    import bpy
+    IN_BLENDER = True
+except ImportError:
+    IN_BLENDER = False
+
+# Failed chunks are re-run this many times before the render is reported as failed
+CHUNK_RETRIES = 2
+POOL = "render"
+
+
+def split_frame_range(frame_start, frame_end, chunk_size, frame_step=1):
+    """Splits an inclusive frame range into [(first, last), ...] chunks of at most chunk_size frames."""
+    chunk_size = max(1, chunk_size)
+    frame_step = max(1, frame_step)
+    frames = list(range(frame_start, frame_end + 1, frame_step))
+    chunks = []
+    for i in range(0, len(frames), chunk_size):
+        chunk = frames[i:i + chunk_size]
+        chunks.append((chunk[0], chunk[-1]))
+    return chunks
+
+
+class RenderQueue:
+    """A sequence render split into frame chunks, each rendered by its own headless Blender process."""
+
+    def __init__(self, label, source_blend, filepath, version_dir, frame_start, frame_end, frame_step, metadata, logs_dir, on_finish=None):
+        self.label = label
+        self.source_blend = source_blend
+        self.filepath = filepath
+        self.version_dir = version_dir
+        self.frame_start = frame_start
+        self.frame_end = frame_end
+        self.frame_step = frame_step
+        self.metadata = metadata
+        self.logs_dir = logs_dir
+        # Called as on_finish(queue, failed_chunks, missing_frames) once every chunk finished
+        self.on_finish = on_finish
+        self.chunk_jobs = []
+        self.submitted_at = None
+        self._heartbeat_timer = None
+
+    def expected_frames(self):
+        return range(self.frame_start, self.frame_end + 1, max(1, self.frame_step))
+
+    def missing_frames(self):
+        """Frames that are absent, corrupt or still placeholders, according to the version's frame manifest."""
+        complete, missing, corrupt, in_progress = render_manifest.scan_frames(self.filepath, self.expected_frames(), self.version_dir)
+        return missing + corrupt + in_progress
+
+    def submit(self, chunk_size, threads):
+        self.submitted_at = time.perf_counter()
+        render_manifest.record_range(self.version_dir, self.frame_start, self.frame_end, self.frame_step)
+        # Placeholders left by crashed renders would be skipped by no-overwrite rendering
+        complete, missing, corrupt, in_progress = render_manifest.scan_frames(self.filepath, self.expected_frames(), self.version_dir)
+        render_manifest.remove_frames(self.filepath, corrupt)
+
+        log_prefix = os.path.join(self.logs_dir, os.path.splitext(os.path.basename(self.source_blend))[0])
+        for first, last in split_frame_range(self.frame_start, self.frame_end, chunk_size, self.frame_step):
+            extra_args = []
+            if threads > 0:
+                extra_args += ["-t", str(threads)]
+            extra_args += ["-s", str(first), "-e", str(last), "-j", str(max(1, self.frame_step)), "-a"]
+            job = jobs.Job(
+                label=f"{self.label} [{first}-{last}]",
+                # Chunks render with the user's preferences so they match an in-session render
+                argv=jobs.blender_command(self.source_blend, extra_args=extra_args, factory_startup=False),
+                log_path=f"{log_prefix}_{first:04d}-{last:04d}.log",
+                pool=POOL,
+                retries=CHUNK_RETRIES,
+                on_finish=self._on_chunk_finished,
+                on_start=self._on_chunk_started,
+                on_exit=self._on_chunk_exited,
+            )
+            job.frames = list(range(first, last + 1, max(1, self.frame_step)))
+            job.owner_path = None
+            self.chunk_jobs.append(job)
+            jobs.submit(job)
+
+    def _on_chunk_started(self, job):
+        job.owner_path = render_manifest.claim_frames(self.version_dir, job.frames, job.pid)
+        if IN_BLENDER and self._heartbeat_timer is None:
+            def heartbeat():
+                running = [j for j in self.chunk_jobs if j.owner_path]
+                for j in running:
+                    render_manifest.touch_owner(j.owner_path)
+                if not running:
+                    self._heartbeat_timer = None
+                    return None
+                return render_manifest.OWNER_HEARTBEAT_INTERVAL
+            self._heartbeat_timer = heartbeat
+            bpy.app.timers.register(heartbeat, first_interval=render_manifest.OWNER_HEARTBEAT_INTERVAL, persistent=True)
+
+    def _on_chunk_exited(self, job):
+        if job.owner_path:
+            render_manifest.release_frames(job.owner_path)
+            job.owner_path = None
+        if job.returncode != 0:
+            # A retry runs the same command line: without this it would skip the frames the crash left as placeholders
+            render_manifest.remove_placeholders(self.filepath, job.frames, self.version_dir)
+
+    def _on_chunk_finished(self, job):
+        if any(j.active for j in self.chunk_jobs):
+            return
+        self._finalize()
+
+    def _finalize(self):
+        """Runs once every chunk finished: metadata is only written when every frame exists."""
+        failed = [j for j in self.chunk_jobs if j.state == jobs.FAILED]
+        missing = self.missing_frames()
+        if failed or missing:
+            print(f"[Studio Tools] Warning: Render queue '{self.label}' incomplete: "
+                  f"{len(failed)} failed chunks, {len(missing)} missing frames. Logs: {self.logs_dir}")
+        else:
+            meta_path = os.path.join(self.version_dir, "metadata.yaml")
+            write_simple_yaml(meta_path, self.metadata)
+            print(f"[Studio Tools] Render queue '{self.label}' complete. Wrote render metadata to {meta_path}")
+            try:
+                os.remove(self.source_blend)
+            except OSError:
+                pass
+        if self.on_finish:
+            self.on_finish(self, failed, missing)
+        panel_state.request_refresh()
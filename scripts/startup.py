@@ -1,6 +1,9 @@
 import os
 import sys
-import re
+import time
+import functools
+
+_import_started = time.perf_counter()
 
 # Add scripts directory to sys.path so we can import our modules
 _this_dir = os.path.dirname(os.path.abspath(__file__))
@@ -13,26 +16,45 @@ try:
 except ImportError:
     IN_BLENDER = False
 
+# Only what the panel needs is imported on the startup critical path. The operator modules (and
+# everything they pull in) and the web connection are loaded by register_deferred().
 import utils
-import operators
+import versioning
+import publish_profiles
+import profiling
 import handlers
 import ui
-import connection
+import panel_state
+
+_import_s = time.perf_counter() - _import_started
 
-# List of classes to register
+# Launch-to-interactive budget, reported after startup
+STARTUP_TARGET_MS = float(os.environ.get("ST_STARTUP_TARGET_MS", "3000"))
+
+# Classes registered on the startup critical path
 classes = [
-    operators.WM_OT_studiotools_unlink_asset,
-    operators.WM_OT_studiotools_new_file,
-    operators.WM_OT_studiotools_increment_save,
-    operators.WM_OT_studiotools_link_asset,
-    operators.WM_OT_studiotools_swap_version,
-    operators.WM_OT_studiotools_load_usd,
-    operators.WM_OT_studiotools_publish_usd,
-    operators.WM_OT_studiotools_render_still,
-    operators.WM_OT_studiotools_render_sequence,
-    operators.WM_OT_studiotools_render_playblast,
     ui.VIEW3D_PT_studiotools_pipeline
 ]
+# Operator classes registered by register_deferred()
+deferred_classes = []
+
+def get_operator_classes():
+    import operators
+    return [
+        operators.WM_OT_studiotools_unlink_asset,
+        operators.WM_OT_studiotools_new_file,
+        operators.WM_OT_studiotools_increment_save,
+        operators.WM_OT_studiotools_link_asset,
+        operators.WM_OT_studiotools_batch_link,
+        operators.WM_OT_studiotools_swap_version,
+        operators.WM_OT_studiotools_update_all_linked,
+        operators.WM_OT_studiotools_load_usd,
+        operators.WM_OT_studiotools_publish_usd,
+        operators.WM_OT_studiotools_render_still,
+        operators.WM_OT_studiotools_render_sequence,
+        operators.WM_OT_studiotools_resume_render,
+        operators.WM_OT_studiotools_render_playblast,
+    ]
 
 def register():
     if not IN_BLENDER:
@@ -54,11 +76,87 @@ def register():
         description="Export animation frames in the USD file",
         default=False
     )
+    bpy.types.Scene.studiotools_publish_profile = bpy.props.EnumProperty(
+        name="Publish Profile",
+        description="Exporter settings used for the publish, from the project's publish profiles",
+        items=publish_profiles.get_profile_items
+    )
+    bpy.types.Scene.studiotools_chunked_animation = bpy.props.BoolProperty(
+        name="Parallel Animation Export",
+        description="Export animation in frame chunks with headless Blender processes, assembled with USD value clips",
+        default=False
+    )
+    bpy.types.Scene.studiotools_clip_chunk_size = bpy.props.IntProperty(
+        name="Frames per Clip",
+        description="Number of frames exported into each USD clip",
+        default=25,
+        min=1
+    )
+    bpy.types.Scene.studiotools_clip_processes = bpy.props.IntProperty(
+        name="Export Processes",
+        description="Number of headless Blender processes exporting clips at the same time",
+        default=4,
+        min=1,
+        max=64
+    )
     bpy.types.Scene.studiotools_export_usdc = bpy.props.BoolProperty(
         name="Export as USDC",
         description="Export as binary USDC instead of human-readable USDA (recommended for heavy caches)",
         default=False
     )
+    bpy.types.Scene.studiotools_incremental_publish = bpy.props.BoolProperty(
+        name="Incremental Publish",
+        description="Export each root object to its own USD layer and reuse the previous version's layers of unchanged objects",
+        default=False
+    )
+    bpy.types.Scene.studiotools_skip_unchanged = bpy.props.BoolProperty(
+        name="Skip Unchanged Publishes",
+        description="Do not create a new version when the scene content and export settings match the latest publish. "
+                    "Data the fingerprint does not cover (e.g. edits inside linked libraries) is not detected",
+        default=False
+    )
+    bpy.types.Scene.studiotools_async_publish = bpy.props.BoolProperty(
+        name="Publish in Background",
+        description="Run the USD export, metadata and symlink in a headless Blender process so you can keep working",
+        default=False
+    )
+    bpy.types.Scene.studiotools_publish_workers = bpy.props.IntProperty(
+        name="Publish Workers",
+        description="Number of background publishes processed at the same time",
+        default=1,
+        min=1,
+        max=16
+    )
+    bpy.types.Scene.studiotools_render_queue = bpy.props.BoolProperty(
+        name="Render Queue",
+        description="Render the sequence in chunks with a pool of headless Blender processes instead of in this session",
+        default=False
+    )
+    bpy.types.Scene.studiotools_render_processes = bpy.props.IntProperty(
+        name="Render Processes",
+        description="Number of headless Blender processes rendering chunks at the same time",
+        default=2,
+        min=1,
+        max=64
+    )
+    bpy.types.Scene.studiotools_render_threads = bpy.props.IntProperty(
+        name="Threads per Process",
+        description="Render threads used by each process (0 uses all cores)",
+        default=0,
+        min=0,
+        max=1024
+    )
+    bpy.types.Scene.studiotools_render_chunk_size = bpy.props.IntProperty(
+        name="Chunk Size",
+        description="Number of frames rendered by each queued process",
+        default=10,
+        min=1
+    )
+    bpy.types.Scene.studiotools_show_timings = bpy.props.BoolProperty(
+        name="Show Timings",
+        description="Print a per-stage timing summary of pipeline operations in the console and publish popup",
+        default=False
+    )
     bpy.types.Scene.studiotools_import_path = bpy.props.StringProperty(
         name="Import Folder Path",
         description="Paste the copied asset/version folder path to link it",
@@ -80,11 +178,79 @@ def register():
         bpy.app.handlers.save_post.append(handlers.update_default_asset_name_handler)
     if handlers.sync_materials_viewport_color not in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.append(handlers.sync_materials_viewport_color)
+    if handlers.clear_material_cache_handler not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(handlers.clear_material_cache_handler)
+    if handlers.refresh_published_index_handler not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(handlers.refresh_published_index_handler)
+    for handler_list in (bpy.app.handlers.load_post, bpy.app.handlers.save_post):
+        if handlers.refresh_panel_state_handler not in handler_list:
+            handler_list.append(handlers.refresh_panel_state_handler)
+    if not bpy.app.timers.is_registered(handlers.refresh_published_index_timer):
+        bpy.app.timers.register(handlers.refresh_published_index_timer, first_interval=handlers.PUBLISHED_INDEX_COLLECT_INTERVAL, persistent=True)
+    if not bpy.app.timers.is_registered(panel_state.periodic_refresh_timer):
+        bpy.app.timers.register(panel_state.periodic_refresh_timer, first_interval=0.0, persistent=True)
+
+def register_deferred(prof=None):
+    """Registers the operators and starts the web connection, once the artist already has control."""
+    if not IN_BLENDER:
+        return
+    if prof is None:
+        prof = profiling.Profiler("startup_deferred")
+        
+    with prof.stage("operators"):
+        for cls in get_operator_classes():
+            if cls not in deferred_classes:
+                bpy.utils.register_class(cls)
+                deferred_classes.append(cls)
+    
+    # Start web connection background poll
+    try:
+        with prof.stage("web_connection"):
+            import connection
+            connection.start_web_connection()
+            if not bpy.app.timers.is_registered(connection.poll_web_connection):
+                bpy.app.timers.register(connection.poll_web_connection, persistent=True)
+        print("[Studio Tools] Web Connection active and listening for load actions...")
+    except Exception as e_timer:
+        print(f"[Studio Tools] Warning: Failed to register Web Connection background timer: {e_timer}")
+
+def deferred_startup_timer(prof):
+    # The first event loop tick runs once the UI is up: this is when the artist gets control
+    startup_report = report_startup(prof, profiling.process_age_s())
+    try:
+        register_deferred(prof)
+    except Exception as e:
+        print(f"[Studio Tools] Warning: Deferred startup failed: {e}")
+    prof.write(**startup_report)
+    prof.print_summary()
+    return None
+
+def report_startup(prof, launch_s=None):
+    """
+    Prints the startup critical path breakdown and checks launch-to-interactive time (launch_s, the
+    process age at the first event loop tick) against the target.
+    """
+    critical_ms = (_import_s + prof.total_s) * 1000.0
+    interactive_ms = launch_s * 1000.0 if launch_s is not None else critical_ms
+    breakdown = ", ".join(f"{r['stage']} {r['wall_s'] * 1000.0:.0f} ms" for r in prof.stages)
+    print(f"[Studio Tools] Startup critical path: {critical_ms:.0f} ms ({breakdown})")
+    if launch_s is not None:
+        print(f"[Studio Tools] Launch to interactive: {interactive_ms:.0f} ms (target {STARTUP_TARGET_MS:.0f} ms)")
+    if interactive_ms > STARTUP_TARGET_MS:
+        print(f"[Studio Tools] Warning: Startup took {interactive_ms:.0f} ms, over the {STARTUP_TARGET_MS:.0f} ms target.")
+    return {"critical_path_ms": round(critical_ms, 1), "interactive_ms": round(interactive_ms, 1), "target_ms": STARTUP_TARGET_MS}
 
 def unregister():
     if not IN_BLENDER:
         return
         
+    # Stop the web connection worker thread and its drain timer (if deferred startup got to start it)
+    connection = sys.modules.get("connection")
+    if connection is not None:
+        if bpy.app.timers.is_registered(connection.poll_web_connection):
+            bpy.app.timers.unregister(connection.poll_web_connection)
+        connection.stop_web_connection()
+
     # Unregister handlers
     if handlers.update_default_asset_name_handler in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.remove(handlers.update_default_asset_name_handler)
@@ -92,21 +258,50 @@ def unregister():
         bpy.app.handlers.save_post.remove(handlers.update_default_asset_name_handler)
     if handlers.sync_materials_viewport_color in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.remove(handlers.sync_materials_viewport_color)
+    if handlers.clear_material_cache_handler in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(handlers.clear_material_cache_handler)
+    if handlers.refresh_published_index_handler in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(handlers.refresh_published_index_handler)
+    for handler_list in (bpy.app.handlers.load_post, bpy.app.handlers.save_post):
+        if handlers.refresh_panel_state_handler in handler_list:
+            handler_list.remove(handlers.refresh_panel_state_handler)
+    if bpy.app.timers.is_registered(handlers.refresh_published_index_timer):
+        bpy.app.timers.unregister(handlers.refresh_published_index_timer)
+    if bpy.app.timers.is_registered(panel_state.periodic_refresh_timer):
+        bpy.app.timers.unregister(panel_state.periodic_refresh_timer)
 
     # Unregister scene properties
     del bpy.types.Scene.studiotools_asset_name
     del bpy.types.Scene.studiotools_mark_as_published
     del bpy.types.Scene.studiotools_export_animation
+    del bpy.types.Scene.studiotools_publish_profile
+    del bpy.types.Scene.studiotools_chunked_animation
+    del bpy.types.Scene.studiotools_clip_chunk_size
+    del bpy.types.Scene.studiotools_clip_processes
     del bpy.types.Scene.studiotools_export_usdc
+    del bpy.types.Scene.studiotools_incremental_publish
+    del bpy.types.Scene.studiotools_skip_unchanged
+    del bpy.types.Scene.studiotools_async_publish
+    del bpy.types.Scene.studiotools_publish_workers
+    del bpy.types.Scene.studiotools_render_queue
+    del bpy.types.Scene.studiotools_render_processes
+    del bpy.types.Scene.studiotools_render_threads
+    del bpy.types.Scene.studiotools_render_chunk_size
+    del bpy.types.Scene.studiotools_show_timings
     del bpy.types.Scene.studiotools_import_path
     del bpy.types.Scene.studiotools_render_name
 
+    for cls in reversed(deferred_classes):
+        bpy.utils.unregister_class(cls)
+    deferred_classes.clear()
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
 
-def init_blender_scene():
+def init_blender_scene(prof=None):
     if not IN_BLENDER:
         return
+    if prof is None:
+        prof = profiling.Profiler("startup")
         
     task_path = os.environ.get("ST_CWD")
     if not task_path:
@@ -122,22 +317,31 @@ def init_blender_scene():
         save_path = os.path.abspath(preload_file)
         print(f"[Studio Tools] Using preload file from environment: {save_path}")
     else:
-        wip_dir = os.path.join(task_path, "wip")
-        app_dir = os.path.join(wip_dir, "blender")
-        os.makedirs(app_dir, exist_ok=True)
-        
-        # Determine latest version
-        version = 1
-        if os.path.exists(app_dir):
-            for f in os.listdir(app_dir):
-                match = re.search(r"scene_v(\d+)\.blend", f, re.IGNORECASE)
-                if match:
-                    version = max(version, int(match.group(1)))
-                    
-        file_name = f"scene_v{version:03d}.blend"
-        save_path = os.path.abspath(os.path.join(app_dir, file_name))
+        with prof.stage("file_discovery"):
+            wip_dir = os.path.join(task_path, "wip")
+            app_dir = os.path.join(wip_dir, "blender")
+            os.makedirs(app_dir, exist_ok=True)
+            
+            # Determine latest version
+            version = max(1, versioning.latest_version(app_dir, versioning.WIP_SCENE_PATTERN, dirs_only=False))
+
+            file_name = f"scene_v{version:03d}.blend"
+            save_path = os.path.abspath(os.path.join(app_dir, file_name))
     
     # Save/Load file
+    with prof.stage("file_open"):
+        open_startup_file(save_path)
+
+    # Update default asset name and render name to match current file name
+    utils.update_default_asset_name()
+    utils.update_default_render_name()
+                
+    print("------------------------------------------------------------------")
+    print("  [Studio Tools Pipeline] Ready!")
+    print("------------------------------------------------------------------")
+
+def open_startup_file(save_path):
+    """Opens the startup workfile, creating it from the blank scene if it does not exist yet."""
     if not os.path.exists(save_path):
         try:
             os.makedirs(os.path.dirname(save_path), exist_ok=True)
@@ -155,22 +359,14 @@ def init_blender_scene():
             except Exception as e:
                 print(f"[Studio Tools] Failed to load BLEND file: {e}")
 
-    # Update default asset name and render name to match current file name
-    utils.update_default_asset_name()
-    utils.update_default_render_name()
-                
-    print("------------------------------------------------------------------")
-    print("  [Studio Tools Pipeline] Ready!")
-    print("------------------------------------------------------------------")
-
 if __name__ == "__main__":
-    register()
-    init_blender_scene()
+    startup_prof = profiling.Profiler("startup")
+    startup_prof.record("module_import", _import_s)
+    with startup_prof.stage("register"):
+        register()
+    init_blender_scene(startup_prof)
     
-    # Start web connection background poll
     if IN_BLENDER:
-        try:
-            bpy.app.timers.register(connection.poll_web_connection)
-            print("[Studio Tools] Web Connection active and listening for load actions...")
-        except Exception as e_timer:
-            print(f"[Studio Tools] Warning: Failed to register Web Connection background timer: {e_timer}")
+        # Operators and the web connection load on the first event loop tick, after the UI is up; launch to
+        # interactive is measured there, and the full timing record (critical path and deferred stages) written
+        bpy.app.timers.register(functools.partial(deferred_startup_timer, startup_prof), first_interval=0.0, persistent=True)
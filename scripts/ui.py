@@ -1,6 +1,7 @@
 import os
-import re
-import utils
+import handlers
+import panel_state
+import jobs
 
 try:
     import bpy
@@ -41,6 +42,7 @@ class VIEW3D_PT_studiotools_pipeline(Panel):
             box.label(text=f"File: {os.path.basename(current_file)}", icon='FILE_BLEND')
         else:
             box.label(text="File: Unsaved Scene", icon='FILE_BLEND')
+        box.label(text=handlers.get_material_sync_summary(), icon='MATERIAL')
             
         row_btns = box.row(align=True)
         row_btns.operator("wm.studiotools_increment_save", text="Increment Save", icon='DUPLICATE')
@@ -52,58 +54,61 @@ class VIEW3D_PT_studiotools_pipeline(Panel):
         box_link = layout.box()
         box_link.label(text="Link Project Asset", icon='LINKED')
         box_link.prop(context.scene, "studiotools_import_path", text="Path")
-        box_link.operator("wm.studiotools_link_asset", text="Link Asset", icon='APPEND_BLEND')
+        row_link = box_link.row(align=True)
+        row_link.operator("wm.studiotools_link_asset", text="Link Asset", icon='APPEND_BLEND')
+        row_link.operator("wm.studiotools_batch_link", text="Batch Link...", icon='FILEBROWSER')
 
-        # Linked Asset HUD
+        # Linked Asset HUD (drawn from the panel snapshot; filesystem scans happen in panel_state.refresh)
+        snapshot = panel_state.get_snapshot()
         has_linked_assets = False
         for lib in bpy.data.libraries:
             # We ONLY draw libraries that were directly linked by StudioTools
             if not lib.get("studiotools_direct", False):
                 continue
                 
-            # Resolve symlink path to find real asset/version folder on disk for HUD version logic
-            norm_path = os.path.abspath(bpy.path.abspath(lib.filepath))
-            real_path = os.path.realpath(norm_path)
+            if lib.name not in snapshot["libraries"]:
+                panel_state.request_refresh(debounce=False)
+                continue
+            info = snapshot["libraries"][lib.name]
+            if info is None:
+                continue
+            if info["filepath"] != lib.filepath:
+                # Library was re-pointed since the last scan; draw the stale entry until the refresh lands
+                panel_state.request_refresh(debounce=False)
             
-            if "versions" in real_path and real_path.endswith("scene.blend"):
-                if not has_linked_assets:
-                    has_linked_assets = True
-                    layout.separator()
-                    layout.label(text="Linked Assets HUD", icon='LINKED')
-                
-                box_hud = layout.box()
-                lib_dir = os.path.dirname(real_path)
-                asset_dir = os.path.dirname(lib_dir)
-                asset_name = os.path.basename(asset_dir)
-                current_ver = os.path.basename(lib_dir)
-                
-                # Check if the active linked path is the published symlink path
-                is_published_link = "published" in norm_path
-                
-                row = box_hud.row(align=True)
-                row.label(text=f"{asset_name}", icon='FILE_BLEND')
-                if is_published_link:
-                    row.label(text="Active: published", icon='CHECKMARK')
-                else:
-                    row.label(text=f"Active: {current_ver}", icon='CHECKMARK')
-                    
-                op_unlink = row.operator("wm.studiotools_unlink_asset", text="", icon='REMOVE')
-                op_unlink.library_name = lib.name
+            if not has_linked_assets:
+                has_linked_assets = True
+                layout.separator()
+                layout.label(text="Linked Assets HUD", icon='LINKED')
+                row_update = layout.row(align=True)
+                row_update.label(text="Update All:")
+                row_update.operator("wm.studiotools_update_all_linked", text="Latest", icon='FILE_REFRESH').mode = 'LATEST'
+                row_update.operator("wm.studiotools_update_all_linked", text="Published", icon='CHECKMARK').mode = 'PUBLISHED'
+                row_update.operator("wm.studiotools_update_all_linked", text="Manifest", icon='FILEBROWSER').mode = 'MANIFEST'
+            
+            box_hud = layout.box()
+            current_ver = info["current_ver"]
+            is_published_link = info["is_published"]
+            
+            row = box_hud.row(align=True)
+            row.label(text=f"{info['asset_name']}", icon='FILE_BLEND')
+            if is_published_link:
+                row.label(text="Active: published", icon='CHECKMARK')
+            else:
+                row.label(text=f"Active: {current_ver}", icon='CHECKMARK')
                 
-                # Scan other versions on disk
-                if os.path.exists(asset_dir):
-                    versions = sorted([
-                        d for d in os.listdir(asset_dir)
-                        if os.path.isdir(os.path.join(asset_dir, d)) and re.match(r"^v\d+$", d)
-                    ])
-                    if versions:
-                        row_vers = box_hud.row(align=True)
-                        for ver in versions:
-                            is_active = (ver == current_ver) and not is_published_link
-                            icon_style = 'RADIOBUT_ON' if is_active else 'RADIOBUT_OFF'
-                            op = row_vers.operator("wm.studiotools_swap_version", text=ver, icon=icon_style)
-                            op.library_name = lib.name
-                            op.target_version = ver
+            op_unlink = row.operator("wm.studiotools_unlink_asset", text="", icon='REMOVE')
+            op_unlink.library_name = lib.name
+            
+            # Other versions on disk
+            if info["versions"]:
+                row_vers = box_hud.row(align=True)
+                for ver in info["versions"]:
+                    is_active = (ver == current_ver) and not is_published_link
+                    icon_style = 'RADIOBUT_ON' if is_active else 'RADIOBUT_OFF'
+                    op = row_vers.operator("wm.studiotools_swap_version", text=ver, icon=icon_style)
+                    op.library_name = lib.name
+                    op.target_version = ver
 
         # Render Sequence Setup
         box_render = layout.box()
@@ -115,32 +120,45 @@ class VIEW3D_PT_studiotools_pipeline(Panel):
         task_path = os.environ.get("ST_CWD")
         if task_path:
             render_name = scene.studiotools_render_name.strip() or "render"
+            previews = snapshot["render"]
+            if previews is None or previews["render_name"] != render_name:
+                panel_state.request_refresh(debounce=False)
             
-            # Calculate dynamic output path previews using utils helper
-            exr_ver, exr_dir, exr_file, _ = utils.get_render_version_and_paths(task_path, render_name, 'exr', create_dirs=False)
-            pb_ver, pb_dir, pb_file, _ = utils.get_render_version_and_paths(task_path, render_name, 'playblast', create_dirs=False)
-            
-            # EXR Preview
-            box_render.label(text=f"Next Render: v{exr_ver:03d}", icon='FILE_NEW')
-            col_preview = box_render.column(align=True)
-            col_preview.scale_y = 0.8
-            col_preview.label(text=f"Dir: versions/{os.path.basename(os.path.dirname(exr_dir))}/{os.path.basename(exr_dir)}/")
-            col_preview.label(text=f"File: {exr_file}")
-            
-            box_render.separator()
-            
-            # Playblast Preview
-            box_render.label(text=f"Next Playblast: v{pb_ver:03d}", icon='FILE_NEW')
-            col_pb_preview = box_render.column(align=True)
-            col_pb_preview.scale_y = 0.8
-            col_pb_preview.label(text=f"Dir: versions/{os.path.basename(os.path.dirname(pb_dir))}/{os.path.basename(pb_dir)}/")
-            col_pb_preview.label(text=f"File: {pb_file}")
+            if previews is None:
+                box_render.label(text="Resolving output paths...", icon='TIME')
+            else:
+                exr_ver, exr_dir, exr_file = previews['exr']
+                pb_ver, pb_dir, pb_file = previews['playblast']
+                
+                # EXR Preview
+                box_render.label(text=f"Next Render: v{exr_ver:03d}", icon='FILE_NEW')
+                col_preview = box_render.column(align=True)
+                col_preview.scale_y = 0.8
+                col_preview.label(text=f"Dir: versions/{os.path.basename(os.path.dirname(exr_dir))}/{os.path.basename(exr_dir)}/")
+                col_preview.label(text=f"File: {exr_file}")
+                
+                box_render.separator()
+                
+                # Playblast Preview
+                box_render.label(text=f"Next Playblast: v{pb_ver:03d}", icon='FILE_NEW')
+                col_pb_preview = box_render.column(align=True)
+                col_pb_preview.scale_y = 0.8
+                col_pb_preview.label(text=f"Dir: versions/{os.path.basename(os.path.dirname(pb_dir))}/{os.path.basename(pb_dir)}/")
+                col_pb_preview.label(text=f"File: {pb_file}")
             
             box_render.separator()
 
+        box_render.prop(context.scene, "studiotools_render_queue", text="Render Queue (Background Processes)")
+        if context.scene.studiotools_render_queue:
+            col_queue = box_render.column(align=True)
+            col_queue.prop(context.scene, "studiotools_render_processes", text="Processes")
+            col_queue.prop(context.scene, "studiotools_render_threads", text="Threads per Process")
+            col_queue.prop(context.scene, "studiotools_render_chunk_size", text="Chunk Size")
+
         col_btns = box_render.column(align=True)
         col_btns.operator("wm.studiotools_render_still", text="Render Still Frame", icon='RENDER_STILL')
         col_btns.operator("wm.studiotools_render_sequence", text="Render Animation", icon='RENDER_ANIMATION')
+        col_btns.operator("wm.studiotools_resume_render", text="Resume Last Render", icon='FILE_REFRESH')
         col_btns.operator("wm.studiotools_render_playblast", text="Render Playblast (Preview)", icon='CAMERA_STEREO')
 
 
@@ -149,7 +167,39 @@ class VIEW3D_PT_studiotools_pipeline(Panel):
         box_publish = layout.box()
         box_publish.label(text="USD Export Settings", icon='EXPORT')
         box_publish.prop(context.scene, "studiotools_asset_name", text="Asset Name")
+        box_publish.prop(context.scene, "studiotools_publish_profile", text="Profile")
         box_publish.prop(context.scene, "studiotools_export_animation", text="Export Animation")
+        col_clips = box_publish.column(align=True)
+        col_clips.enabled = context.scene.studiotools_export_animation
+        col_clips.prop(context.scene, "studiotools_chunked_animation", text="Parallel Export (USD value clips)")
+        row_clips = col_clips.row(align=True)
+        row_clips.enabled = context.scene.studiotools_chunked_animation
+        row_clips.prop(context.scene, "studiotools_clip_chunk_size", text="Frames")
+        row_clips.prop(context.scene, "studiotools_clip_processes", text="Processes")
         box_publish.prop(context.scene, "studiotools_export_usdc", text="Export as USDC (binary cache)")
         box_publish.prop(context.scene, "studiotools_mark_as_published", text="Mark as Published")
+        box_publish.prop(context.scene, "studiotools_incremental_publish", text="Incremental Publish (per-object layers)")
+        box_publish.prop(context.scene, "studiotools_skip_unchanged", text="Skip Unchanged Publishes")
+        row_async = box_publish.row(align=True)
+        row_async.prop(context.scene, "studiotools_async_publish", text="Publish in Background")
+        sub_async = row_async.row(align=True)
+        sub_async.enabled = context.scene.studiotools_async_publish
+        sub_async.prop(context.scene, "studiotools_publish_workers", text="Workers")
+        box_publish.prop(context.scene, "studiotools_show_timings", text="Show Timings")
         box_publish.operator("wm.studiotools_publish_usd", icon='EXPORT', text="Publish USD Asset")
+
+        # Background Jobs
+        background_jobs = jobs.get_jobs()
+        if background_jobs:
+            layout.separator()
+            box_jobs = layout.box()
+            box_jobs.label(text="Background Jobs", icon='SORTTIME')
+            col_jobs = box_jobs.column(align=True)
+            for job in background_jobs:
+                if job.state == jobs.DONE:
+                    icon = 'CHECKMARK'
+                elif job.state == jobs.FAILED:
+                    icon = 'ERROR'
+                else:
+                    icon = 'TIME'
+                col_jobs.label(text=f"{job.label}: {int(job.progress * 100)}% {job.message}", icon=icon)
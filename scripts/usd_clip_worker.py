@@ -0,0 +1,43 @@
+"""
+Headless worker exporting one frame chunk of an animated publish as a USD clip:
+
+    blender -b <source.blend> --python usd_clip_worker.py -- <clip.usd> <first> <last> <step> <usdc 0|1> <profile>
+"""
+import os
+import sys
+
+# Add scripts directory to sys.path so we can import our modules
+_this_dir = os.path.dirname(os.path.abspath(__file__))
+if _this_dir not in sys.path:
+    sys.path.append(_this_dir)
+
+import bpy
+
+import publish_profiles
+from usd_clips import CLIP_ROOT_PRIM
+from utils import export_usd_file, get_usd_export_kwargs, temporary_decimation
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    if len(argv) != 6:
+        print("[Studio Tools] USD clip worker: expected <clip.usd> <first> <last> <step> <usdc> <profile>.")
+        sys.exit(1)
+    clip_path, first, last, step, usdc, profile_name = argv
+
+    scene = bpy.context.scene
+    scene.frame_start = int(first)
+    scene.frame_end = int(last)
+    scene.frame_step = int(step)
+
+    kwargs = get_usd_export_kwargs(True, profile_name)
+    # Every clip must share the same prim hierarchy so they can be stitched under one root
+    if "root_prim_path" in publish_profiles.get_exporter_properties():
+        kwargs["root_prim_path"] = CLIP_ROOT_PRIM
+    with temporary_decimation(publish_profiles.get_profile(profile_name).get("decimate_ratio")):
+        export_usd_file(clip_path, usdc == "1", kwargs)
+    print(f"[Studio Tools] Exported USD clip {clip_path} (frames {first}-{last})")
+
+
+if __name__ == "__main__":
+    main()
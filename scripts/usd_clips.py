@@ -0,0 +1,95 @@
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import jobs
+import publish_profiles
+from render_queue import split_frame_range
+
+# Chunks of an animated publish are written to <version>/clips/clip_<first>-<last>.usd
+CLIPS_DIR_NAME = "clips"
+# Prim the chunk exports are rooted under, and the value clips are authored on
+CLIP_ROOT_PRIM = "/root"
+
+
+def can_stitch():
+    """Whether the USD Python API needed to assemble value clips is available in this Blender."""
+    try:
+        from pxr import UsdUtils
+        return True
+    except ImportError:
+        return False
+
+
+def _run_command(argv, log_path):
+    """Runs one command with its output in log_path, blocking until it exits. Returns the exit code."""
+    with open(log_path, "w", encoding="utf-8") as log_file:
+        return subprocess.Popen(argv, stdout=log_file, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL).wait()
+
+
+def _run_parallel(commands, processes):
+    """
+    Runs [(argv, log_path), ...] with at most `processes` children at a time and waits for all of them.
+    Each child is waited on by its own pool thread, so nothing polls. Returns the log paths of the commands that failed.
+    """
+    if not commands:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, processes)) as pool:
+        returncodes = list(pool.map(lambda command: _run_command(*command), commands))
+    return [log_path for (argv, log_path), returncode in zip(commands, returncodes) if returncode != 0]
+
+
+def stitch_clips(stage_path, clip_paths, start_frame, end_frame):
+    """
+    Writes stage_path as a value-clip layer over the chunk files, with the shared topology
+    (prims, non-animated attributes) in a stage.topology.usd layer next to it.
+    """
+    from pxr import Sdf, UsdUtils
+    if os.path.exists(stage_path):
+        os.remove(stage_path)
+    topology_path = UsdUtils.GenerateClipTopologyName(stage_path)
+    if os.path.exists(topology_path):
+        os.remove(topology_path)
+
+    first_clip = Sdf.Layer.FindOrOpen(clip_paths[0])
+    clip_root = f"/{first_clip.defaultPrim}" if first_clip.defaultPrim else CLIP_ROOT_PRIM
+    result = Sdf.Layer.CreateNew(stage_path)
+    UsdUtils.StitchClips(result, clip_paths, Sdf.Path(clip_root), start_frame, end_frame)
+    for key in ("upAxis", "metersPerUnit", "timeCodesPerSecond", "framesPerSecond"):
+        if first_clip.pseudoRoot.HasInfo(key):
+            result.pseudoRoot.SetInfo(key, first_clip.pseudoRoot.GetInfo(key))
+    if first_clip.defaultPrim:
+        result.defaultPrim = first_clip.defaultPrim
+    result.Save()
+    return stage_path
+
+
+def export_chunked(source_blend, version_dir, frame_start, frame_end, frame_step, chunk_size, processes, export_as_usdc, logs_dir, profile_name=publish_profiles.DEFAULT_PROFILE):
+    """
+    Exports an animated publish in frame chunks, each written by its own headless Blender process
+    from source_blend, and assembles the chunks into stage.usd with USD value clips.
+    Returns the stage.usd path. Raises RuntimeError if a chunk fails.
+    """
+    clips_dir = os.path.join(version_dir, CLIPS_DIR_NAME)
+    os.makedirs(clips_dir, exist_ok=True)
+    os.makedirs(logs_dir, exist_ok=True)
+    worker_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "usd_clip_worker.py")
+    version_name = os.path.basename(version_dir)
+
+    commands = []
+    clip_paths = []
+    for first, last in split_frame_range(frame_start, frame_end, chunk_size, frame_step):
+        clip_path = os.path.join(clips_dir, f"clip_{first:04d}-{last:04d}.usd")
+        script_args = [clip_path, str(first), str(last), str(max(1, frame_step)), "1" if export_as_usdc else "0", profile_name]
+        log_path = os.path.join(logs_dir, f"clip_{version_name}_{first:04d}-{last:04d}.log")
+        # Keep preferences: drivers must evaluate in each chunk as they do in the artist's session
+        commands.append((jobs.blender_command(source_blend, worker_script, script_args, factory_startup=False), log_path))
+        clip_paths.append(clip_path)
+
+    print(f"[Studio Tools] Exporting {len(commands)} animation chunks with {processes} processes")
+    failed = _run_parallel(commands, processes)
+    missing = [p for p in clip_paths if not os.path.exists(p)]
+    if failed or missing:
+        raise RuntimeError(f"{len(failed)} animation chunks failed, {len(missing)} clips missing. Logs: {logs_dir}")
+
+    return stitch_clips(os.path.join(version_dir, "stage.usd"), clip_paths, frame_start, frame_end)
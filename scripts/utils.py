@@ -1,5 +1,14 @@
 import os
 import re
+import json
+import shutil
+from datetime import datetime
+from contextlib import contextmanager
+
+import asset_index
+import blobstore
+import versioning
+import publish_profiles
 
 try:
     import bpy
@@ -7,6 +16,10 @@ try:
 except ImportError:
     IN_BLENDER = False
 
+# Incremental publishes keep one USD layer per root object in <version>/layers, listed in its manifest
+LAYERS_DIR_NAME = "layers"
+LAYER_MANIFEST_NAME = "manifest.json"
+
 def write_simple_yaml(path, data):
     """Writes a dictionary as a simple YAML file to avoid PyYAML dependencies inside Blender's python."""
     try:
@@ -26,32 +39,96 @@ def write_simple_yaml(path, data):
                     escaped_v = str(v).replace('"', '\\"')
                     f.write(f"{k}: \"{escaped_v}\"\n")
 
+def read_simple_yaml(path):
+    """Reads a YAML file written by write_simple_yaml. Returns an empty dict if it is missing or unreadable."""
+    if not os.path.isfile(path):
+        return {}
+    try:
+        import yaml
+        with open(path, "r", encoding="utf-8") as f:
+            return yaml.safe_load(f) or {}
+    except ImportError:
+        pass
+    except Exception as e:
+        print(f"[Studio Tools] Warning: Failed to read {path}: {e}")
+        return {}
+    
+    # Fallback manual parsing of the subset write_simple_yaml produces
+    def unquote(value):
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] == '"':
+            value = value[1:-1].replace('\\"', '"')
+        return value
+    
+    data = {}
+    key = None
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line.strip():
+                continue
+            if line.lstrip().startswith("- ") and key is not None:
+                if not isinstance(data[key], list):
+                    data[key] = []
+                data[key].append(unquote(line.lstrip()[2:]))
+            elif ":" in line:
+                key, value = line.split(":", 1)
+                key = key.strip()
+                data[key] = unquote(value) if value.strip() else []
+    return data
+
 def get_published_assets(self, context):
     """Callback to dynamically compile a list of all published USD assets in the project."""
     task_path = os.environ.get("ST_CWD")
     if not task_path:
         return [("NONE", "Pipeline environment context not set!", "")]
         
-    sandbox_dir = os.path.dirname(os.path.dirname(task_path))
-    assets = []
-    
-    if os.path.exists(sandbox_dir):
-        for root, dirs, files in os.walk(sandbox_dir):
-            if os.path.basename(root) == "published":
-                for f in files:
-                    if f.lower().endswith((".usd", ".usda", ".usdc")):
-                        full_path = os.path.abspath(os.path.join(root, f))
-                        rel_path = os.path.relpath(full_path, sandbox_dir)
-                        assets.append((full_path, rel_path, f"Version: {f}"))
+    # Served from the in-memory published asset index; refreshed by handlers, not on every enum evaluation
+    assets = asset_index.get_items(asset_index.get_sandbox_dir(task_path))
                         
     if not assets:
         return [("NONE", "No published assets found in active project!", "")]
         
-    # Sort assets by relative path for consistent logical view
-    assets.sort(key=lambda x: x[1])
     return assets
 
+def refresh_published_assets(background=False):
+    """
+    Incrementally refreshes the published asset index for the active task's sandbox.
+    With background, the scan runs on a worker thread (see asset_index.collect_background_refresh);
+    returns whether one was started.
+    """
+    task_path = os.environ.get("ST_CWD")
+    if not task_path:
+        return False
+    try:
+        if background:
+            return asset_index.refresh_in_background(asset_index.get_sandbox_dir(task_path))
+        asset_index.refresh(asset_index.get_sandbox_dir(task_path))
+    except Exception as e:
+        print(f"[Studio Tools] Warning: Failed to refresh published asset index: {e}")
+    return False
+
+def get_latest_blend_version(asset_dir):
+    """
+    Returns the name of the highest-numbered vNNN folder of an asset that holds a scene.blend, or None.
+    Versions are compared numerically (v1000 after v999) and listed through the mtime-keyed registry;
+    folders without a scene.blend (claimed but unfinished, or render-only) are skipped.
+    """
+    for _, name in reversed(versioning.list_versions(asset_dir, versioning.STRICT_VERSION_DIR_PATTERN)):
+        if os.path.exists(os.path.join(asset_dir, name, "scene.blend")):
+            return name
+    return None
+
+def list_blend_versions(asset_dir):
+    """Names of an asset's vNNN folders that hold a scene.blend, oldest first (see get_latest_blend_version)."""
+    return [name for _, name in versioning.list_versions(asset_dir, versioning.STRICT_VERSION_DIR_PATTERN)
+            if os.path.exists(os.path.join(asset_dir, name, "scene.blend"))]
+
 def resolve_blend_path(input_path):
+    """
+    Resolves a pasted path (a .blend, a version folder or an asset folder) to the scene.blend to link.
+    Returns (blend_path, version_dir), or (None, None) if nothing can be linked.
+    """
     input_path = input_path.strip()
     if not input_path:
         return None, None
@@ -70,22 +147,104 @@ def resolve_blend_path(input_path):
             return candidate, abs_path
             
         # 3. If it doesn't contain scene.blend directly, it might be the asset folder (which contains v001, v002...)
-        # Find the latest version folder (we resolve the path only to read its version directories on disk)
-        real_path = os.path.realpath(abs_path)
-        versions = sorted([
-            d for d in os.listdir(real_path)
-            if os.path.isdir(os.path.join(real_path, d)) and re.match(r"^v\d+$", d)
-        ])
-        if versions:
-            latest_ver_dir = os.path.join(real_path, versions[-1])
-            candidate = os.path.join(latest_ver_dir, "scene.blend")
-            if os.path.exists(candidate):
-                # Return the unresolved path with the latest version folder appended
-                unresolved_candidate = os.path.join(abs_path, versions[-1], "scene.blend")
-                return unresolved_candidate, os.path.join(abs_path, versions[-1])
+        # Find the latest version folder (listed through the given path; symlinks are followed by the listing)
+        latest = get_latest_blend_version(abs_path)
+        if latest:
+            # Return the unresolved path with the latest version folder appended
+            return os.path.join(abs_path, latest, "scene.blend"), os.path.join(abs_path, latest)
 
     return None, None
 
+def resolve_blend_paths(input_paths):
+    """
+    Resolves many pasted paths in one call, returning {input_path: (blend_path, version_dir)}.
+    Repeated inputs are resolved once and asset folders share the cached version listings.
+    """
+    resolved = {}
+    for input_path in input_paths:
+        if input_path not in resolved:
+            resolved[input_path] = resolve_blend_path(input_path)
+    return resolved
+
+def read_link_manifest(manifest_path):
+    """
+    Reads the asset paths of a link manifest (e.g. a layout breakdown): a JSON list of paths or an
+    {asset: path} object, or a text file with one path per line (# starts a comment).
+    Relative paths are resolved against the manifest's folder.
+    """
+    manifest_dir = os.path.dirname(os.path.abspath(manifest_path))
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        if manifest_path.lower().endswith(".json"):
+            entries = json.load(f)
+            if isinstance(entries, dict):
+                entries = list(entries.values())
+        else:
+            entries = [line.split("#", 1)[0] for line in f]
+    paths = []
+    for entry in entries:
+        entry = str(entry).strip()
+        if entry:
+            paths.append(entry if os.path.isabs(entry) else os.path.join(manifest_dir, entry))
+    return paths
+
+def read_version_manifest(manifest_path):
+    """
+    Reads a version manifest mapping asset names to targets: "latest", "published", a version
+    folder name (v003) or a path to a version folder or .blend. JSON, or YAML written like metadata.
+    """
+    if manifest_path.lower().endswith(".json"):
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    else:
+        manifest = read_simple_yaml(manifest_path)
+    manifest_dir = os.path.dirname(os.path.abspath(manifest_path))
+    resolved = {}
+    for asset_name, target in manifest.items():
+        target = str(target).strip()
+        # Paths in the manifest are relative to the manifest itself
+        if ("/" in target or os.sep in target) and not os.path.isabs(target):
+            target = os.path.join(manifest_dir, target)
+        resolved[str(asset_name)] = target
+    return resolved
+
+def get_linked_asset_dir(lib_path):
+    """Returns the versions/<asset> folder a linked scene.blend (version or published path) belongs to, or None."""
+    real_path = os.path.realpath(lib_path)
+    if "versions" not in real_path or not real_path.endswith("scene.blend"):
+        return None
+    return os.path.dirname(os.path.dirname(real_path))
+
+def resolve_linked_asset_target(lib_path, mode, manifest=None):
+    """
+    Resolves the scene.blend a directly linked library should point to.
+    mode: 'LATEST' (highest version with a scene.blend), 'PUBLISHED' (the task's published/<asset>
+    path) or 'MANIFEST' (the asset's entry in a version manifest). Returns None if there is no target.
+    """
+    asset_dir = get_linked_asset_dir(lib_path)
+    if asset_dir is None:
+        return None
+    asset_name = os.path.basename(asset_dir)
+    if mode == 'MANIFEST':
+        target = (manifest or {}).get(asset_name)
+        if not target:
+            return None
+        mode = target.upper() if target.lower() in ("latest", "published") else target
+    
+    if mode == 'LATEST':
+        latest = get_latest_blend_version(asset_dir)
+        return os.path.join(asset_dir, latest, "scene.blend") if latest else None
+    if mode == 'PUBLISHED':
+        task_path = os.path.dirname(os.path.dirname(asset_dir))
+        candidate = os.path.join(task_path, "published", asset_name, "scene.blend")
+        return candidate if os.path.exists(candidate) else None
+    
+    # A version folder name of the asset, or any path resolve_blend_path understands
+    candidate = os.path.join(asset_dir, mode, "scene.blend")
+    if os.path.exists(candidate):
+        return candidate
+    blend_path, _ = resolve_blend_path(mode)
+    return blend_path
+
 def update_default_asset_name(dummy1=None, dummy2=None):
     """Automatically updates the default asset name to match the blend file name on load/save."""
     if not IN_BLENDER:
@@ -120,10 +279,27 @@ def update_default_render_name(dummy1=None, dummy2=None):
     except Exception as e:
         print(f"[Studio Tools] Warning: Failed to update default render name: {e}")
 
-def get_render_version_and_paths(task_path, render_name, render_type, create_dirs=False):
+def get_latest_render_version(versions_dir, filename_pattern):
+    """
+    Returns the highest render version holding frames or a frame manifest, or 0 if there is none.
+    Folders only claimed so far (by a render starting in another session) are skipped.
+    """
+    import render_manifest
+    for version, name in reversed(versioning.list_versions(versions_dir)):
+        frame_prefix = filename_pattern.format(version=version).split("#")[0]
+        try:
+            with os.scandir(os.path.join(versions_dir, name)) as entries:
+                if any(e.name == render_manifest.MANIFEST_NAME or e.name.startswith(frame_prefix) for e in entries):
+                    return version
+        except OSError:
+            continue
+    return 0
+
+def get_render_version_and_paths(task_path, render_name, render_type, create_dirs=False, resume=False):
     """
     Computes version and directories/filenames for rendering.
     render_type: 'exr' or 'playblast'
+    resume: reuse the latest version that already has frames instead of computing the next one
     Returns: (version, version_dir, filename, filepath)
     """
     # Strip illegal characters
@@ -136,26 +312,363 @@ def get_render_version_and_paths(task_path, render_name, render_type, create_dir
         filename_pattern = f"{render_name}_v{{version:03d}}_####.exr"
 
     versions_dir = os.path.join(task_path, "versions", folder_name)
-    if create_dirs:
-        os.makedirs(versions_dir, exist_ok=True)
-
-    version = 1
-    if os.path.exists(versions_dir):
-        for f in os.listdir(versions_dir):
-            if os.path.isdir(os.path.join(versions_dir, f)):
-                match = re.match(r"^v(\d+)", f, re.IGNORECASE)
-                if match:
-                    version = max(version, int(match.group(1)) + 1)
 
-    version_dir = os.path.join(versions_dir, f"v{version:03d}")
-    if create_dirs:
-        os.makedirs(version_dir, exist_ok=True)
+    if resume:
+        version = get_latest_render_version(versions_dir, filename_pattern)
+        version_dir = os.path.join(versions_dir, f"v{version:03d}")
+        if create_dirs:
+            os.makedirs(version_dir, exist_ok=True)
+    elif create_dirs:
+        # Claim the version folder so concurrent renders never write into the same version
+        version, version_dir = versioning.claim_next_version(versions_dir)
+    else:
+        version = versioning.next_version(versions_dir)
+        version_dir = os.path.join(versions_dir, f"v{version:03d}")
 
     filename = filename_pattern.format(version=version)
     filepath = os.path.abspath(os.path.join(version_dir, filename))
 
     return version, version_dir, filename, filepath
 
+def get_frame_path(filepath, frame):
+    """Expands the #### frame placeholder of a render output path for the given frame."""
+    match = re.search(r"#+", filepath)
+    if not match:
+        return filepath
+    padding = len(match.group(0))
+    return filepath[:match.start()] + f"{frame:0{padding}d}" + filepath[match.end():]
+
+def get_usd_export_kwargs(export_animation, profile_name=publish_profiles.DEFAULT_PROFILE):
+    """Builds the USD exporter keyword arguments of a publish profile, limited to what this Blender supports."""
+    export_props = publish_profiles.get_exporter_properties()
+    kwargs = {k: v for k, v in publish_profiles.get_exporter_settings(profile_name).items() if k in export_props}
+    if "export_animation" in export_props:
+        kwargs["export_animation"] = export_animation
+    return kwargs
+
+@contextmanager
+def temporary_decimation(ratio, objects=None):
+    """
+    Adds a Decimate modifier to the given meshes (default: all of the scene) for the duration of an export.
+    Only allowed in headless workers: in an artist's session it would dirty the file, fire depsgraph
+    handlers and leave modifiers behind after a crash, so decimated publishes always run in the background.
+    """
+    if not ratio or ratio >= 1.0:
+        yield
+        return
+    if not bpy.app.background:
+        raise RuntimeError("Decimated exports must run in a headless worker (background publish)")
+    added = []
+    try:
+        for obj in (objects if objects is not None else bpy.context.scene.objects):
+            if obj.type == 'MESH' and obj.library is None:
+                mod = obj.modifiers.new(name="StudioTools_Decimate", type='DECIMATE')
+                mod.ratio = ratio
+                added.append((obj, mod))
+        yield
+    finally:
+        for obj, mod in added:
+            obj.modifiers.remove(mod)
+
+def export_usd_file(filepath, export_as_usdc, kwargs):
+    """
+    Exports the open scene to filepath (a .usd path).
+    Blender uses file extension to determine format (ascii .usda vs binary .usdc/.usd).
+    To ensure the file is always named .usd on disk, we export with Blender's preferred
+    extension first, then rename it to .usd if it was exported as .usda.
+    """
+    base_path = os.path.splitext(filepath)[0]
+    export_path = filepath if export_as_usdc else f"{base_path}.usda"
+    bpy.ops.wm.usd_export(filepath=export_path, **kwargs)
+
+    if not export_as_usdc:
+        if os.path.exists(export_path):
+            if os.path.exists(filepath):
+                os.remove(filepath)
+            os.rename(export_path, filepath)
+    return filepath
+
+def export_publish_usd(version_dir, export_as_usdc, export_animation, profile_name=publish_profiles.DEFAULT_PROFILE):
+    """Exports the open scene as the version's stage.usd and returns its path."""
+    final_pub_filepath = os.path.join(version_dir, "stage.usd")
+    with temporary_decimation(publish_profiles.get_profile(profile_name).get("decimate_ratio")):
+        return export_usd_file(final_pub_filepath, export_as_usdc, get_usd_export_kwargs(export_animation, profile_name))
+
+def get_previous_version_dir(asset_versions_dir, version):
+    """Returns the folder of the highest version of an asset below the given one, or None."""
+    previous = [name for num, name in versioning.list_versions(asset_versions_dir) if num < version]
+    return os.path.join(asset_versions_dir, previous[-1]) if previous else None
+
+def _read_layer_manifest(version_dir):
+    if not version_dir:
+        return {}
+    try:
+        with open(os.path.join(version_dir, LAYERS_DIR_NAME, LAYER_MANIFEST_NAME), "r", encoding="utf-8") as f:
+            return json.load(f).get("layers", {})
+    except (OSError, ValueError):
+        return {}
+
+def _reuse_layer(src, dst):
+    """Shares an unchanged layer file of a previous version. Returns False if it is missing."""
+    if not os.path.isfile(src):
+        return False
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+        return True
+    # The versions now share one file: like blobs, it must never be edited in place
+    blobstore.freeze(dst)
+    return True
+
+def _layer_file_name(name, used_names):
+    file_stem = re.sub(r"[^a-zA-Z0-9_.-]", "_", name) or "object"
+    file_name = f"{file_stem}.usd"
+    index = 1
+    while file_name in used_names:
+        file_name = f"{file_stem}_{index}.usd"
+        index += 1
+    used_names.add(file_name)
+    return file_name
+
+# Layer metadata a composition copies from its first layer, so the stage reads the same as a single-file export
+STAGE_METADATA_KEYS = ("defaultPrim", "upAxis", "metersPerUnit", "startTimeCode", "endTimeCode", "timeCodesPerSecond", "framesPerSecond")
+
+def _read_usda_metadata(path):
+    """Reads the stage metadata from the header of a USDA text layer. Returns {} for binary layers."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            header = f.read(8192)
+    except (OSError, UnicodeDecodeError):
+        return {}
+    if not header.startswith("#usda"):
+        return {}
+    metadata = {}
+    for key in STAGE_METADATA_KEYS:
+        match = re.search(rf'^\s*{key}\s*=\s*("?)([^"\n]*)\1\s*$', header, re.MULTILINE)
+        if match:
+            metadata[key] = match.group(2) if match.group(1) else float(match.group(2))
+    return metadata
+
+def get_stage_metadata(scene, kwargs):
+    """Stage metadata a USD export of the scene with these exporter settings writes, for layers that cannot be read back."""
+    up = kwargs.get("export_global_up_selection", "Z") if kwargs.get("convert_orientation") else "Z"
+    metadata = {
+        "upAxis": "Y" if up.endswith("Y") else "Z",
+        "metersPerUnit": scene.unit_settings.scale_length,
+    }
+    root_prim = kwargs.get("root_prim_path", "").strip("/")
+    if root_prim:
+        metadata["defaultPrim"] = root_prim.split("/")[0]
+    return metadata
+
+def write_layer_stack(stage_path, layer_paths, export_as_usdc, fallback_metadata=None):
+    """
+    Writes stage_path as a thin layer that only sublayers the given layer files. Stage metadata
+    (default prim, up axis, units, time codes) is copied from the first layer, or taken from
+    fallback_metadata when that layer cannot be read without the USD Python API.
+    """
+    stage_dir = os.path.dirname(stage_path)
+    rel_paths = ["./" + os.path.relpath(p, stage_dir).replace(os.sep, "/") for p in layer_paths]
+    try:
+        from pxr import Sdf
+    except ImportError:
+        Sdf = None
+
+    if Sdf is not None:
+        if os.path.exists(stage_path):
+            os.remove(stage_path)
+        layer = Sdf.Layer.CreateNew(stage_path, args={"format": "usdc" if export_as_usdc else "usda"})
+        source = Sdf.Layer.FindOrOpen(layer_paths[0]) if layer_paths else None
+        if source is not None:
+            for key in STAGE_METADATA_KEYS[1:]:
+                if source.pseudoRoot.HasInfo(key):
+                    layer.pseudoRoot.SetInfo(key, source.pseudoRoot.GetInfo(key))
+            if source.defaultPrim:
+                layer.defaultPrim = source.defaultPrim
+        elif fallback_metadata and fallback_metadata.get("defaultPrim"):
+            layer.defaultPrim = fallback_metadata["defaultPrim"]
+        layer.subLayerPaths = rel_paths
+        layer.Save()
+        return stage_path
+
+    # Without pxr, write the composition as USDA text (the .usd extension accepts either encoding)
+    metadata = dict(fallback_metadata or {})
+    if layer_paths:
+        metadata.update(_read_usda_metadata(layer_paths[0]))
+    with open(stage_path, "w", encoding="utf-8") as f:
+        f.write("#usda 1.0\n(\n")
+        for key in STAGE_METADATA_KEYS:
+            if key in metadata:
+                value = metadata[key]
+                f.write(f'    {key} = "{value}"\n' if isinstance(value, str) else f"    {key} = {value:g}\n")
+        f.write("    subLayers = [\n")
+        f.write(",\n".join(f"        @{p}@" for p in rel_paths))
+        f.write("\n    ]\n)\n")
+    return stage_path
+
+def export_publish_usd_incremental(version_dir, previous_version_dir, export_as_usdc, export_animation, profile_name=publish_profiles.DEFAULT_PROFILE):
+    """
+    Exports each root object (with its children) of the open scene into layers/<name>.usd and writes
+    stage.usd as their composition. Roots whose fingerprint matches the previous version's layer
+    manifest reuse that version's layer file instead of being exported again. Returns the stage.usd path.
+    """
+    import fingerprint
+    kwargs = get_usd_export_kwargs(export_animation, profile_name)
+    if "selected_objects_only" not in publish_profiles.get_exporter_properties():
+        print("[Studio Tools] Warning: USD exporter cannot export single objects, falling back to a full export.")
+        return export_publish_usd(version_dir, export_as_usdc, export_animation, profile_name)
+    kwargs["selected_objects_only"] = True
+    decimate_ratio = publish_profiles.get_profile(profile_name).get("decimate_ratio")
+    export_settings = dict(kwargs, export_as_usdc=export_as_usdc, decimate_ratio=decimate_ratio)
+
+    scene = bpy.context.scene
+    view_layer = bpy.context.view_layer
+    layers_dir = os.path.join(version_dir, LAYERS_DIR_NAME)
+    os.makedirs(layers_dir, exist_ok=True)
+    previous = _read_layer_manifest(previous_version_dir)
+    previous_layers_dir = os.path.join(previous_version_dir, LAYERS_DIR_NAME) if previous_version_dir else ""
+
+    manifest = {}
+    layer_paths = []
+    used_names = set()
+    exported = 0
+    # Only objects of the active view layer can be selected (and are exported); objects in excluded
+    # collections or other view layers would make select_set() raise
+    layer_objects = set(view_layer.objects)
+    selection = [obj for obj in layer_objects if obj.select_get()]
+    active = view_layer.objects.active
+    for obj in selection:
+        obj.select_set(False)
+    try:
+        roots = (obj for obj in layer_objects if obj.parent not in layer_objects)
+        for root in sorted(roots, key=lambda o: o.name):
+            root_fingerprint = fingerprint.hierarchy_fingerprint(scene, root, export_settings)
+            layer_path = os.path.join(layers_dir, _layer_file_name(root.name, used_names))
+            prev = previous.get(root.name)
+            reused = prev is not None and prev.get("fingerprint") == root_fingerprint and \
+                _reuse_layer(os.path.join(previous_layers_dir, prev.get("file", "")), layer_path)
+            if not reused:
+                hierarchy = [root] + [obj for obj in root.children_recursive if obj in layer_objects]
+                for obj in hierarchy:
+                    obj.select_set(True)
+                view_layer.objects.active = root
+                try:
+                    with temporary_decimation(decimate_ratio, hierarchy):
+                        export_usd_file(layer_path, export_as_usdc, kwargs)
+                finally:
+                    for obj in hierarchy:
+                        obj.select_set(False)
+                exported += 1
+            manifest[root.name] = {"file": os.path.basename(layer_path), "fingerprint": root_fingerprint}
+            layer_paths.append(layer_path)
+    finally:
+        for obj in selection:
+            obj.select_set(True)
+        view_layer.objects.active = active
+
+    with open(os.path.join(layers_dir, LAYER_MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump({"layers": manifest}, f, indent=2)
+    print(f"[Studio Tools] Incremental publish: exported {exported} of {len(layer_paths)} object layers, reused {len(layer_paths) - exported}")
+    return write_layer_stack(os.path.join(version_dir, "stage.usd"), layer_paths, export_as_usdc, get_stage_metadata(scene, kwargs))
+
+def write_published_blend(blend_path):
+    """
+    Writes the open scene into a published scene.blend in a single pass, with absolute library and
+    asset paths so links stay valid from the version folder and through the published symlink.
+    The session's own file and path settings are left untouched.
+    """
+    datablocks = set()
+    for collection in (bpy.data.scenes, bpy.data.collections, bpy.data.objects, bpy.data.materials,
+                       bpy.data.node_groups, bpy.data.worlds, bpy.data.actions, bpy.data.images):
+        datablocks.update(item for item in collection if item.library is None)
+    bpy.data.libraries.write(
+        blend_path,
+        datablocks,
+        path_remap='ABSOLUTE',
+        compress=bpy.context.preferences.filepaths.use_file_compression,
+    )
+
+def get_publish_metadata(source_blend, exported_objs, fingerprint=None, profile_name=None):
+    """Builds the metadata.yaml contents of a USD publish."""
+    metadata = {
+        "type": "usd_publish",
+        "application": "blender",
+        "application_version": os.environ.get("ST_APP_VERSION") or bpy.app.version_string,
+        "source_scene": source_blend if source_blend else "",
+        "source_file": os.path.basename(source_blend) if source_blend else "unsaved.blend",
+        "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "user": os.environ.get("USER", "artist"),
+        "exported_root_objects": exported_objs
+    }
+    if fingerprint:
+        metadata["fingerprint"] = fingerprint
+    if profile_name:
+        metadata["publish_profile"] = profile_name
+    metadata.update(get_link_catalog(bpy.context.scene))
+    return metadata
+
+def get_link_catalog(scene):
+    """
+    Lists the top-level collections and objects of the scene that end up as local data blocks in the
+    published scene.blend, so linking a version can request exactly those without inspecting the file.
+    """
+    return {
+        "catalog_collections": [col.name for col in scene.collection.children if col.library is None],
+        "catalog_objects": [obj.name for obj in scene.collection.objects if obj.library is None],
+    }
+
+def read_link_catalog(blend_path):
+    """Returns the (collections, objects) link catalog recorded next to a published scene.blend, or None."""
+    metadata = read_simple_yaml(os.path.join(os.path.dirname(blend_path), "metadata.yaml"))
+    if "catalog_collections" not in metadata:
+        return None
+    return list(metadata.get("catalog_collections") or []), list(metadata.get("catalog_objects") or [])
+
+def get_publish_fingerprint(scene, export_as_usdc, export_animation, profile_name=publish_profiles.DEFAULT_PROFILE):
+    """Fingerprints the scene content and export settings a USD publish would write."""
+    import fingerprint
+    decimate_ratio = publish_profiles.get_profile(profile_name).get("decimate_ratio")
+    export_settings = dict(get_usd_export_kwargs(export_animation, profile_name), export_as_usdc=export_as_usdc, decimate_ratio=decimate_ratio)
+    return fingerprint.scene_fingerprint(scene, export_settings)
+
+def find_unchanged_publish(asset_versions_dir, scene_fingerprint):
+    """Returns (version, folder name) of an asset's latest version if it was published from identical content, else None."""
+    versions = versioning.list_versions(asset_versions_dir)
+    if not versions or not scene_fingerprint:
+        return None
+    latest, latest_name = versions[-1]
+    latest_dir = os.path.join(asset_versions_dir, latest_name)
+    # A version only counts once its export and metadata landed (a background publish may still be running)
+    if not os.path.exists(os.path.join(latest_dir, "stage.usd")):
+        return None
+    metadata = read_simple_yaml(os.path.join(latest_dir, "metadata.yaml"))
+    if metadata.get("fingerprint") == scene_fingerprint:
+        return latest, latest_name
+    return None
+
+def mark_version_published(task_path, asset_prefix, version_folder):
+    """Points published/<asset> at the given version folder (relative to the versions directory)."""
+    published_dir = os.path.join(task_path, "published")
+    os.makedirs(published_dir, exist_ok=True)
+    symlink_path = os.path.join(published_dir, asset_prefix)
+    
+    if os.path.islink(symlink_path) or os.path.exists(symlink_path):
+        if os.path.isdir(symlink_path) and not os.path.islink(symlink_path):
+            shutil.rmtree(symlink_path)
+        else:
+            os.remove(symlink_path)
+            
+    src = os.path.join("..", "versions", version_folder)
+    try:
+        os.symlink(src, symlink_path)
+        print(f"[Studio Tools] Created published symlink: {symlink_path} -> {src}")
+    except Exception as se:
+        print(f"[Studio Tools] Warning: Failed to create symlink: {se}")
+    # Pick up the new published entry in the Load USD asset list. In a session the scan runs on a worker
+    # thread (collected by handlers.refresh_published_index_timer); a headless worker has no timer to collect it.
+    refresh_published_assets(background=IN_BLENDER and not bpy.app.background)
+
 def setup_render_settings(scene, render_type, filepath):
     """
     Configures Blender's scene.render settings based on render_type ('exr' or 'playblast')
@@ -0,0 +1,140 @@
+import os
+import re
+import time
+import shutil
+import secrets
+
+# Version folders: v001, v002... (anything starting with vNNN counts, as publish and render always did)
+VERSION_DIR_PATTERN = re.compile(r"^v(\d+)", re.IGNORECASE)
+# Strict version folders (exactly vNNN), as linked-asset resolution expects
+STRICT_VERSION_DIR_PATTERN = re.compile(r"^v(\d+)$")
+# WIP workfiles: scene_v001.blend...
+WIP_SCENE_PATTERN = re.compile(r"scene_v(\d+)\.blend", re.IGNORECASE)
+
+# Directories modified this recently may still change within the filesystem's mtime
+# granularity (whole seconds on some network shares), so their listing is never trusted.
+MTIME_SETTLE_SECONDS = 2.0
+# Version numbers tried past the listed latest before a claim gives up
+MAX_CLAIM_ATTEMPTS = 100
+
+# (directory, pattern, dirs_only) -> (mtime_ns, [(number, name), ...])
+_cache = {}
+
+
+def _scan(directory, pattern, dirs_only):
+    versions = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            # Patterns are applied with search() so unanchored patterns match anywhere in the name
+            match = pattern.search(entry.name)
+            if not match:
+                continue
+            if dirs_only and not entry.is_dir():
+                continue
+            versions.append((int(match.group(1)), entry.name))
+    # Sort numerically so v1000 comes after v999
+    versions.sort()
+    return versions
+
+
+def list_versions(directory, pattern=VERSION_DIR_PATTERN, dirs_only=True):
+    """
+    Returns [(number, entry_name), ...] of the versions inside a directory, sorted numerically.
+    Results are cached per directory and reused for as long as its mtime is unchanged.
+    """
+    try:
+        mtime_ns = os.stat(directory).st_mtime_ns
+    except OSError:
+        return []
+
+    key = (directory, pattern.pattern, dirs_only)
+    cached = _cache.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    try:
+        versions = _scan(directory, pattern, dirs_only)
+    except OSError:
+        return []
+    if time.time() - mtime_ns / 1e9 > MTIME_SETTLE_SECONDS:
+        _cache[key] = (mtime_ns, versions)
+    else:
+        _cache.pop(key, None)
+    return versions
+
+
+def latest_version(directory, pattern=VERSION_DIR_PATTERN, dirs_only=True):
+    """Returns the highest version number in a directory, or 0 if it holds no versions."""
+    versions = list_versions(directory, pattern, dirs_only)
+    return versions[-1][0] if versions else 0
+
+
+def next_version(directory, pattern=VERSION_DIR_PATTERN, dirs_only=True):
+    """Returns the version number following the highest one in a directory (1 if empty)."""
+    return latest_version(directory, pattern, dirs_only) + 1
+
+
+def invalidate(directory=None):
+    """Forgets cached listings of a directory, or of every directory if none is given."""
+    if directory is None:
+        _cache.clear()
+        return
+    for key in [k for k in _cache if k[0] == directory]:
+        del _cache[key]
+
+
+def claim_next_version(directory, pattern=VERSION_DIR_PATTERN, name_format="v{:03d}"):
+    """
+    Reserves the next version folder of a directory. The folder is created with an exclusive mkdir,
+    so concurrent publishers and renderers never get the same number. Returns (version, version_dir).
+    """
+    os.makedirs(directory, exist_ok=True)
+    version = next_version(directory, pattern)
+    for _ in range(MAX_CLAIM_ATTEMPTS):
+        version_dir = os.path.join(directory, name_format.format(version))
+        try:
+            os.mkdir(version_dir)
+        except FileExistsError:
+            # Claimed by someone else since the listing (or the listing was stale); try the next number
+            version += 1
+            continue
+        invalidate(directory)
+        return version, version_dir
+    raise RuntimeError(f"Could not claim a version folder in {directory} after {MAX_CLAIM_ATTEMPTS} attempts")
+
+
+def create_staging_dir(version_dir):
+    """
+    Creates a private, uniquely named sibling of a claimed version folder. Writing a version there and
+    promoting it once complete means readers never see a partially written version.
+    """
+    parent, name = os.path.split(version_dir)
+    while True:
+        staging_dir = os.path.join(parent, f".{name}.staging-{secrets.token_hex(4)}")
+        try:
+            os.mkdir(staging_dir)
+            return staging_dir
+        except FileExistsError:
+            continue
+
+
+def promote_staging_dir(staging_dir, version_dir):
+    """Moves a completed staging folder onto its (empty) claimed version folder."""
+    try:
+        # On POSIX, rename atomically replaces an empty directory
+        os.rename(staging_dir, version_dir)
+    except OSError:
+        os.rmdir(version_dir)
+        os.rename(staging_dir, version_dir)
+    invalidate(os.path.dirname(version_dir))
+
+
+def abandon_claim(version_dir, staging_dir=None):
+    """Releases a claimed version folder (if still empty) and deletes its staging folder after a failure."""
+    if staging_dir:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+    try:
+        os.rmdir(version_dir)
+    except OSError:
+        pass
+    invalidate(os.path.dirname(version_dir))